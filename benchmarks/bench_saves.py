@@ -0,0 +1,96 @@
+"""Save/load timings for each save encoding at growing history sizes.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_saves [sizes...]
+
+Writes into a temporary directory, never into saves/.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from engine.core import save_manager
+from engine.core.config import config
+from engine.core.save_index import SlotIndex
+from engine.core.save_manager import SaveManager
+from engine.core.state_manager import GameState
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+
+def build_state(events: int) -> GameState:
+    state = GameState()
+    now = time.time()
+    history = state.history
+    for i in range(events):
+        if i % 10 == 9:
+            history.append({"type": "fragment", "fragment_id": f"shard_{i:07d}", "timestamp": now + i})
+        else:
+            kind = "stability" if i % 2 else "corruption"
+            history.append({"type": kind, "delta": 1, "old": i % 10, "new": (i + 1) % 10, "timestamp": now + i})
+    state.identity_fragments = [f"shard_{i:03d}" for i in range(12)]
+    return state
+
+
+def save_legacy(state: GameState, slot: int) -> None:
+    """The 1.1.0 writer, kept here as the baseline."""
+    snapshot = state.snapshot()
+    snapshot["history"] = list(snapshot["history"])
+    save_data = {
+        "version": save_manager.LEGACY_SAVE_VERSION,
+        "timestamp": time.time(),
+        "scene_id": "node0x2_ava_intro",
+        "state": snapshot,
+        "checksum": hash(str(snapshot)),
+    }
+    with open(save_manager.legacy_slot_path(slot), "w") as f:
+        json.dump(save_data, f, indent=2)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def run(sizes) -> None:
+    original = config.data
+    with tempfile.TemporaryDirectory() as tmp:
+        save_manager.SAVES_DIR = tmp
+        save_manager.slot_index = SlotIndex(tmp)
+
+        variants = [
+            ("1.1.0 json", None, None),
+            ("json", "json", False),
+            ("binary", "binary", False),
+            ("binary+zlib", "binary", True),
+        ]
+        print(f"{'events':>9} {'encoding':<12} {'save s':>8} {'load s':>8} {'load+hist s':>11} {'size KiB':>10}")
+        for events in sizes:
+            state = build_state(events)
+            for slot, (label, fmt, compress) in enumerate(variants, 1):
+                if fmt is None:
+                    save_t, _ = timed(save_legacy, state, slot)
+                    path = save_manager.legacy_slot_path(slot)
+                else:
+                    config.set("saves", "format", fmt, save=False)
+                    config.set("saves", "compress", compress, save=False)
+                    save_t, _ = timed(SaveManager.save_game, state, "node0x2_ava_intro", slot)
+                    path = save_manager.slot_path(slot)
+
+                load_t, data = timed(SaveManager.load_game, slot)
+                restored = GameState.from_snapshot(data["state"])
+                hist_t, _ = timed(list, restored.history)
+                size_kib = os.path.getsize(path) / 1024
+                print(f"{events:>9} {label:<12} {save_t:>8.3f} {load_t:>8.3f} {load_t + hist_t:>11.3f} {size_kib:>10.1f}")
+                SaveManager.delete_save(slot)
+
+    config.replace(original)
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
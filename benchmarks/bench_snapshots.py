@@ -0,0 +1,87 @@
+"""GameState.snapshot() against the old dataclasses.asdict deep copy.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_snapshots [sizes...]
+
+Times a snapshot straight after a mutation (the autosave pattern), and the
+full save path built on it, at growing history sizes. The baseline is asdict
+on a LegacyState holding the same events as a list of dicts, which is what
+snapshot() used to copy.
+"""
+
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List
+
+from engine.core.save_manager import SaveManager
+from benchmarks.bench_saves import build_state, timed
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+ROUNDS = 20
+
+
+@dataclass
+class LegacyState:
+    """GameState as it was before the event store: history a list of dicts."""
+
+    identity_fragments: List[str] = field(default_factory=list)
+    corruption_level: int = 0
+    stability: int = 3
+    npc_relationships: Dict[str, int] = field(default_factory=dict)
+    current_node_id: str = "intro"
+    history: List[Dict] = field(default_factory=list)
+    puzzles_solved: int = 0
+    puzzles_failed: int = 0
+    nodes_visited: int = 0
+    playtime_seconds: float = 0.0
+
+    def apply_stability(self, delta: int) -> None:
+        old = self.stability
+        self.stability = max(0, min(10, self.stability + delta))
+        self.history.append({"type": "stability", "delta": delta, "old": old, "new": self.stability, "timestamp": time.time()})
+
+
+def build_legacy_state(state) -> LegacyState:
+    """The same events as state, in the old list-of-dicts shape."""
+    return LegacyState(
+        identity_fragments=list(state.identity_fragments),
+        history=[dict(event) for event in state.history],
+    )
+
+
+def per_round(fn, state) -> float:
+    """Mean seconds for fn(state), each call preceded by one history append."""
+    total = 0.0
+    for _ in range(ROUNDS):
+        state.apply_stability(1)
+        elapsed, _ = timed(fn, state)
+        total += elapsed
+    return total / ROUNDS
+
+
+def asdict_snapshot(state):
+    return asdict(state)
+
+
+def live_snapshot(state):
+    return state.snapshot()
+
+
+def encode_snapshot(state):
+    return SaveManager.encode_state(state.snapshot(), encoding="binary")
+
+
+def run(sizes) -> None:
+    print(f"{'events':>9} {'asdict ms':>10} {'snapshot ms':>12} {'speedup':>8} {'binary save ms':>15}")
+    for events in sizes:
+        state = build_state(events)
+        old = per_round(asdict_snapshot, build_legacy_state(state))
+        new = per_round(live_snapshot, state)
+        save = per_round(encode_snapshot, state)
+        print(f"{events:>9} {old * 1000:>10.2f} {new * 1000:>12.3f} {old / new:>7.0f}x {save * 1000:>15.2f}")
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
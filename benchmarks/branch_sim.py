@@ -0,0 +1,151 @@
+"""Parallel branch simulator: ending distributions over every path.
+
+Run from the repo root:
+
+    python -m benchmarks.branch_sim [--workers N] [--start SCENE_ID] [--seed N]
+
+Shards the playthrough bot's branch tree across a multiprocessing pool.
+Every task is one decision prefix; a worker plays it (option 0 after the
+prefix) and sends back the path result plus the sibling prefixes that
+branch off it below the prefix, which go straight back into the pool. Each
+path is therefore played exactly once, by whichever worker is free, and
+results stream in as they finish.
+
+Prints the distribution of endings, stability, corruption and fragment
+counts, then for every decision point how each option splits across
+endings.
+"""
+
+import argparse
+import multiprocessing
+import queue
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from typing import Dict, List, Tuple
+
+from benchmarks.playthrough import SEED, START_SCENE, PathResult, headless_session, play_path
+
+_session = ExitStack()
+
+
+def _init_worker() -> None:
+    # One headless session per worker process, open for its lifetime
+    _session.enter_context(headless_session())
+
+
+def _run(task: Tuple[Tuple[int, ...], str, int]) -> Tuple[PathResult, List[Tuple[int, ...]]]:
+    prefix, start, seed = task
+    result = play_path(prefix, start, seed)
+    siblings = [
+        result.decisions[:i] + (choice,)
+        for i in range(len(prefix), len(result.decisions))
+        for choice in range(1, result.arities[i])
+    ]
+    return result, siblings
+
+
+class Distribution:
+    def __init__(self):
+        self.paths = 0
+        self.failed = 0
+        self.endings = Counter()
+        self.stability = Counter()
+        self.corruption = Counter()
+        self.fragments = Counter()
+        # decision label -> option -> Counter(ending)
+        self.by_choice: Dict[str, Dict[int, Counter]] = defaultdict(lambda: defaultdict(Counter))
+
+    def add(self, result: PathResult) -> None:
+        self.paths += 1
+        if not result.complete:
+            self.failed += 1
+            return
+        state = result.state
+        self.endings[result.ending] += 1
+        self.stability[state["stability"]] += 1
+        self.corruption[state["corruption_level"]] += 1
+        self.fragments[len(state["identity_fragments"])] += 1
+        for label, choice in zip(result.labels, result.decisions):
+            self.by_choice[label][choice][result.ending] += 1
+
+    def report(self) -> str:
+        def hist(counter: Counter) -> str:
+            return "  ".join(f"{k}:{v}" for k, v in sorted(counter.items()))
+
+        lines = [
+            f"endings     {hist(self.endings)}",
+            f"stability   {hist(self.stability)}",
+            f"corruption  {hist(self.corruption)}",
+            f"fragments   {hist(self.fragments)}",
+            "",
+        ]
+        for label in sorted(self.by_choice):
+            lines.append(label)
+            for choice, endings in sorted(self.by_choice[label].items()):
+                total = sum(endings.values())
+                split = "  ".join(f"{e} {n / total:.0%}" for e, n in endings.most_common())
+                lines.append(f"  option {choice}: {total:>4} paths  {split}")
+        return "\n".join(lines)
+
+
+def simulate(workers: int, start: str = START_SCENE, on_result=None, seed: int = SEED) -> Distribution:
+    dist = Distribution()
+    if workers <= 1:
+        _init_worker()
+        pending = [()]
+        while pending:
+            result, siblings = _run((pending.pop(), start, seed))
+            dist.add(result)
+            if on_result:
+                on_result(result)
+            pending.extend(siblings)
+        _session.close()
+        return dist
+
+    with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+        finished = queue.SimpleQueue()  # filled by the pool's result thread
+        outstanding = 0
+
+        def submit(prefix):
+            nonlocal outstanding
+            outstanding += 1
+            pool.apply_async(_run, ((prefix, start, seed),), callback=finished.put, error_callback=finished.put)
+
+        submit(())
+        while outstanding:
+            item = finished.get()
+            outstanding -= 1
+            if isinstance(item, BaseException):
+                raise item
+            result, siblings = item
+            dist.add(result)
+            if on_result:
+                on_result(result)
+            for prefix in siblings:
+                submit(prefix)
+    return dist
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--start", default=START_SCENE)
+    parser.add_argument("--seed", type=int, default=SEED)
+    args = parser.parse_args(argv)
+
+    began = time.perf_counter()
+    dist = simulate(args.workers, args.start, seed=args.seed)
+    elapsed = time.perf_counter() - began
+
+    print(dist.report())
+    print(
+        f"\n{dist.paths} paths on {args.workers} worker(s) in {elapsed:.2f}s"
+        f" ({dist.paths / elapsed:.1f} paths/s), {dist.failed} failed"
+    )
+    return 1 if dist.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
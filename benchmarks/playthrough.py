@@ -0,0 +1,234 @@
+"""Headless playthrough bot: plays the story through every branch.
+
+Run from the repo root:
+
+    python -m benchmarks.playthrough [--start SCENE_ID] [--json OUT] [--seed N]
+
+Each path runs the real scenes against a HeadlessScreen on the instant
+clock, from the start scene until the story loops back or quits. Every
+ChoiceMenu option and both TimedPuzzle outcomes (solved / timed out) are
+taken in turn, depth first, until all combinations have been played. For
+each path it records the decisions, the scenes reached, the final state
+and get_ending(), then prints throughput in paths/second. Every path
+reseeds the RNG streams from --seed, so runs are repeatable.
+
+Exits non-zero if any path raised or stopped short of END_SCENE.
+"""
+
+import argparse
+import curses
+import json
+import logging
+import sys
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from engine.core.clock import INSTANT, clock
+from engine.core.config import config
+from engine.core.logger import game_logger
+from engine.core.rng import rng
+from engine.core.state_manager import GameState
+from engine.ui.elements import ChoiceMenu, TimedPuzzle
+from engine.ui.headless import ENTER, HeadlessScreen, default_keys, headless_curses
+from scenes.registry import get_scene
+
+START_SCENE = "scene1_identity_sequence"
+END_SCENE = "node0x9_ending"
+MAX_SCENES = 32
+SEED = 0
+
+SOLVED, TIMED_OUT = 0, 1
+
+
+@dataclass
+class PathResult:
+    decisions: Tuple[int, ...]
+    arities: Tuple[int, ...]
+    labels: Tuple[str, ...] = ()
+    scenes: List[str] = field(default_factory=list)
+    state: Dict = field(default_factory=dict)
+    ending: str = ""
+    error: Optional[str] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.error is None and bool(self.scenes) and self.scenes[-1] == END_SCENE
+
+
+class Autopilot:
+    """
+    Input source that plays a fixed list of decisions, then option 0 at
+    every later decision point, and records each point's arity.
+    """
+
+    def __init__(self, decisions=()):
+        self.forced = tuple(decisions)
+        self.taken: List[int] = []
+        self.arities: List[int] = []
+        self.labels: List[str] = []
+        self.scene_id = ""
+        self._plan = deque()
+
+    def decide(self, arity: int, kind: str) -> int:
+        index = len(self.taken)
+        choice = self.forced[index] if index < len(self.forced) else 0
+        self.taken.append(choice)
+        self.arities.append(arity)
+        # e.g. "node0x2_ava_intro/choice1": the second choice in that scene
+        seen = sum(label.startswith(f"{self.scene_id}/{kind}") for label in self.labels)
+        self.labels.append(f"{self.scene_id}/{kind}{seen}")
+        return choice
+
+    def keys(self, screen: HeadlessScreen) -> int:
+        if self._plan:
+            return self._plan.popleft()
+        return default_keys(screen)
+
+    @contextmanager
+    def installed(self):
+        """Route ChoiceMenu and TimedPuzzle decisions through this pilot."""
+        menu_display = ChoiceMenu.display
+        puzzle_display = TimedPuzzle.display
+        pilot = self
+
+        def choose(menu, stdscr, duration=None, getch_func=None):
+            index = pilot.decide(len(menu.choices), "choice")
+            pilot._plan.extend([curses.KEY_DOWN] * index + [ENTER])
+            return menu_display(menu, stdscr, duration=duration, getch_func=getch_func)
+
+        def solve(puzzle, stdscr, getch_func=None):
+            outcome = pilot.decide(2, "puzzle")
+            pilot._plan.append(ENTER)
+            if outcome == SOLVED:
+                pilot._plan.extend(ord(ch) for ch in puzzle.target_word)
+            return puzzle_display(puzzle, stdscr, getch_func=getch_func)
+
+        ChoiceMenu.display = choose
+        TimedPuzzle.display = solve
+        try:
+            yield self
+        finally:
+            ChoiceMenu.display = menu_display
+            TimedPuzzle.display = puzzle_display
+
+
+@contextmanager
+def headless_session():
+    """Instant clock, no audio, no curses terminal, quiet save warnings."""
+    mode, scale = clock.mode, clock.scale
+    seed = rng.seed
+    settings = config.data
+    level = game_logger.level
+    clock.set_mode(INSTANT)
+    config.set("audio", "enable_music", False, save=False)
+    config.set("audio", "enable_sounds", False, save=False)
+    game_logger.setLevel(logging.ERROR)
+    try:
+        with headless_curses():
+            yield
+    finally:
+        clock.set_mode(mode, scale)
+        rng.reseed(seed)
+        config.replace(settings)
+        game_logger.setLevel(level)
+
+
+def play_path(decisions=(), start: str = START_SCENE, seed: int = SEED) -> PathResult:
+    """Play one path from start; must run inside headless_session()."""
+    # Every path starts from the same seed and game time, so a path plays out
+    # the same whichever order (or worker process) it runs in
+    rng.reseed(seed)
+    clock.reset()
+    pilot = Autopilot(decisions)
+    screen = HeadlessScreen(keys=pilot.keys)
+    game_state = GameState()
+    scenes: List[str] = []
+    error = None
+
+    with pilot.installed():
+        scene_id = start
+        try:
+            while scene_id and scene_id != -999 and len(scenes) < MAX_SCENES:
+                scenes.append(scene_id)
+                pilot.scene_id = scene_id
+                game_state.enter_node(scene_id)
+                scene_id = get_scene(scene_id).run(screen, game_state)
+                if scene_id in scenes:
+                    break  # the story loops back to its start
+        except Exception:
+            error = traceback.format_exc(limit=4)
+
+    state = game_state.snapshot()
+    state["history"] = len(state["history"])
+    return PathResult(
+        decisions=tuple(pilot.taken),
+        arities=tuple(pilot.arities),
+        labels=tuple(pilot.labels),
+        scenes=scenes,
+        state=state,
+        ending=game_state.get_ending(),
+        error=error,
+    )
+
+
+def next_decisions(result: PathResult) -> Optional[Tuple[int, ...]]:
+    """The next path depth first after result, or None when all are done."""
+    taken, arities = result.decisions, result.arities
+    for i in reversed(range(len(taken))):
+        if taken[i] + 1 < arities[i]:
+            return taken[:i] + (taken[i] + 1,)
+    return None
+
+
+def explore(start: str = START_SCENE, seed: int = SEED) -> Iterator[PathResult]:
+    decisions = ()
+    with headless_session():
+        while decisions is not None:
+            result = play_path(decisions, start, seed)
+            yield result
+            decisions = next_decisions(result)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--start", default=START_SCENE)
+    parser.add_argument("--json", help="write every path result to this file")
+    parser.add_argument("--seed", type=int, default=SEED)
+    args = parser.parse_args(argv)
+
+    results = []
+    began = time.perf_counter()
+    for result in explore(args.start, args.seed):
+        results.append(result)
+        s = result.state
+        status = "ok" if result.complete else ("ERROR" if result.error else "short")
+        print(
+            f"{status:>5} {''.join(map(str, result.decisions)):<8} {len(result.scenes):>2} scenes"
+            f"  stability {s['stability']:>2}  corruption {s['corruption_level']:>2}"
+            f"  fragments {len(s['identity_fragments'])}  ending {result.ending}"
+        )
+        if result.error:
+            print(result.error, file=sys.stderr)
+    elapsed = time.perf_counter() - began
+
+    endings = {}
+    for result in results:
+        endings[result.ending] = endings.get(result.ending, 0) + 1
+    failed = sum(not r.complete for r in results)
+    print(
+        f"\n{len(results)} paths in {elapsed:.2f}s ({len(results) / elapsed:.1f} paths/s),"
+        f" {failed} failed; endings {endings}"
+    )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,11 @@
 from .config import config
+from .clock import clock
+from .rng import rng
 from .state_manager import GameState
 from .save_manager import SaveManager
+from .save_coordinator import save_coordinator
+from .wal import wal
 from .audio import AudioManager
 from .logger import game_logger
+from .trace import tracer
 from .assets import load_ascii_art, load_multiple_ascii_art
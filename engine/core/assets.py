@@ -1,14 +1,20 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
+from engine.core.trace import traced
+
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 ASCII_DIR = BASE_DIR / "assets" / "ascii_art"
 
 
+@lru_cache(maxsize=64)
+@traced("asset")
 def load_ascii_art(filename: str) -> Optional[str]:
     """
     Load a single ASCII art file from the ascii_art directory.
-    Returns file content or None if missing/unreadable.
+    Returns file content or None if missing/unreadable. Cached, so the
+    prefetcher can read art ahead of the scene that draws it.
     """
     path = ASCII_DIR / filename
     try:
@@ -29,5 +35,3 @@ def load_multiple_ascii_art(filenames: List[str]) -> List[str]:
         if content is not None:
             arts.append(content)
     return arts
-
-
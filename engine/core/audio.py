@@ -4,6 +4,7 @@ import threading
 import pygame
 
 from .config import config
+from .trace import tracer
 
 
 class AudioManager:
@@ -62,7 +63,7 @@ class AudioManager:
     # BACKGROUND MUSIC
     # -----------------
     def play_music(self, file: str, loop: bool = True, volume: float = 0.5):
-        if not config.ENABLE_MUSIC:
+        if not config.settings.enable_music:
             return  # music disabled
 
         path = os.path.join(self.sounds_dir, file)
@@ -76,7 +77,8 @@ class AudioManager:
             return
 
         try:
-            pygame.mixer.music.load(path)
+            with tracer.span("music_load", "audio", file=file):
+                pygame.mixer.music.load(path)
             pygame.mixer.music.set_volume(volume)
             pygame.mixer.music.play(-1 if loop else 0)
             self.current_track = path
@@ -85,7 +87,7 @@ class AudioManager:
             pass
 
     def stop_music(self, fadeout_ms: int = 1000):
-        if not config.ENABLE_MUSIC:
+        if not config.settings.enable_music:
             return
 
         if fadeout_ms > 0:
@@ -95,13 +97,13 @@ class AudioManager:
         self.current_track = None
 
     def is_playing(self) -> bool:
-        if not config.ENABLE_MUSIC:
+        if not config.settings.enable_music:
             return False
 
         return pygame.mixer.music.get_busy()
 
     def set_volume(self, volume: float):
-        if not config.ENABLE_MUSIC:
+        if not config.settings.enable_music:
             return
 
         pygame.mixer.music.set_volume(volume)
@@ -118,13 +120,14 @@ class AudioManager:
             return None
 
         try:
-            self.sounds[file] = pygame.mixer.Sound(path)
+            with tracer.span("sound_decode", "audio", file=file):
+                self.sounds[file] = pygame.mixer.Sound(path)
         except Exception as e:
             return None
         return self.sounds[file]
 
     def play_sound(self, file: str, volume: float = 0.7, loop: bool = False):
-        if not config.ENABLE_SOUNDS:
+        if not config.settings.enable_sounds:
             return  # sounds disabled
 
         sound = self.sounds.get(file)
@@ -133,7 +136,7 @@ class AudioManager:
             sound.play(-1 if loop else 0)
 
     def stop_sound(self, file: str):
-        if not config.ENABLE_SOUNDS:
+        if not config.settings.enable_sounds:
             return
 
         sound = self.sounds.get(file)
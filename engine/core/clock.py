@@ -0,0 +1,82 @@
+import threading
+import time
+from typing import Callable
+
+from engine.core.config import config
+
+# Game time. Everything that paces the game (typing, pauses, animations,
+# puzzle timers) sleeps and reads time through `clock` instead of the time
+# module, so the whole game can be run faster than real time:
+#
+#   realtime   sleep(s) sleeps s seconds
+#   scaled     sleep(s) sleeps s / scale seconds; now() runs scale times fast
+#   instant    sleep(s) returns at once and moves now() forward by s; real
+#              time passing does not move now(), so it is fully virtual
+#
+# now() stays consistent with sleep() in every mode: after sleep(2) it has
+# advanced by at least 2, so timers written against it (TimedPuzzle) expire
+# after the same number of loop iterations at any speed. fast_forward is a
+# hook that makes sleeps instant while it returns True; the WAL uses it to
+# skip pacing while a resumed scene replays. GameState stamps its history
+# events with now(), so on the instant clock the same input gives the same
+# state, timestamps included.
+
+REALTIME = "realtime"
+SCALED = "scaled"
+INSTANT = "instant"
+MODES = (REALTIME, SCALED, INSTANT)
+
+
+class Clock:
+    def __init__(self, mode: str = REALTIME, scale: float = 1.0):
+        self._lock = threading.Lock()
+        self.fast_forward: Callable[[], bool] = lambda: False
+        self.mode = REALTIME
+        self.scale = 1.0
+        self._real_base = time.monotonic()
+        self._game_base = 0.0
+        self.set_mode(mode, scale)
+
+    def set_mode(self, mode: str, scale: float = None) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown clock mode: {mode}")
+        with self._lock:
+            # Rebase so now() carries on from where it is
+            self._game_base = self._now()
+            self._real_base = time.monotonic()
+            self.mode = mode
+            if scale is not None:
+                self.scale = max(float(scale), 1e-6)
+
+    def reset(self) -> None:
+        """Start game time over at 0 (a recorded or replayed session starts here)."""
+        with self._lock:
+            self._game_base = 0.0
+            self._real_base = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Game seconds per real second while nothing is sleeping."""
+        if self.mode == INSTANT:
+            return 0.0  # only sleeps move it, so runs are repeatable
+        return self.scale if self.mode == SCALED else 1.0
+
+    def _now(self) -> float:
+        return self._game_base + (time.monotonic() - self._real_base) * self.rate
+
+    def now(self) -> float:
+        """Monotonic game time in seconds."""
+        with self._lock:
+            return self._now()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        if self.mode == INSTANT or self.fast_forward():
+            with self._lock:
+                self._game_base += seconds
+            return
+        time.sleep(seconds / self.rate)
+
+
+clock = Clock(config.CLOCK_MODE, config.CLOCK_SCALE)
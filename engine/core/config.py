@@ -1,78 +1,399 @@
+import atexit
 import json
 import os
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional, Union
+
+from engine.core.logger import game_logger
+
+# config.json lives next to the engine package (or in $FOTD_CONFIG_DIR), not
+# wherever the game was started from. save() only marks the settings dirty:
+# a background thread writes them once they have been quiet for `debounce`
+# seconds, to a temp file that is fsynced and renamed over config.json, so a
+# crash mid-write never leaves a truncated file. While watch() is on, the
+# same thread checks config.json's mtime every `poll_interval` seconds and
+# reloads it when someone else changed it; reads through config see the new
+# values from then on.
+#
+# Reads go through `config.settings`, a frozen, slotted Settings built from
+# the raw dict (config.data) after deep-merging it onto the defaults and
+# checking every value against SCHEMA; a bad value is logged and replaced
+# by its default. Any change builds a whole new Settings and swaps the one
+# reference, so a reader holding config.settings always sees one consistent
+# version. Change values with config.set() (or a property setter), not by
+# editing config.data, or the snapshot will not follow.
+
+CONFIG_DIR = os.environ.get("FOTD_CONFIG_DIR") or os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+CONFIG_PATH = os.path.join(CONFIG_DIR, "config.json")
+
+
+def _defaults():
+    return {
+        "debug": {"test_mode": False, "skip_startup": False, "record_input": False},
+        "display": {"typing_speed": 0.03, "glitch_intensity": 0.15, "show_hud": True},
+        "audio": {"master_volume": 0.8, "music_volume": 0.5, "enable_music": True, "enable_sounds": True},
+        "accessibility": {"high_contrast": False, "skip_animations": False},
+        "saves": {
+            "max_slots": 6,
+            "format": "json",
+            "compress": True,
+            "mode": "snapshot",
+            "journal_compact_every": 32,
+            "history_limit": 0
+        },
+        "performance": {"warm_next_scene": True, "clock_mode": "realtime", "clock_scale": 1.0, "seed": None, "trace": False}
+    }
+
+
+# (section, key, Settings field, type)
+SCHEMA = (
+    ("debug", "test_mode", "test_mode", (bool, str)),  # False or a scene id
+    ("debug", "skip_startup", "skip_startup", bool),
+    ("debug", "record_input", "record_input", bool),
+    ("display", "typing_speed", "typing_speed", float),
+    ("display", "glitch_intensity", "glitch_intensity", float),
+    ("display", "show_hud", "show_hud", bool),
+    ("audio", "master_volume", "master_volume", float),
+    ("audio", "music_volume", "music_volume", float),
+    ("audio", "enable_music", "enable_music", bool),
+    ("audio", "enable_sounds", "enable_sounds", bool),
+    ("accessibility", "high_contrast", "high_contrast", bool),
+    ("accessibility", "skip_animations", "skip_animations", bool),
+    ("saves", "max_slots", "max_slots", int),
+    ("saves", "format", "save_format", str),
+    ("saves", "compress", "compress_saves", bool),
+    ("saves", "mode", "save_mode", str),
+    ("saves", "journal_compact_every", "journal_compact_every", int),
+    ("saves", "history_limit", "history_limit", int),
+    ("performance", "warm_next_scene", "warm_next_scene", bool),
+    ("performance", "clock_mode", "clock_mode", str),
+    ("performance", "clock_scale", "clock_scale", float),
+    ("performance", "seed", "seed", (int, type(None))),
+    ("performance", "trace", "trace", bool),
+)
+
+CHOICES = {
+    "save_format": ("json", "binary"),
+    "save_mode": ("snapshot", "journal"),
+    "clock_mode": ("realtime", "scaled", "instant"),
+}
+
+# Below these a value is rejected like a wrong type (0 history_limit = unbounded)
+MINIMUMS = {
+    "history_limit": 0,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    test_mode: Union[bool, str]
+    skip_startup: bool
+    record_input: bool
+    typing_speed: float
+    glitch_intensity: float
+    show_hud: bool
+    master_volume: float
+    music_volume: float
+    enable_music: bool
+    enable_sounds: bool
+    high_contrast: bool
+    skip_animations: bool
+    max_slots: int
+    save_format: str
+    compress_saves: bool
+    save_mode: str
+    journal_compact_every: int
+    history_limit: Optional[int]  # None: unbounded
+    warm_next_scene: bool
+    clock_mode: str
+    clock_scale: float
+    seed: Optional[int]
+    trace: bool
+
+
+def merge(base: Dict, override: Dict) -> Dict:
+    """base with override laid over it, section by section (neither is modified)."""
+    out = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(out.get(key), dict):
+            out[key] = merge(out[key], value)
+        else:
+            out[key] = value
+    return out
+
+
+def _check(value: Any, kind) -> Any:
+    kinds = kind if isinstance(kind, tuple) else (kind,)
+    # bool is an int subclass; only accept it where bool is asked for
+    if isinstance(value, bool) and bool not in kinds:
+        raise TypeError
+    if isinstance(value, kinds):
+        return value
+    if float in kinds and isinstance(value, int):
+        return float(value)
+    raise TypeError
+
+
+def build_settings(data: Dict) -> Settings:
+    """Validate a merged config dict into Settings, falling back to defaults."""
+    defaults = _defaults()
+    values = {}
+    for section, key, name, kind in SCHEMA:
+        value = data.get(section, {}).get(key, defaults[section][key])
+        try:
+            value = _check(value, kind)
+            if value not in CHOICES.get(name, (value,)):
+                raise ValueError
+            if name in MINIMUMS and value < MINIMUMS[name]:
+                raise ValueError
+        except (TypeError, ValueError):
+            game_logger.warning(f"config {section}.{key}: invalid value {value!r}, using {defaults[section][key]!r}")
+            value = defaults[section][key]
+        values[name] = value
+    values["max_slots"] = max(1, values["max_slots"])
+    values["journal_compact_every"] = max(1, values["journal_compact_every"])
+    values["history_limit"] = values["history_limit"] or None
+    values["clock_scale"] = max(values["clock_scale"], 1e-6)
+    return Settings(**values)
+
 
 class Config:
-    def __init__(self):
-        self.data = {
-            "debug": {"test_mode": False, "skip_startup": False},
-            "display": {"typing_speed": 0.03, "glitch_intensity": 0.15},
-            "audio": {"master_volume": 0.8, "music_volume": 0.5, "enable_music": True, "enable_sounds": True},
-            "accessibility": {"high_contrast": False, "skip_animations": False}
-        }
+    def __init__(self, path: str = CONFIG_PATH, debounce: float = 0.5, poll_interval: float = 1.0):
+        self.path = path
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._watching = False
+        self._dirty_at = None  # monotonic time of the last unsaved change
+        self._mtime = None
+        self.data = _defaults()
+        self.settings = build_settings(self.data)
         self.load()
 
+    def _read(self):
+        """(contents, mtime) of config.json, or None if missing or unreadable."""
+        try:
+            # stat first: a change landing mid-read shows up on the next poll
+            mtime = os.stat(self.path).st_mtime_ns
+            with open(self.path) as f:
+                loaded = json.load(f)
+            if not isinstance(loaded, dict):
+                raise ValueError("not a JSON object")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            game_logger.warning(f"Could not read {self.path}: {e}")
+            return None
+        return loaded, mtime
+
     def load(self):
-        if os.path.exists("config.json"):
-            try:
-                with open("config.json") as f:
-                    self.data.update(json.load(f))
-            except:
-                pass
+        read = self._read()
+        if read is None:
+            return
+        loaded, mtime = read
+        self.replace(loaded)
+        self._mtime = mtime
+
+    def replace(self, data: Dict):
+        """Swap in new settings: data merged onto the defaults (not saved)."""
+        merged = merge(_defaults(), data)
+        settings = build_settings(merged)
+        with self._lock:
+            self.data = merged
+            self.settings = settings
+
+    def set(self, section: str, key: str, value, save: bool = True):
+        """Change one value and publish a new snapshot."""
+        # Merge and swap under one lock, or two concurrent sets lose one
+        with self._lock:
+            self.data = merge(self.data, {section: {key: value}})
+            self.settings = build_settings(self.data)
+        if save:
+            self.save()
 
     def save(self):
+        """Schedule a write of the current settings."""
+        with self._lock:
+            self._dirty_at = time.monotonic()
+        self._start()
+        self._wake.set()
+
+    def flush(self):
+        """Write pending changes now (the session calls this on exit)."""
+        with self._write_lock:
+            with self._lock:
+                if self._dirty_at is None:
+                    return
+                raw = json.dumps(self.data, indent=4)
+                self._dirty_at = None
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    f.write(raw)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+                self._mtime = os.stat(self.path).st_mtime_ns
+            except OSError as e:
+                game_logger.error(f"Config save failed: {e}")
+
+    def watch(self):
+        """Reload config.json when it changes on disk."""
+        self._watching = True
+        self._start()
+
+    def poll(self) -> bool:
         try:
-            with open("config.json", "w") as f:
-                json.dump(self.data, f, indent=4)
-        except:
-            pass
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+        # Unsaved changes go first: the reload waits until they are written
+        # (that write wins over the edit on disk)
+        if self._dirty_at is not None:
+            return False
+        read = self._read()
+        if read is None:
+            return False
+        loaded, mtime = read
+        merged = merge(_defaults(), loaded)
+        settings = build_settings(merged)
+        with self._lock:
+            if self._dirty_at is not None:
+                return False  # a set() landed while reading
+            self.data = merged
+            self.settings = settings
+            self._mtime = mtime
+        game_logger.info(f"{self.path} changed on disk; reloaded")
+        return True
 
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="config", daemon=True)
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            timeout = self.poll_interval
+            with self._lock:
+                if self._dirty_at is not None:
+                    timeout = max(0.0, self._dirty_at + self.debounce - time.monotonic())
+            if timeout > 0 and self._wake.wait(timeout):
+                self._wake.clear()
+                continue  # another change: wait out the debounce again
+            self.flush()
+            if self._watching:
+                self.poll()
+
+    # Uppercase names kept for existing callers; hot paths can hold on to
+    # config.settings instead
     @property
     def TEST(self):
-        return self.data["debug"]["test_mode"]
+        return self.settings.test_mode
 
     @TEST.setter
     def TEST(self, value):
-        self.data["debug"]["test_mode"] = value
+        self.set("debug", "test_mode", value, save=False)
 
     @property
     def SKIP_STARTUP(self):
-        return self.data["debug"]["skip_startup"]
+        return self.settings.skip_startup
 
     @SKIP_STARTUP.setter
     def SKIP_STARTUP(self, value):
-        self.data["debug"]["skip_startup"] = value
+        self.set("debug", "skip_startup", value, save=False)
 
+    @property
+    def RECORD_INPUT(self):
+        return self.settings.record_input
 
-    # Add getters for other values as needed
     @property
     def TYPING_SPEED(self):
-        return self.data["display"]["typing_speed"]
+        return self.settings.typing_speed
+
+    @property
+    def SHOW_HUD(self):
+        return self.settings.show_hud
+
+    @property
+    def WARM_NEXT_SCENE(self):
+        return self.settings.warm_next_scene
+
+    @property
+    def CLOCK_MODE(self):
+        return self.settings.clock_mode
+
+    @property
+    def CLOCK_SCALE(self):
+        return self.settings.clock_scale
+
+    @property
+    def SEED(self):
+        return self.settings.seed
+
+    @property
+    def TRACE(self):
+        return self.settings.trace
+
+    @property
+    def MAX_SLOTS(self):
+        return self.settings.max_slots
+
+    @property
+    def SAVE_FORMAT(self):
+        return self.settings.save_format
+
+    @property
+    def COMPRESS_SAVES(self):
+        return self.settings.compress_saves
+
+    @property
+    def SAVE_MODE(self):
+        return self.settings.save_mode
+
+    @property
+    def JOURNAL_COMPACT_EVERY(self):
+        return self.settings.journal_compact_every
+
+    @property
+    def HISTORY_LIMIT(self):
+        # Max history events kept in a GameState; None means unbounded
+        return self.settings.history_limit
 
     @property
     def SKIP_ANIMATIONS(self):
-        return self.data["accessibility"]["skip_animations"]
+        return self.settings.skip_animations
 
     @SKIP_ANIMATIONS.setter
     def SKIP_ANIMATIONS(self, value):
-        self.data["accessibility"]["skip_animations"] = value
-        self.save()
+        self.set("accessibility", "skip_animations", value)
 
     @property
     def ENABLE_MUSIC(self):
-        return self.data["audio"].get("enable_music", True)
+        return self.settings.enable_music
 
     @ENABLE_MUSIC.setter
     def ENABLE_MUSIC(self, value):
-        self.data["audio"]["enable_music"] = value
-        self.save()
+        self.set("audio", "enable_music", value)
 
     @property
     def ENABLE_SOUNDS(self):
-        return self.data["audio"].get("enable_sounds", True)
+        return self.settings.enable_sounds
 
     @ENABLE_SOUNDS.setter
     def ENABLE_SOUNDS(self, value):
-        self.data["audio"]["enable_sounds"] = value
-        self.save()
+        self.set("audio", "enable_sounds", value)
+
 
-config = Config()
\ No newline at end of file
+config = Config()
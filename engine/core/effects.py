@@ -0,0 +1,133 @@
+import ast
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+from engine.core.config import config
+from engine.core.logger import game_logger
+
+# Effect strings used by scenes, compiled once into (GameState method, args)
+# ops and cached by string:
+#   "stability+2", "corruption-1"    apply_stability / apply_corruption
+#   "fragment:shard_001"             add_fragment
+#   "relationship:ava+1"             relationship_delta
+# Several effects can be given in one string, separated by commas.
+
+Op = Tuple[str, tuple]
+
+
+class EffectError(ValueError):
+    pass
+
+
+_REGISTRY: List[Tuple[re.Pattern, str, Callable[[re.Match], tuple]]] = []
+
+
+def register_effect(pattern: str, method: str, args: Callable[[re.Match], tuple]) -> None:
+    """Map effect strings matching pattern (whole string) to a GameState method."""
+    _REGISTRY.append((re.compile(pattern), method, args))
+    compile_effect.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def compile_effect(effect: str) -> Tuple[Op, ...]:
+    """Ops for an effect string; raises EffectError if any part is unknown."""
+    ops = []
+    for part in effect.split(","):
+        part = part.strip()
+        for pattern, method, args in _REGISTRY:
+            match = pattern.fullmatch(part)
+            if match:
+                ops.append((method, args(match)))
+                break
+        else:
+            raise EffectError(f"Unknown effect: {part!r}")
+    return tuple(ops)
+
+
+def apply_effects(game_state, *effects: str) -> None:
+    """
+    Apply effects to game_state in order. Unknown effects raise EffectError
+    in test mode and are logged and skipped otherwise.
+    """
+    for effect in effects:
+        try:
+            ops = compile_effect(effect)
+        except EffectError as e:
+            if config.TEST:
+                raise
+            game_logger.error(str(e))
+            continue
+        for method, args in ops:
+            getattr(game_state, method)(*args)
+
+
+def find_effect_literals(path: str) -> List[Tuple[int, str]]:
+    """(line, string) for every literal passed to .apply_effect() in a source file."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    found = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "apply_effect"
+        ):
+            for arg in node.args:
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                    found.append((arg.lineno, arg.value))
+    return found
+
+
+def find_script_effects(path: str) -> List[Tuple[str, str]]:
+    """(section, string) for every "effect" step in a scene script."""
+    with open(path, encoding="utf-8") as f:
+        script = json.load(f)
+    return [
+        (section, step["effect"])
+        for section, steps in script.get("sections", {}).items()
+        for step in steps
+        if "effect" in step
+    ]
+
+
+def validate_scene_effects(scenes_dir: Optional[str] = None) -> List[str]:
+    """
+    Compile every effect literal in scenes_dir (the scenes package by
+    default) and its scene scripts, which also warms the cache. Returns the
+    problems found; in test mode the first one raises.
+    """
+    if scenes_dir is None:
+        import scenes
+
+        scenes_dir = os.path.dirname(scenes.__file__)
+    sources = []
+    for name in sorted(os.listdir(scenes_dir)):
+        if name.endswith(".py"):
+            sources.append((os.path.join(scenes_dir, name), find_effect_literals))
+    scripts_dir = os.path.join(scenes_dir, "scripts")
+    if os.path.isdir(scripts_dir):
+        for name in sorted(os.listdir(scripts_dir)):
+            if name.endswith(".json"):
+                sources.append((os.path.join(scripts_dir, name), find_script_effects))
+
+    problems = []
+    for path, finder in sources:
+        for where, effect in finder(path):
+            try:
+                compile_effect(effect)
+            except EffectError as e:
+                problems.append(f"{path}:{where}: {e}")
+    for problem in problems:
+        game_logger.error(problem)
+    if problems and config.TEST:
+        raise EffectError(problems[0])
+    return problems
+
+
+register_effect(r"stability([+-]\d+)", "apply_stability", lambda m: (int(m[1]),))
+register_effect(r"corruption([+-]\d+)", "apply_corruption", lambda m: (int(m[1]),))
+register_effect(r"fragment:(\S+)", "add_fragment", lambda m: (m[1],))
+register_effect(r"relationship:(\w+)([+-]\d+)", "relationship_delta", lambda m: (m[1], int(m[2])))
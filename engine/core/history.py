@@ -0,0 +1,532 @@
+import copy
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Compact encoding for GameState.history.
+#
+# A chunk payload holds n events column by column:
+#   u32 n | n type codes (B) | 3n ints (h: delta, old, new) | n timestamps (d)
+#   | u32 len | JSON list of the string/extra columns
+# Events that do not fit the known shapes are kept verbatim in the JSON list
+# under TYPE_OTHER, so encoding is always lossless.
+#
+# Known shapes (all with a float "timestamp"):
+#   stability / corruption  delta, old, new
+#   fragment                fragment_id                 (extra)
+#   relationship            npc (extra), delta, value   (value in the "new" column)
+#   puzzle                  success                     (0/1 in the "delta" column)
+#   node                    node_id                     (extra)
+
+TYPE_OTHER = 0
+TYPE_STABILITY = 1
+TYPE_CORRUPTION = 2
+TYPE_FRAGMENT = 3
+TYPE_RELATIONSHIP = 4
+TYPE_PUZZLE = 5
+TYPE_NODE = 6
+
+# Codes whose rows carry an entry in the extras list
+_EXTRA_CODES = frozenset((TYPE_OTHER, TYPE_FRAGMENT, TYPE_RELATIONSHIP, TYPE_NODE))
+
+_STAT_TYPES = {"stability": TYPE_STABILITY, "corruption": TYPE_CORRUPTION}
+_STAT_NAMES = {code: name for name, code in _STAT_TYPES.items()}
+_STAT_KEYS = ("type", "delta", "old", "new", "timestamp")
+_FRAGMENT_KEYS = ("type", "fragment_id", "timestamp")
+_RELATIONSHIP_KEYS = ("type", "npc", "delta", "value", "timestamp")
+_PUZZLE_KEYS = ("type", "success", "timestamp")
+_NODE_KEYS = ("type", "node_id", "timestamp")
+_INT16 = range(-32768, 32768)
+_INT8 = range(-128, 128)
+
+CHUNK_ZLIB = 1
+
+_U32 = struct.Struct("<I")
+_CHUNK_HEAD = struct.Struct("<BII")
+
+
+def _little_endian(arr: array) -> array:
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+def _ints_fit(values, int_range: range) -> bool:
+    return all(type(v) is int and v in int_range for v in values)
+
+
+def to_row(event: Dict, int_range: range = _INT16) -> Tuple:
+    """(code, delta, old, new, timestamp, extra) for one event."""
+    stamp = event.get("timestamp")
+    if type(stamp) is float:
+        keys = tuple(event)
+        kind = event.get("type")
+        if keys == _STAT_KEYS and kind in _STAT_TYPES:
+            if _ints_fit((event["delta"], event["old"], event["new"]), int_range):
+                return _STAT_TYPES[kind], event["delta"], event["old"], event["new"], stamp, None
+        elif keys == _FRAGMENT_KEYS and kind == "fragment" and type(event["fragment_id"]) is str:
+            return TYPE_FRAGMENT, 0, 0, 0, stamp, event["fragment_id"]
+        elif keys == _RELATIONSHIP_KEYS and kind == "relationship" and type(event["npc"]) is str:
+            if _ints_fit((event["delta"], event["value"]), int_range):
+                return TYPE_RELATIONSHIP, event["delta"], 0, event["value"], stamp, event["npc"]
+        elif keys == _PUZZLE_KEYS and kind == "puzzle" and type(event["success"]) is bool:
+            return TYPE_PUZZLE, int(event["success"]), 0, 0, stamp, None
+        elif keys == _NODE_KEYS and kind == "node" and type(event["node_id"]) is str:
+            return TYPE_NODE, 0, 0, 0, stamp, event["node_id"]
+    return TYPE_OTHER, 0, 0, 0, 0.0, event
+
+
+def from_row(code: int, delta: int, old: int, new: int, stamp: float, extra) -> Dict:
+    if code == TYPE_OTHER:
+        return extra
+    if code == TYPE_FRAGMENT:
+        return {"type": "fragment", "fragment_id": extra, "timestamp": stamp}
+    if code == TYPE_RELATIONSHIP:
+        return {"type": "relationship", "npc": extra, "delta": delta, "value": new, "timestamp": stamp}
+    if code == TYPE_PUZZLE:
+        return {"type": "puzzle", "success": bool(delta), "timestamp": stamp}
+    if code == TYPE_NODE:
+        return {"type": "node", "node_id": extra, "timestamp": stamp}
+    return {"type": _STAT_NAMES[code], "delta": delta, "old": old, "new": new, "timestamp": stamp}
+
+
+def encode_events(events: Iterable[Dict]) -> bytes:
+    types = array("B")
+    ints = array("h")
+    stamps = array("d")
+    extras: List = []
+    for event in events:
+        code, delta, old, new, stamp, extra = to_row(event)
+        types.append(code)
+        ints.extend((delta, old, new))
+        stamps.append(stamp)
+        if code in _EXTRA_CODES:
+            extras.append(extra)
+    return _pack_payload(types, ints, stamps, extras)
+
+
+def _pack_payload(types: array, ints: array, stamps: array, extras: List) -> bytes:
+    extra_bytes = json.dumps(extras, separators=(",", ":")).encode("utf-8")
+    return b"".join((
+        _U32.pack(len(types)),
+        types.tobytes(),
+        _little_endian(ints).tobytes(),
+        _little_endian(stamps).tobytes(),
+        _U32.pack(len(extra_bytes)),
+        extra_bytes,
+    ))
+
+
+def _unpack_payload(payload: bytes) -> Tuple[array, array, array, List]:
+    (n,) = _U32.unpack_from(payload, 0)
+    pos = _U32.size
+    types = array("B", payload[pos:pos + n])
+    pos += n
+    ints = _little_endian(array("h", payload[pos:pos + 6 * n]))
+    pos += 6 * n
+    stamps = _little_endian(array("d", payload[pos:pos + 8 * n]))
+    pos += 8 * n
+    (extra_len,) = _U32.unpack_from(payload, pos)
+    pos += _U32.size
+    return types, ints, stamps, json.loads(payload[pos:pos + extra_len])
+
+
+def decode_events(payload: bytes) -> List[Dict]:
+    types, ints, stamps, extras = _unpack_payload(payload)
+    extras = iter(extras)
+    return [
+        from_row(code, ints[3 * i], ints[3 * i + 1], ints[3 * i + 2], stamps[i],
+                 next(extras) if code in _EXTRA_CODES else None)
+        for i, code in enumerate(types)
+    ]
+
+
+class HistoryChunk:
+    """One encoded (optionally zlib-compressed) run of history events."""
+
+    __slots__ = ("flags", "count", "data")
+
+    def __init__(self, flags: int, count: int, data: bytes):
+        self.flags = flags
+        self.count = count
+        self.data = data
+
+    @classmethod
+    def from_events(cls, events: List[Dict], compress: bool = False) -> "HistoryChunk":
+        payload = encode_events(events)
+        if compress:
+            return cls(CHUNK_ZLIB, len(events), zlib.compress(payload))
+        return cls(0, len(events), payload)
+
+    def payload(self) -> bytes:
+        return zlib.decompress(self.data) if self.flags & CHUNK_ZLIB else self.data
+
+    def decode(self) -> List[Dict]:
+        return decode_events(self.payload())
+
+    def pack(self) -> bytes:
+        return _CHUNK_HEAD.pack(self.flags, self.count, len(self.data)) + self.data
+
+    @classmethod
+    def unpack_from(cls, buf: bytes, pos: int) -> Tuple["HistoryChunk", int]:
+        flags, count, length = _CHUNK_HEAD.unpack_from(buf, pos)
+        pos += _CHUNK_HEAD.size
+        return cls(flags, count, bytes(buf[pos:pos + length])), pos + length
+
+
+class LazyHistory(list):
+    """
+    History list whose loaded part stays encoded until something reads it.
+
+    Appends made after loading go to the plain list and do not force a
+    decode, so a state restored from a binary save can be played and saved
+    again without ever decoding the events it was loaded with. Any read or
+    non-append mutation decodes everything in place first.
+    """
+
+    def __init__(self, iterable=(), chunks: List[HistoryChunk] = ()):
+        super().__init__(iterable)
+        self._chunks = list(chunks)
+
+    @property
+    def is_materialized(self) -> bool:
+        return not self._chunks
+
+    @property
+    def chunks(self) -> List[HistoryChunk]:
+        return self._chunks
+
+    @property
+    def tail(self) -> List[Dict]:
+        """Events appended since loading, still held as plain dicts."""
+        return list(list.__iter__(self))
+
+    def materialize(self) -> "LazyHistory":
+        if self._chunks:
+            decoded = []
+            for chunk in self._chunks:
+                decoded.extend(chunk.decode())
+            self._chunks = []
+            list.__setitem__(self, slice(0, 0), decoded)
+        return self
+
+    def share(self) -> "LazyHistory":
+        """Copy that reuses the encoded chunks and copies only the decoded tail."""
+        return LazyHistory((dict(e) for e in list.__iter__(self)), chunks=self._chunks)
+
+    def __len__(self):
+        return sum(c.count for c in self._chunks) + list.__len__(self)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def append(self, item):
+        list.append(self, item)
+
+    def extend(self, items):
+        list.extend(self, items)
+
+    def __reduce_ex__(self, protocol):
+        return (list, (list(self.materialize()),))
+
+
+def _materializing(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self.materialize()
+        for arg in args:
+            if isinstance(arg, LazyHistory):
+                arg.materialize()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "__iter__", "__reversed__", "__getitem__", "__setitem__", "__delitem__",
+    "__contains__", "__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__",
+    "__repr__", "__add__", "__iadd__", "__mul__", "__imul__", "copy", "count",
+    "index", "insert", "pop", "remove", "reverse", "sort", "clear",
+):
+    setattr(LazyHistory, _name, _materializing(_name))
+del _name
+
+
+class EventStore:
+    """
+    GameState.history kept column by column instead of as a list of dicts.
+
+    Stat events cost a type byte, three int8s and a float64; fragment ids
+    and events of any other shape are kept aside, keyed by position. Reads
+    return the same dicts the plain list used to hold. With maxlen set the
+    store is a ring buffer: once full, the oldest events are dropped.
+
+    snapshot() returns a frozen view that shares the columns instead of
+    copying them. Columns only ever grow at the end, so a view just
+    remembers where it stops; the first write to a view, or a trim of a
+    store that has views, copies the columns first.
+    """
+
+    __slots__ = (
+        "maxlen", "_types", "_deltas", "_olds", "_news", "_stamps", "_extras",
+        "_start", "_dropped", "_end", "_shared",
+    )
+
+    def __init__(self, events: Iterable[Dict] = (), maxlen: Optional[int] = None):
+        self.maxlen = maxlen or None
+        self._types = bytearray()
+        self._deltas = array("b")
+        self._olds = array("b")
+        self._news = array("b")
+        self._stamps = array("d")
+        self._extras: Dict[int, object] = {}  # absolute index -> fragment id or whole event
+        self._start = 0    # first live row; rows before it are evicted but not yet trimmed
+        self._dropped = 0  # rows already trimmed off the front
+        self._end: Optional[int] = None  # set on frozen views: rows past it belong to someone else
+        self._shared = False  # columns are referenced by a view
+        self.extend(events)
+
+    @classmethod
+    def from_history(cls, history, maxlen: Optional[int] = None) -> "EventStore":
+        """Build from a list, a LazyHistory (without decoding to dicts) or another store."""
+        if isinstance(history, EventStore):
+            store = history.copy()
+            store.maxlen = maxlen or None
+            store._evict()
+            return store
+        if isinstance(history, LazyHistory) and not history.is_materialized:
+            store = cls(maxlen=maxlen)
+            for chunk in history.chunks:
+                store._load_payload(chunk.payload())
+            store.extend(history.tail)
+            return store
+        return cls(history, maxlen=maxlen)
+
+    @property
+    def _stop(self) -> int:
+        return len(self._types) if self._end is None else self._end
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._end is not None
+
+    @property
+    def evicted(self) -> int:
+        """Events dropped by the ring buffer so far."""
+        return self._dropped + self._start
+
+    @property
+    def total(self) -> int:
+        """Events ever recorded, including evicted ones."""
+        return self._dropped + self._stop
+
+    # -----------------
+    # WRITING
+    # -----------------
+    def append(self, event: Dict) -> None:
+        self._push(*to_row(event, _INT8))
+
+    def extend(self, events: Iterable[Dict]) -> None:
+        for event in events:
+            self.append(event)
+
+    def _push(self, code: int, delta: int, old: int, new: int, stamp: float, extra=None) -> None:
+        if self._end is not None:
+            self._own()
+        if code in _EXTRA_CODES:
+            self._extras[self.total] = extra
+        self._types.append(code)
+        self._deltas.append(delta)
+        self._olds.append(old)
+        self._news.append(new)
+        self._stamps.append(stamp)
+        if self.maxlen is not None and len(self._types) - self._start > self.maxlen:
+            self._start += 1
+            if self._start >= max(64, self.maxlen // 4):
+                self._trim()
+
+    def _evict(self) -> None:
+        if self.maxlen is not None and len(self) > self.maxlen:
+            self._start = len(self._types) - self.maxlen
+            self._trim()
+
+    def _trim(self) -> None:
+        # Evict lazily and cut the columns in batches so appends stay O(1)
+        if self._shared:
+            self._own()
+            return
+        k = self._start
+        for column in (self._types, self._deltas, self._olds, self._news, self._stamps):
+            del column[:k]
+        self._dropped += k
+        self._start = 0
+        for key in [key for key in self._extras if key < self._dropped]:
+            del self._extras[key]
+
+    def _own(self) -> None:
+        """Swap shared columns for private copies of just the live rows."""
+        s, e = self._start, self._stop
+        evicted = self.evicted
+        self._types = self._types[s:e]
+        self._deltas = self._deltas[s:e]
+        self._olds = self._olds[s:e]
+        self._news = self._news[s:e]
+        self._stamps = self._stamps[s:e]
+        self._extras = {key: value for key, value in self._extras.items() if evicted <= key < self._dropped + e}
+        self._dropped = evicted
+        self._start = 0
+        self._end = None
+        self._shared = False
+
+    def _load_payload(self, payload: bytes) -> None:
+        if self._end is not None:
+            self._own()
+        types, ints, stamps, extras = _unpack_payload(payload)
+        deltas, olds, news = ints[0::3], ints[1::3], ints[2::3]
+        if any(column and (min(column) < -128 or max(column) > 127) for column in (deltas, olds, news)):
+            # Wider than int8; take the per-event path
+            self.extend(decode_events(payload))
+            return
+
+        base = self.total
+        extras = iter(extras)
+        for i, code in enumerate(types):
+            if code in _EXTRA_CODES:
+                self._extras[base + i] = next(extras)
+        self._types.extend(types)
+        self._deltas.extend(array("b", deltas))
+        self._olds.extend(array("b", olds))
+        self._news.extend(array("b", news))
+        self._stamps.extend(stamps)
+        self._evict()
+
+    # -----------------
+    # READING (dict view)
+    # -----------------
+    def _event(self, row: int):
+        code = self._types[row]
+        extra = self._extras[self._dropped + row] if code in _EXTRA_CODES else None
+        return from_row(code, self._deltas[row], self._olds[row], self._news[row], self._stamps[row], extra)
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        for row in range(self._start, self._stop):
+            yield self._event(row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._event(self._start + i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        return self._event(self._start + index)
+
+    def __eq__(self, other):
+        if isinstance(other, (EventStore, list)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"EventStore({list(self)!r}, maxlen={self.maxlen})"
+
+    def since(self, start: int) -> List[Dict]:
+        """Events from absolute position start (see total) that are still held."""
+        return self[max(start - self.evicted, 0):]
+
+    # -----------------
+    # COPYING / ENCODING
+    # -----------------
+    def _live_extras(self):
+        stop = self._dropped + self._stop
+        return ((key, value) for key, value in self._extras.items() if self.evicted <= key < stop)
+
+    def snapshot(self, stop: Optional[int] = None) -> "EventStore":
+        """
+        Frozen view of the events held right now, in O(1). stop (an absolute
+        position, see total) cuts the view short.
+        """
+        end = self._stop
+        if stop is not None:
+            if not self.evicted <= stop <= self.total:
+                raise IndexError(f"history position {stop} is not held")
+            end = stop - self._dropped
+        view = EventStore.__new__(EventStore)
+        view.maxlen = self.maxlen
+        view._types = self._types
+        view._deltas = self._deltas
+        view._olds = self._olds
+        view._news = self._news
+        view._stamps = self._stamps
+        view._extras = self._extras
+        view._start = self._start
+        view._dropped = self._dropped
+        view._end = end
+        view._shared = False
+        self._shared = True
+        return view
+
+    def copy(self) -> "EventStore":
+        s, e = self._start, self._stop
+        new = EventStore.__new__(EventStore)
+        new.maxlen = self.maxlen
+        new._types = self._types[s:e]
+        new._deltas = self._deltas[s:e]
+        new._olds = self._olds[s:e]
+        new._news = self._news[s:e]
+        new._stamps = self._stamps[s:e]
+        new._extras = {
+            key: copy.deepcopy(value) if isinstance(value, dict) else value
+            for key, value in self._live_extras()
+        }
+        new._start = 0
+        new._dropped = self.evicted
+        new._end = None
+        new._shared = False
+        return new
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def to_chunk(self, compress: bool = False) -> HistoryChunk:
+        s, e = self._start, self._stop
+        n = len(self)
+        ints = array("h", bytes(6 * n))
+        ints[0::3] = array("h", self._deltas[s:e])
+        ints[1::3] = array("h", self._olds[s:e])
+        ints[2::3] = array("h", self._news[s:e])
+        extras = [value for _, value in self._live_extras()]
+        payload = _pack_payload(array("B", self._types[s:e]), ints, self._stamps[s:e], extras)
+        if compress:
+            return HistoryChunk(CHUNK_ZLIB, n, zlib.compress(payload))
+        return HistoryChunk(0, n, payload)
+
+
+def history_position(history) -> int:
+    """Absolute length of a history, counting events a ring buffer evicted."""
+    if isinstance(history, EventStore):
+        return history.total
+    return len(history)
+
+
+def events_since(history: List[Dict], start: int) -> List[Dict]:
+    """history[start:] without decoding a LazyHistory's chunks when avoidable."""
+    if isinstance(history, EventStore):
+        return history.since(start)
+    if isinstance(history, LazyHistory) and not history.is_materialized:
+        encoded = len(history) - list.__len__(history)
+        if start >= encoded:
+            return history.tail[start - encoded:]
+    return list(history[start:])
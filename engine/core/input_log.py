@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import struct
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from engine.core.clock import INSTANT, clock
+from engine.core.config import config
+from engine.core.logger import game_logger
+from engine.core.rng import rng
+
+# Input recording and replay (logs/input/<stamp>.fotdin, binary).
+#
+#   "FOTI" u8 version u32 n   header: n bytes of JSON (RNG seeds, config,
+#                             terminal size, a fingerprint of saves/)
+#   <d i I> ...               one record per key: game time since the
+#                             session started, key code, repeat count
+#
+# Every key the game reads comes from the keyboard (engine/ui/keyboard.py),
+# which fetches it through input_log.read(). While recording, each key is
+# written with the game time it was read at; runs of empty nodelay polls
+# (-1) collapse into one record carrying their count and the time of the
+# last poll. A replay answers the same sequence of reads from the file
+# instead of the keyboard, and moves the clock up to each record's time
+# before returning it, so puzzle timers and typing skips land where they
+# did. With the same seeds and config that reproduces the same screens and
+# GameState; on the instant clock (--fast, or a session recorded on it) the
+# snapshot is identical down to event timestamps. Replays run at real time,
+# or with --fast on the instant clock.
+# When the log runs out, input goes back to the keyboard.
+#
+# A replay starts from whatever is in saves/; if that differs from when the
+# session was recorded, the run can diverge (a warning is logged).
+
+MAGIC = b"FOTI"
+VERSION = 1
+_HEAD = struct.Struct("<4sBI")
+_RECORD = struct.Struct("<diI")
+NO_KEY = -1
+
+OFF = "off"
+RECORDING = "recording"
+REPLAYING = "replaying"
+
+
+def saves_fingerprint(saves_dir: str = "saves") -> str:
+    digest = hashlib.sha1()
+    if os.path.isdir(saves_dir):
+        for name in sorted(os.listdir(saves_dir)):
+            path = os.path.join(saves_dir, name)
+            if name.endswith(".wal") or not os.path.isfile(path):
+                continue
+            digest.update(name.encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def default_record_path() -> str:
+    return os.path.join("logs", "input", time.strftime("%Y%m%d-%H%M%S") + ".fotdin")
+
+
+def read_log(path: str) -> Tuple[Dict, List[Tuple[float, int, int]]]:
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, size = _HEAD.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not an input log")
+    start = _HEAD.size + size
+    header = json.loads(data[_HEAD.size:start].decode("utf-8"))
+    # A log cut short by a crash may end in half a record
+    end = start + (len(data) - start) // _RECORD.size * _RECORD.size
+    return header, list(_RECORD.iter_unpack(data[start:end]))
+
+
+class InputLog:
+    def __init__(self):
+        self.mode = OFF
+        self.path: Optional[str] = None
+        self.header: Dict = {}
+        self._file = None
+        self._t0 = 0.0
+        self._idle = 0
+        self._idle_at = 0.0
+        self._records: List[Tuple[float, int, int]] = []
+        self._pos = 0
+        self._left = 0
+        self._at = 0.0
+        self._key = NO_KEY
+        # Called when a replay runs out and input goes live (the keyboard
+        # drops whatever was typed while it played)
+        self.on_live: Callable[[], None] = lambda: None
+
+    # -----------------
+    # SETUP
+    # -----------------
+    def record_to(self, path: str) -> None:
+        self.mode = RECORDING
+        self.path = path
+
+    def replay_from(self, path: str, fast: bool = False) -> None:
+        """Load a log and restore its seeds and config; call before curses starts."""
+        self.header, self._records = read_log(path)
+        self.mode = REPLAYING
+        self.path = path
+        config.replace(self.header["config"])
+        rng.reseed(self.header["seed"])
+        if fast:
+            clock.set_mode(INSTANT)
+        else:
+            clock.set_mode(*self.header["clock"])
+        game_logger.info(f"Replaying {len(self._records)} input records from {path}")
+
+    def begin(self, stdscr) -> None:
+        """Start the session: open the log or check the replay against this terminal."""
+        if self.mode == OFF:
+            return
+        # Game time (and so every history timestamp) counts from here in
+        # both the recording and its replays
+        clock.reset()
+        self._t0 = clock.now()
+        size = list(stdscr.getmaxyx())
+        if self.mode == RECORDING:
+            self._open(size)
+        else:
+            if self.header.get("size") != size:
+                game_logger.warning(f"Replay recorded at {self.header.get('size')}, terminal is {size}")
+            if self.header.get("saves") != saves_fingerprint():
+                game_logger.warning("saves/ differs from when the replay was recorded; it may diverge")
+
+    def _open(self, size) -> None:
+        header = {
+            "seed": rng.seed,
+            "seeds": rng.seeds(),
+            "config": config.data,
+            "size": size,
+            "saves": saves_fingerprint(),
+            "clock": [clock.mode, clock.scale],
+            "recorded": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        raw = json.dumps(header).encode("utf-8")
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "wb")
+            self._file.write(_HEAD.pack(MAGIC, VERSION, len(raw)) + raw)
+            self._file.flush()
+            game_logger.info(f"Recording input to {self.path}")
+        except OSError as e:
+            game_logger.error(f"Input recording disabled: {e}")
+            self.mode = OFF
+
+    def close(self) -> None:
+        if self._file:
+            self._flush_idle()
+            self._file.close()
+            self._file = None
+        self.mode = OFF
+
+    # -----------------
+    # INPUT
+    # -----------------
+    def read(self, source: Callable[[], int]) -> int:
+        """One key read: from source (recorded if recording), or from the replay."""
+        if self.mode == REPLAYING:
+            return self._replay(source)
+        key = source()
+        if self.mode == RECORDING:
+            self._record(key)
+        return key
+
+    def _record(self, key: int) -> None:
+        at = clock.now() - self._t0
+        if key == NO_KEY:
+            self._idle += 1
+            self._idle_at = at
+            return
+        self._flush_idle()
+        self._file.write(_RECORD.pack(at, key, 1))
+        # Keys come at human speed; flushing each keeps the log useful after a crash
+        self._file.flush()
+
+    def _flush_idle(self) -> None:
+        if self._idle:
+            self._file.write(_RECORD.pack(self._idle_at, NO_KEY, self._idle))
+            self._idle = 0
+
+    def _replay(self, source: Callable[[], int]) -> int:
+        if not self._left:
+            if self._pos >= len(self._records):
+                self._finish_replay()
+                return source()
+            self._at, self._key, self._left = self._records[self._pos]
+            self._pos += 1
+        self._left -= 1
+        if not self._left:
+            # Catch game time up to the recording (exact on the instant clock)
+            ahead = self._t0 + self._at - clock.now()
+            if ahead > 0:
+                clock.sleep(ahead)
+        return self._key
+
+    def _finish_replay(self) -> None:
+        game_logger.info(f"Replay of {self.path} finished; input is live")
+        self.mode = OFF
+        self.on_live()
+
+
+input_log = InputLog()
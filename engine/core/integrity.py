@@ -0,0 +1,35 @@
+import hashlib
+from typing import BinaryIO
+
+DIGEST_SIZE = 32
+CHUNK_SIZE = 64 * 1024
+
+
+class IntegrityError(Exception):
+    """Raised when stored bytes do not match their recorded checksum."""
+
+
+def content_hash(data: bytes) -> str:
+    """Stable hex digest of data (unlike hash(), identical across processes)."""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def read_verified(f: BinaryIO, length: int, expected: str) -> bytes:
+    """
+    Read exactly length bytes from f, hashing them as they stream in.
+
+    Raises IntegrityError if the file is short or the digest does not match.
+    """
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    buf = bytearray()
+    remaining = length
+    while remaining > 0:
+        chunk = f.read(min(CHUNK_SIZE, remaining))
+        if not chunk:
+            raise IntegrityError(f"truncated: {length - remaining}/{length} bytes")
+        hasher.update(chunk)
+        buf += chunk
+        remaining -= len(chunk)
+    if hasher.hexdigest() != expected:
+        raise IntegrityError("checksum mismatch")
+    return bytes(buf)
@@ -1,15 +1,120 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+from contextlib import contextmanager
+
+# Logging never does I/O on the game thread: every logger hands its records
+# to a QueueHandler, and a QueueListener thread writes them out.
+#
+#   logs/fotd.log      human-readable log (everything but perf records)
+#   stderr             same, except while curses owns the screen
+#   logs/perf.jsonl    the "fotd.perf" channel, one JSON object per line:
+#                      {"t": unix time, "event": name, ...fields}
+#
+# perf() is the way in for measurements (scene transitions, input latency,
+# save counts); tools read perf.jsonl instead of parsing fotd.log.
+
+PERF_CHANNEL = "fotd.perf"
+
+game_logger = logging.getLogger("fotd")
+perf_logger = logging.getLogger(PERF_CHANNEL)
+
+_listener = None
+_console = None
+
+
+class _PerfOnly(logging.Filter):
+    def __init__(self, wanted: bool):
+        super().__init__()
+        self.wanted = wanted
+
+    def filter(self, record) -> bool:
+        return record.name.startswith(PERF_CHANNEL) == self.wanted
+
+
+class _ConsoleSwitch(logging.Filter):
+    # Read on the listener thread, so the caller's setting travels with the record
+    def __init__(self):
+        super().__init__()
+        self.enabled = True
+
+    def filter(self, record) -> bool:
+        return getattr(record, "to_console", True)
+
+
+class _GameQueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, records, console: _ConsoleSwitch):
+        super().__init__(records)
+        self.console = console
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.to_console = self.console.enabled
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record) -> str:
+        payload = {"t": round(record.created, 6), "event": record.getMessage()}
+        payload.update(getattr(record, "fields", {}))
+        return json.dumps(payload, separators=(",", ":"), default=str)
+
 
 def setup_logging():
+    global _listener, _console
+    if _listener is not None:
+        return
     os.makedirs("logs", exist_ok=True)
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler("logs/fotd.log"),
-            logging.StreamHandler()
-        ]
-    )
+    text = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
-game_logger = logging.getLogger("fotd")
+    file_handler = logging.FileHandler("logs/fotd.log")
+    file_handler.setFormatter(text)
+    file_handler.addFilter(_PerfOnly(False))
+
+    _console = _ConsoleSwitch()
+    console = logging.StreamHandler()
+    console.setFormatter(text)
+    console.addFilter(_PerfOnly(False))
+    console.addFilter(_console)
+
+    perf_handler = logging.FileHandler("logs/perf.jsonl")
+    perf_handler.setFormatter(JsonLinesFormatter())
+    perf_handler.addFilter(_PerfOnly(True))
+
+    records = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.handlers = [_GameQueueHandler(records, _console)]
+    _listener = logging.handlers.QueueListener(records, file_handler, console, perf_handler)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Write out everything queued and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+@contextmanager
+def console_muted():
+    """Keep log records off stderr, e.g. while curses draws the screen."""
+    if _console is None:
+        yield
+        return
+    previous = _console.enabled
+    _console.enabled = False
+    try:
+        yield
+    finally:
+        _console.enabled = previous
+
+
+def perf(event: str, **fields):
+    """One record on the perf channel (logs/perf.jsonl)."""
+    perf_logger.info(event, extra={"fields": fields})
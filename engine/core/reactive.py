@@ -0,0 +1,65 @@
+import time
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+# Field-level change subscriptions for GameState.
+#
+# GameState marks a field dirty when an event actually changes its value.
+# Nothing is delivered at that point: the UI calls GameState.flush_changes()
+# once per frame (every input poll) and each subscriber whose fields changed
+# gets a single callback with the new values, however many events landed in
+# between. flush_changes() is also rate limited to frame_interval.
+
+Callback = Callable[[Dict[str, object]], None]
+
+
+class StateWatchers:
+    __slots__ = ("frame_interval", "_subs", "_watched", "_dirty", "_last_flush")
+
+    def __init__(self, frame_interval: float = 1 / 30):
+        self.frame_interval = frame_interval
+        self._subs: List[Tuple[frozenset, Callback]] = []
+        self._watched: Set[str] = set()
+        self._dirty: Set[str] = set()
+        self._last_flush = 0.0
+
+    def subscribe(self, fields: Iterable[str], callback: Callback) -> Callable[[], None]:
+        """Call callback({field: value}) for changes to fields; returns an unsubscribe function."""
+        sub = (frozenset(fields), callback)
+        self._subs.append(sub)
+        self._watched |= sub[0]
+
+        def unsubscribe():
+            if sub in self._subs:
+                self._subs.remove(sub)
+                self._watched = set().union(*(fields for fields, _ in self._subs))
+
+        return unsubscribe
+
+    def mark(self, name: str) -> None:
+        if name in self._watched:
+            self._dirty.add(name)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._dirty)
+
+    def flush(self, state, force: bool = False) -> bool:
+        """Deliver batched changes; returns True if any callback ran."""
+        if not self._dirty:
+            return False
+        now = time.monotonic()
+        if not force and now - self._last_flush < self.frame_interval:
+            return False
+        self._last_flush = now
+        dirty, self._dirty = self._dirty, set()
+        delivered = False
+        for fields, callback in list(self._subs):
+            changed = fields & dirty
+            if changed:
+                callback({name: getattr(state, name) for name in changed})
+                delivered = True
+        return delivered
+
+    def __reduce__(self):
+        # Subscriptions hold UI callbacks; a copied or pickled state starts without them
+        return (StateWatchers, (self.frame_interval,))
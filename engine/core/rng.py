@@ -0,0 +1,66 @@
+import hashlib
+import random
+import secrets
+import threading
+from typing import Dict, Optional
+
+from engine.core.config import config
+
+# Seeded random streams. Each subsystem draws from its own random.Random,
+# derived from one master seed, so a run is reproducible from that seed and
+# streams never disturb each other: a glitch effect drawing ten more numbers
+# does not change which word a puzzle scrambles to next.
+#
+#   render     glitch characters and colours, flicker timing
+#   puzzle     TimedPuzzle scrambles
+#   audio      which sound a cue picks
+#   narrative  text the player is shown (startup tips)
+#
+# Modules take a stream once at import (rng.stream(RENDER)); reseed() reseeds
+# those same objects in place, so it is safe to call at any point. The seed
+# comes from config (performance.seed), main.py's --seed, or at random.
+
+RENDER = "render"
+PUZZLE = "puzzle"
+AUDIO = "audio"
+NARRATIVE = "narrative"
+STREAMS = (RENDER, PUZZLE, AUDIO, NARRATIVE)
+
+
+def derive_seed(seed: int, name: str) -> int:
+    """A stable per-stream seed (hash() is salted per process, so not that)."""
+    digest = hashlib.blake2b(f"{seed}:{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class RNGStreams:
+    def __init__(self, seed: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._streams: Dict[str, random.Random] = {}
+        self.seed = 0
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> int:
+        """Reseed every stream from seed (a fresh random one if None)."""
+        with self._lock:
+            self.seed = int(seed) if seed is not None else secrets.randbits(32)
+            for name, stream in self._streams.items():
+                stream.seed(derive_seed(self.seed, name))
+            return self.seed
+
+    def stream(self, name: str) -> random.Random:
+        if name not in STREAMS:
+            raise ValueError(f"Unknown RNG stream: {name}")
+        with self._lock:
+            if name not in self._streams:
+                self._streams[name] = random.Random(derive_seed(self.seed, name))
+            return self._streams[name]
+
+    def seeds(self) -> Dict[str, int]:
+        """Master seed plus each stream's derived seed, for logs and replays."""
+        out = {"master": self.seed}
+        out.update({name: derive_seed(self.seed, name) for name in STREAMS})
+        return out
+
+
+rng = RNGStreams(config.SEED)
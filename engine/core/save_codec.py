@@ -0,0 +1,98 @@
+import json
+import struct
+import zlib
+from typing import BinaryIO, Dict, List, Tuple
+
+from engine.core.history import EventStore, HistoryChunk, LazyHistory
+
+# Binary slot container:
+#   b"FOTL" | u8 container version | u8 flags | u32 header length | header JSON
+#   | body
+# body (the checksummed part):
+#   u32 state length | state JSON without history (zlib if FLAG_ZLIB)
+#   | u32 chunk count | history chunks (see engine.core.history)
+# The state block and the history block are separate so a load can build
+# GameState from the small state block and leave the history encoded.
+
+MAGIC = b"FOTL"
+CONTAINER_VERSION = 1
+FLAG_ZLIB = 1
+MAX_HISTORY_CHUNKS = 16
+
+_PREFIX = struct.Struct("<4sBBI")
+_U32 = struct.Struct("<I")
+
+
+def is_binary(lead: bytes) -> bool:
+    return lead[:len(MAGIC)] == MAGIC
+
+
+def _history_chunks(history, compress: bool) -> List[HistoryChunk]:
+    if isinstance(history, EventStore):
+        # Already columnar; no per-event pass needed
+        return [history.to_chunk(compress)] if history else []
+    if isinstance(history, LazyHistory) and not history.is_materialized:
+        chunks = list(history.chunks)
+        tail = history.tail
+        if tail:
+            chunks.append(HistoryChunk.from_events(tail, compress))
+        if len(chunks) <= MAX_HISTORY_CHUNKS:
+            return chunks
+        history = LazyHistory(chunks=chunks).materialize()
+    if not history:
+        return []
+    return [HistoryChunk.from_events(list(history), compress)]
+
+
+def encode_body(state: Dict, compress: bool = True) -> Tuple[bytes, int]:
+    """Encode a state snapshot; returns (body bytes, container flags)."""
+    flags = FLAG_ZLIB if compress else 0
+    head = {k: v for k, v in state.items() if k != "history"}
+    state_bytes = json.dumps(head, separators=(",", ":")).encode("utf-8")
+    if compress:
+        state_bytes = zlib.compress(state_bytes)
+
+    chunks = _history_chunks(state.get("history", []), compress)
+    parts = [_U32.pack(len(state_bytes)), state_bytes, _U32.pack(len(chunks))]
+    parts.extend(chunk.pack() for chunk in chunks)
+    return b"".join(parts), flags
+
+
+def decode_body(body: bytes, flags: int) -> Dict:
+    """Decode a body; history comes back as an undecoded LazyHistory."""
+    (state_len,) = _U32.unpack_from(body, 0)
+    pos = _U32.size
+    state_bytes = body[pos:pos + state_len]
+    pos += state_len
+    if flags & FLAG_ZLIB:
+        state_bytes = zlib.decompress(state_bytes)
+    state = json.loads(state_bytes)
+
+    (chunk_count,) = _U32.unpack_from(body, pos)
+    pos += _U32.size
+    chunks = []
+    for _ in range(chunk_count):
+        chunk, pos = HistoryChunk.unpack_from(body, pos)
+        chunks.append(chunk)
+    state["history"] = LazyHistory(chunks=chunks)
+    return state
+
+
+def write_container(f: BinaryIO, header: Dict, body: bytes, flags: int) -> int:
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    prefix = _PREFIX.pack(MAGIC, CONTAINER_VERSION, flags, len(header_bytes))
+    f.write(prefix)
+    f.write(header_bytes)
+    f.write(body)
+    return len(prefix) + len(header_bytes) + len(body)
+
+
+def read_container_header(f: BinaryIO) -> Tuple[Dict, int, int]:
+    """Read the prefix and header; returns (header, flags, bytes consumed)."""
+    magic, version, flags, header_len = _PREFIX.unpack(f.read(_PREFIX.size))
+    if magic != MAGIC:
+        raise ValueError("not a binary save")
+    if version != CONTAINER_VERSION:
+        raise ValueError(f"unsupported container version {version}")
+    header = json.loads(f.read(header_len))
+    return header, flags, _PREFIX.size + header_len
@@ -0,0 +1,141 @@
+import time
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
+
+from engine.core.config import config
+from engine.core.logger import game_logger
+from engine.core.save_journal import REBASE
+from engine.core.save_manager import EncodedState, SaveManager, save_journal, validate_slot
+from engine.core.state_manager import GameState
+
+
+class SaveCoordinator:
+    """
+    Single entry point for autosaves during a session.
+
+    Scenes and the scene loop both ask for saves around a transition; the
+    coordinator drops requests whose snapshot matches what is already on disk
+    for that slot, and holds back bursts that arrive inside the debounce
+    window until the next request or an explicit flush().
+
+    In journal mode (saves.mode = "journal") the duplicate check is an empty
+    delta, writes are journal appends, and the base snapshot is rewritten
+    only when the journal needs compacting.
+    """
+
+    def __init__(self, debounce_seconds: float = 2.0):
+        self.debounce_seconds = debounce_seconds
+        self.active_slot: Optional[int] = None
+        self.write_count = 0
+        self.coalesced_count = 0
+        self._last_key: Dict[int, Tuple[str, str]] = {}
+        self._last_write_time: Dict[int, float] = {}
+        self._pending: Dict[int, Callable[[], bool]] = {}
+
+    def bind_slot(self, slot: int) -> None:
+        """Set the slot used by scene-level saves for the rest of the session."""
+        self.active_slot = validate_slot(slot)
+
+    def request_save(
+        self,
+        game_state: GameState,
+        scene_id: str,
+        slot: Optional[int] = None,
+        force: bool = False,
+    ) -> bool:
+        """
+        Ask for game_state to be saved at scene_id.
+
+        Returns True when the slot is (or will be, after flush) up to date.
+        force skips the debounce window but never the duplicate check.
+        """
+        if slot is None:
+            slot = self.active_slot
+        try:
+            validate_slot(slot)
+        except ValueError as e:
+            game_logger.warning(f"Save request rejected: {e}")
+            return False
+
+        if config.SAVE_MODE == "journal":
+            return self._request_journal(game_state, scene_id, slot, force)
+
+        # Serialized once: the digest is the duplicate check and the bytes
+        # are what gets written.
+        encoded = SaveManager.encode_state(game_state.snapshot())
+        key = (scene_id, encoded.checksum)
+
+        if self._last_key.get(slot) == key:
+            self._pending.pop(slot, None)
+            self.coalesced_count += 1
+            return True
+
+        return self._submit(slot, partial(self._write, slot, encoded, scene_id), force)
+
+    def _request_journal(self, game_state: GameState, scene_id: str, slot: int, force: bool) -> bool:
+        record = save_journal.diff(slot, game_state, scene_id)
+        if record is None:
+            self._pending.pop(slot, None)
+            self.coalesced_count += 1
+            return True
+        if record is REBASE:
+            self._pending.pop(slot, None)
+            return self._write_base(slot, game_state, scene_id)
+        return self._submit(slot, partial(self._append, slot, record, game_state), force)
+
+    def _submit(self, slot: int, write: Callable[[], bool], force: bool) -> bool:
+        last = self._last_write_time.get(slot)
+        if not force and last is not None and time.monotonic() - last < self.debounce_seconds:
+            if slot in self._pending:
+                self.coalesced_count += 1
+            self._pending[slot] = write
+            return True
+
+        self._pending.pop(slot, None)
+        return write()
+
+    def flush(self) -> None:
+        """Write out every save held back by the debounce window."""
+        for slot, write in list(self._pending.items()):
+            del self._pending[slot]
+            write()
+
+    def forget(self, slot: int) -> None:
+        """Drop cached knowledge of slot, e.g. after its save file was deleted."""
+        self._last_key.pop(slot, None)
+        self._last_write_time.pop(slot, None)
+        self._pending.pop(slot, None)
+
+    def delete(self, slot: int) -> None:
+        SaveManager.delete_save(slot=slot)
+        self.forget(slot)
+
+    def _write(self, slot: int, encoded: EncodedState, scene_id: str) -> bool:
+        ok = SaveManager.write_encoded(encoded, scene_id, slot=slot)
+        if ok:
+            self.write_count += 1
+            self._last_key[slot] = (scene_id, encoded.checksum)
+            self._last_write_time[slot] = time.monotonic()
+        return ok
+
+    def _write_base(self, slot: int, game_state: GameState, scene_id: str) -> bool:
+        encoded = SaveManager.encode_state(game_state.snapshot())
+        if not self._write(slot, encoded, scene_id):
+            return False
+        save_journal.start(slot, encoded.checksum, scene_id, game_state)
+        return True
+
+    def _append(self, slot: int, record: Dict, game_state: GameState) -> bool:
+        if not SaveManager.append_journal(slot, record):
+            return False
+        self.write_count += 1
+        self._last_write_time[slot] = time.monotonic()
+        if save_journal.needs_compaction(slot):
+            # Fold the journal into a new base. Only safe when the live state
+            # is what the record described, i.e. not from a delayed flush.
+            if save_journal.diff(slot, game_state, record["scene_id"]) is None:
+                return self._write_base(slot, game_state, record["scene_id"])
+        return True
+
+
+save_coordinator = SaveCoordinator()
@@ -0,0 +1,117 @@
+import json
+import os
+from typing import Callable, Dict, Optional
+
+INDEX_VERSION = 1
+
+
+class SlotIndex:
+    """
+    Compact per-slot summary stored next to the save files.
+
+    Menus only need the version, timestamp, scene and fragment count of each
+    slot, so those are kept in one small file that is rewritten on every save
+    instead of opening every slot (and its full history) to draw a menu.
+    Entries are checked against the slot file's size with a cheap stat and
+    rebuilt from the slot itself when they are missing or stale.
+    """
+
+    def __init__(self, saves_dir: str, filename: str = "index.json"):
+        self.saves_dir = saves_dir
+        self.path = os.path.join(saves_dir, filename)
+        self._entries: Optional[Dict[str, Dict]] = None
+
+    @staticmethod
+    def make_entry(save_data: Dict, size: int) -> Dict:
+        """Build an entry from a slot header, or from a full legacy save dict."""
+        if "fragments" in save_data:
+            fragments = save_data["fragments"]
+        else:
+            fragments = len(save_data.get("state", {}).get("identity_fragments", []))
+        checksum = save_data.get("checksum")
+        return {
+            "version": save_data.get("version"),
+            "timestamp": save_data.get("timestamp"),
+            "scene_id": save_data.get("scene_id"),
+            "fragments": fragments,
+            "size": size,
+            "checksum": checksum if isinstance(checksum, str) else None,
+        }
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                if data.get("index_version") != INDEX_VERSION:
+                    raise ValueError("index version mismatch")
+                self._entries = dict(data.get("slots", {}))
+            except (OSError, ValueError, AttributeError):
+                self._entries = {}
+        return self._entries
+
+    def _store(self) -> None:
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {"index_version": INDEX_VERSION, "slots": self._load()},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Slot index write failed: {e}")
+
+    def get(self, slot: int) -> Optional[Dict]:
+        return self._load().get(str(slot))
+
+    def update(self, slot: int, entry: Dict) -> None:
+        self._load()[str(slot)] = entry
+        self._store()
+
+    def remove(self, slot: int) -> None:
+        if self._load().pop(str(slot), None) is not None:
+            self._store()
+
+    def summaries(
+        self,
+        max_slots: int,
+        slot_path: Callable[[int], str],
+        read_slot: Callable[[int], Optional[Dict]],
+    ) -> list[Optional[Dict]]:
+        """
+        Return one summary per slot (None for empty slots).
+
+        read_slot is only called for slots whose index entry is missing or
+        no longer matches the file on disk; it may return just the header.
+        """
+        entries = self._load()
+        summaries = []
+        dirty = False
+        for slot in range(1, max_slots + 1):
+            key = str(slot)
+            try:
+                size = os.path.getsize(slot_path(slot))
+            except OSError:
+                if entries.pop(key, None) is not None:
+                    dirty = True
+                summaries.append(None)
+                continue
+
+            entry = entries.get(key)
+            if entry is None or entry.get("size") != size:
+                save_data = read_slot(slot)
+                if save_data is None:
+                    entries.pop(key, None)
+                    dirty = True
+                    summaries.append(None)
+                    continue
+                entry = self.make_entry(save_data, size)
+                entries[key] = entry
+                dirty = True
+            summaries.append(entry)
+
+        if dirty:
+            self._store()
+        return summaries
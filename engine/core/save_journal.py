@@ -0,0 +1,201 @@
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+from engine.core.history import EventStore, events_since, history_position
+
+# Journal file layout (slot_<n>.journal, JSON lines):
+#   line 1 : {"base": <checksum of the slot file this journal extends>}
+#   then   : one record per save, holding only what changed since the
+#            previous record:
+#            {"t", "scene_id", "fragment_count",
+#             "set": {field: value},          scalar fields that changed
+#             "fragments": [ids],             newly collected fragments
+#             "relationships": {npc: delta},  relationship changes
+#             "history": [events]}            new history events
+# A torn final line (crash mid-append) is ignored on load.
+
+SCALAR_FIELDS = (
+    "corruption_level",
+    "stability",
+    "current_node_id",
+    "puzzles_solved",
+    "puzzles_failed",
+    "nodes_visited",
+    "playtime_seconds",
+)
+
+REBASE = "rebase"
+
+
+class _Shadow:
+    """What the slot on disk (base + journal) currently holds."""
+
+    __slots__ = ("base", "scene_id", "scalars", "fragments", "relationships", "history_len", "records")
+
+    def __init__(self, base: str, scene_id: str, state, records: int = 0):
+        get = state.get if isinstance(state, dict) else lambda name: getattr(state, name)
+        self.base = base
+        self.scene_id = scene_id
+        self.scalars = {name: get(name) for name in SCALAR_FIELDS}
+        self.fragments = list(get("identity_fragments"))
+        self.relationships = dict(get("npc_relationships"))
+        self.history_len = history_position(get("history"))
+        self.records = records
+
+
+def apply_records(state: Dict, records: List[Dict]) -> Dict:
+    """Fold journal records into a state snapshot dict, in place."""
+    for record in records:
+        state.update(record.get("set", {}))
+        state["identity_fragments"].extend(record.get("fragments", []))
+        relationships = state["npc_relationships"]
+        for npc, delta in record.get("relationships", {}).items():
+            relationships[npc] = relationships.get(npc, 0) + delta
+        state["history"].extend(record.get("history", []))
+    return state
+
+
+class SaveJournal:
+    """
+    Append-only delta log kept beside a slot's base snapshot.
+
+    After the base is written, each save appends one record with only the
+    fields, fragments, relationship deltas and history events that changed
+    since the last write, so save cost follows the size of the change rather
+    than the length of the playthrough. compact_every bounds how many records
+    pile up before the caller should fold them into a new base.
+    """
+
+    def __init__(self, path_for: Callable[[int], str], compact_every: int = 32):
+        self.path_for = path_for
+        self.compact_every = compact_every
+        self._shadows: Dict[int, _Shadow] = {}
+
+    def is_tracking(self, slot: int) -> bool:
+        return slot in self._shadows
+
+    def needs_compaction(self, slot: int) -> bool:
+        shadow = self._shadows.get(slot)
+        return shadow is not None and shadow.records >= self.compact_every
+
+    def start(self, slot: int, base_checksum: str, scene_id: str, state) -> bool:
+        """Begin a fresh journal on top of a base snapshot just written."""
+        try:
+            with open(self.path_for(slot), "w") as f:
+                f.write(json.dumps({"base": base_checksum}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"Journal write failed: {e}")
+            self._shadows.pop(slot, None)
+            return False
+        self._shadows[slot] = _Shadow(base_checksum, scene_id, state)
+        return True
+
+    def track(self, slot: int, base_checksum: str, scene_id: str, state: Dict, records: int) -> None:
+        """Resume tracking a slot whose base and journal were just loaded."""
+        self._shadows[slot] = _Shadow(base_checksum, scene_id, state, records)
+
+    def discard(self, slot: int) -> None:
+        self._shadows.pop(slot, None)
+        path = self.path_for(slot)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def diff(self, slot: int, game_state, scene_id: str):
+        """
+        Record of what changed since the last write to slot.
+
+        Returns None when nothing changed and REBASE when the change cannot
+        be expressed as a delta (untracked slot, rewritten history or
+        fragments).
+        """
+        shadow = self._shadows.get(slot)
+        if shadow is None:
+            return REBASE
+
+        fragments = game_state.identity_fragments
+        known = len(shadow.fragments)
+        history = game_state.history
+        if fragments[:known] != shadow.fragments or history_position(history) < shadow.history_len:
+            return REBASE
+        if isinstance(history, EventStore) and history.evicted > shadow.history_len:
+            return REBASE  # the ring buffer dropped events the journal has not written yet
+
+        record = {}
+        changed = {
+            name: getattr(game_state, name)
+            for name in SCALAR_FIELDS
+            if getattr(game_state, name) != shadow.scalars[name]
+        }
+        if changed:
+            record["set"] = changed
+        if len(fragments) > known:
+            record["fragments"] = fragments[known:]
+        relationships = {
+            npc: value - shadow.relationships.get(npc, 0)
+            for npc, value in game_state.npc_relationships.items()
+            if value != shadow.relationships.get(npc, 0)
+        }
+        if relationships:
+            record["relationships"] = relationships
+        if history_position(history) > shadow.history_len:
+            record["history"] = events_since(history, shadow.history_len)
+
+        if not record and scene_id == shadow.scene_id:
+            return None
+        record["t"] = time.time()
+        record["scene_id"] = scene_id
+        record["fragment_count"] = len(fragments)
+        return record
+
+    def append(self, slot: int, record: Dict) -> bool:
+        shadow = self._shadows[slot]
+        try:
+            with open(self.path_for(slot), "a") as f:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                # Durable before the caller drops the scene's WAL
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"Journal write failed: {e}")
+            return False
+
+        shadow.scalars.update(record.get("set", {}))
+        shadow.fragments.extend(record.get("fragments", []))
+        for npc, delta in record.get("relationships", {}).items():
+            shadow.relationships[npc] = shadow.relationships.get(npc, 0) + delta
+        shadow.history_len += len(record.get("history", []))
+        shadow.records += 1
+        shadow.scene_id = record["scene_id"]
+        return True
+
+    def read(self, slot: int, base_checksum: Optional[str]) -> List[Dict]:
+        """Records for slot, or [] if there is no journal for this exact base."""
+        path = self.path_for(slot)
+        if not os.path.exists(path):
+            return []
+        records = []
+        try:
+            with open(path, "rb") as f:
+                head = json.loads(f.readline() or b"{}")
+                if head.get("base") != base_checksum:
+                    return []
+                good_end = f.tell()
+                for line in iter(f.readline, b""):
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated record")
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # Torn tail from an interrupted append: cut it off so
+                        # later appends are not stranded behind it.
+                        f.close()
+                        os.truncate(path, good_end)
+                        break
+                    good_end = f.tell()
+        except (OSError, ValueError) as e:
+            print(f"Journal read failed: {e}")
+        return records
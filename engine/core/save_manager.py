@@ -2,36 +2,249 @@
 import json
 import os
 import time
+from dataclasses import dataclass
 from typing import Dict, Optional
+from engine.core.config import config
+from engine.core.history import EventStore, LazyHistory
+from engine.core.integrity import IntegrityError, content_hash, read_verified
+from engine.core import save_codec
+from engine.core.save_index import SlotIndex
+from engine.core.save_journal import SaveJournal, apply_records
 from engine.core.state_manager import GameState
+from engine.core.trace import traced
 
-SAVE_VERSION = "1.1.0"
+SAVE_VERSION = "1.2.0"
+LEGACY_SAVE_VERSION = "1.1.0"
 SAVES_DIR = "saves"
 os.makedirs(SAVES_DIR, exist_ok=True)
 
+slot_index = SlotIndex(SAVES_DIR)
+
+# Slot file layout (1.2.0), selected by the saves.format config key:
+#   "json":
+#     line 1 : compact JSON header, newline terminated
+#              {"version", "timestamp", "scene_id", "fragments", "size", "checksum"}
+#     rest   : compact JSON of the state snapshot, exactly `size` bytes,
+#              whose blake2b digest is `checksum`
+#   "binary":
+#     length-prefixed container from engine.core.save_codec, same header
+#     fields, `size`/`checksum` covering the container body
+# Both live in slot_<n>.sav and are told apart by the container magic.
+# With saves.mode = "journal", slot_<n>.journal holds deltas on top of the
+# .sav base (see engine.core.save_journal); loading folds them back in.
+# 1.1.0 slots are single pretty-printed JSON objects in slot_<n>.json.
+
+
+def slot_path(slot: int) -> str:
+    return os.path.join(SAVES_DIR, f"slot_{slot}.sav")
+
+
+def journal_path(slot: int) -> str:
+    return os.path.join(SAVES_DIR, f"slot_{slot}.journal")
+
+
+def legacy_slot_path(slot: int) -> str:
+    return os.path.join(SAVES_DIR, f"slot_{slot}.json")
+
+
+save_journal = SaveJournal(journal_path, compact_every=config.JOURNAL_COMPACT_EVERY)
+
+
+def existing_slot_path(slot: int) -> str:
+    path = slot_path(slot)
+    if os.path.exists(path):
+        return path
+    return legacy_slot_path(slot)
+
+
+def validate_slot(slot, max_slots: Optional[int] = None) -> int:
+    """Return slot unchanged if it is a usable slot number, else raise ValueError."""
+    if max_slots is None:
+        max_slots = config.MAX_SLOTS
+    if isinstance(slot, bool) or not isinstance(slot, int):
+        raise ValueError(f"Invalid save slot: {slot!r}")
+    if not 1 <= slot <= max_slots:
+        raise ValueError(f"Save slot {slot} out of range 1..{max_slots}")
+    return slot
+
+
+@dataclass(frozen=True)
+class EncodedState:
+    """A state snapshot serialized once, with the digest of those exact bytes."""
+    body: bytes
+    checksum: str
+    fragments: int
+    encoding: str = "json"
+    flags: int = 0
+
+
 class SaveManager:
+    @staticmethod
+    @traced("save")
+    def encode_state(state: Dict, encoding: Optional[str] = None) -> EncodedState:
+        if encoding is None:
+            encoding = config.SAVE_FORMAT
+        fragments = len(state.get("identity_fragments", []))
+
+        if encoding == "binary":
+            body, flags = save_codec.encode_body(state, compress=config.COMPRESS_SAVES)
+            return EncodedState(body, content_hash(body), fragments, "binary", flags)
+
+        history = state.get("history")
+        if isinstance(history, (EventStore, LazyHistory)):
+            state = dict(state, history=list(history))
+        body = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        return EncodedState(body, content_hash(body), fragments)
+
     @staticmethod
     def save_game(game_state: GameState, scene_id: str, slot: int = 1) -> bool:
-        save_data = {
+        return SaveManager.write_snapshot(game_state.snapshot(), scene_id, slot=slot)
+
+    @staticmethod
+    def write_snapshot(state: Dict, scene_id: str, slot: int = 1) -> bool:
+        return SaveManager.write_encoded(SaveManager.encode_state(state), scene_id, slot=slot)
+
+    @staticmethod
+    @traced("save")
+    def write_encoded(encoded: EncodedState, scene_id: str, slot: int = 1) -> bool:
+        try:
+            validate_slot(slot)
+        except ValueError as e:
+            print(f"Save failed: {e}")
+            return False
+
+        header = {
             "version": SAVE_VERSION,
             "timestamp": time.time(),
             "scene_id": scene_id,
-            "state": game_state.snapshot(),
-            "checksum": hash(str(game_state.snapshot()))
+            "fragments": encoded.fragments,
+            "size": len(encoded.body),
+            "checksum": encoded.checksum,
         }
 
-        path = os.path.join(SAVES_DIR, f"slot_{slot}.json")
+        path = slot_path(slot)
+        tmp_path = path + ".tmp"
         try:
-            with open(path, "w") as f:
-                json.dump(save_data, f, indent=2)
+            with open(tmp_path, "wb") as f:
+                if encoded.encoding == "binary":
+                    size = save_codec.write_container(f, header, encoded.body, encoded.flags)
+                else:
+                    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n"
+                    f.write(header_bytes)
+                    f.write(encoded.body)
+                    size = len(header_bytes) + len(encoded.body)
+                # On disk before the rename, so a power cut leaves the old
+                # save or the new one, never an empty file
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            legacy = legacy_slot_path(slot)
+            if os.path.exists(legacy):
+                os.remove(legacy)
+            # A new base makes any journal on the old one meaningless
+            save_journal.discard(slot)
+            slot_index.update(slot, SlotIndex.make_entry(header, size))
             return True
         except Exception as e:
             print(f"Save failed: {e}")
             return False
 
     @staticmethod
+    @traced("save")
+    def append_journal(slot: int, record: Dict) -> bool:
+        """Append a delta record to slot's journal and refresh its index entry."""
+        if not save_journal.append(slot, record):
+            return False
+        entry = slot_index.get(slot)
+        if entry is not None:
+            entry = dict(entry, scene_id=record["scene_id"], fragments=record["fragment_count"], timestamp=record["t"])
+            slot_index.update(slot, entry)
+        return True
+
+    @staticmethod
+    @traced("save")
+    def read_header(slot: int = 1) -> Optional[Dict]:
+        """
+        Read and sanity-check only the header of a slot.
+
+        Confirms the version and that the body on disk has the recorded size,
+        without reading or hashing the body itself.
+        """
+        path = slot_path(slot)
+        if not os.path.exists(path):
+            return SaveManager._load_legacy(slot)
+
+        try:
+            with open(path, "rb") as f:
+                header, _, consumed = SaveManager._read_slot_header(f)
+            if header.get("version") != SAVE_VERSION:
+                print("Save incompatible with current version")
+                return None
+            if os.path.getsize(path) != consumed + header["size"]:
+                print("Load failed: save body size does not match header")
+                return None
+            records = save_journal.read(slot, header["checksum"])
+            if records:
+                last = records[-1]
+                header = dict(header, scene_id=last["scene_id"], fragments=last["fragment_count"], timestamp=last["t"])
+            return header
+        except Exception as e:
+            print(f"Load failed: {e}")
+            return None
+
+    @staticmethod
+    @traced("save")
     def load_game(slot: int = 1) -> Optional[Dict]:
-        path = os.path.join(SAVES_DIR, f"slot_{slot}.json")
+        path = slot_path(slot)
+        if not os.path.exists(path):
+            return SaveManager._load_legacy(slot)
+
+        try:
+            with open(path, "rb") as f:
+                header, flags, _ = SaveManager._read_slot_header(f)
+
+                # Version check (future-proof)
+                if header.get("version") != SAVE_VERSION:
+                    print("Save incompatible with current version")
+                    return None
+
+                body = read_verified(f, header["size"], header["checksum"])
+                if f.read(1):
+                    raise IntegrityError("trailing data after save body")
+
+            data = dict(header)
+            if flags is None:
+                data["state"] = json.loads(body)
+            else:
+                data["state"] = save_codec.decode_body(body, flags)
+
+            records = save_journal.read(slot, header["checksum"])
+            if records:
+                apply_records(data["state"], records)
+                data["scene_id"] = records[-1]["scene_id"]
+                data["timestamp"] = records[-1]["t"]
+            if config.SAVE_MODE == "journal":
+                save_journal.track(slot, header["checksum"], data["scene_id"], data["state"], len(records))
+            return data
+        except IntegrityError as e:
+            print(f"Save corrupted: {e}")
+            return None
+        except Exception as e:
+            print(f"Load failed: {e}")
+            return None
+
+    @staticmethod
+    def _read_slot_header(f):
+        """Returns (header, container flags or None for text, bytes consumed)."""
+        if save_codec.is_binary(f.peek(len(save_codec.MAGIC))):
+            return save_codec.read_container_header(f)
+        header_bytes = f.readline()
+        return json.loads(header_bytes), None, len(header_bytes)
+
+    @staticmethod
+    def _load_legacy(slot: int) -> Optional[Dict]:
+        # 1.1.0 checksums used the per-process salted hash() and cannot be verified.
+        path = legacy_slot_path(slot)
         if not os.path.exists(path):
             return None
 
@@ -39,8 +252,7 @@ class SaveManager:
             with open(path, "r") as f:
                 data = json.load(f)
 
-            # Version check (future-proof)
-            if data.get("version") != SAVE_VERSION:
+            if data.get("version") != LEGACY_SAVE_VERSION:
                 print("Save incompatible with current version")
                 return None
 
@@ -51,12 +263,29 @@ class SaveManager:
 
     @staticmethod
     def delete_save(slot: int = 1):
-        path = os.path.join(SAVES_DIR, f"slot_{slot}.json")
-        if os.path.exists(path):
-            os.remove(path)
+        for path in (slot_path(slot), legacy_slot_path(slot)):
+            if os.path.exists(path):
+                os.remove(path)
+        save_journal.discard(slot)
+        slot_index.remove(slot)
+
+    @staticmethod
+    def get_slot_summaries(max_slots: Optional[int] = None) -> list[Optional[Dict]]:
+        """
+        Menu-sized view of every slot, read from the slot index.
+
+        Each entry has version, timestamp, scene_id, fragments and size; use
+        load_game() once a slot is actually picked. Stale entries are rebuilt
+        from slot headers only.
+        """
+        if max_slots is None:
+            max_slots = config.MAX_SLOTS
+        return slot_index.summaries(max_slots, existing_slot_path, SaveManager.read_header)
 
     @staticmethod
-    def get_all_saves(max_slots: int = 6) -> list[Optional[Dict]]:
+    def get_all_saves(max_slots: Optional[int] = None) -> list[Optional[Dict]]:
+        if max_slots is None:
+            max_slots = config.MAX_SLOTS
         saves = []
         for i in range(1, max_slots + 1):
             saves.append(SaveManager.load_game(slot=i))
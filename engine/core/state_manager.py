@@ -1,72 +1,246 @@
 # engine/state_manager.py - COMPLETE REPLACEMENT
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional
-import time
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, List, Optional, Tuple
 import json
 
+from engine.core.clock import clock
+from engine.core.config import config
+from engine.core.effects import apply_effects
+from engine.core.history import EventStore
+from engine.core.reactive import StateWatchers
+
+# Called as hook(op, *args) after every GameState mutation (see engine.core.wal)
+mutation_hooks: List[Callable[..., None]] = []
+
+# Every mutation is recorded as a history event and the state is a fold over
+# them. A checkpoint of the plain fields is kept every CHECKPOINT_EVERY
+# events, so any held position can be rebuilt by folding at most that many.
+CHECKPOINT_EVERY = 256
+
+# Fields that live only in memory and are never part of a snapshot
+TRANSIENT = {"transient": True}
+
 def clamp(value: int, minimum: int, maximum: int) -> int:
     return max(minimum, min(maximum, value))
 
-@dataclass
+def _notify(op: str, *args) -> None:
+    for hook in mutation_hooks:
+        hook(op, *args)
+
+def new_history() -> EventStore:
+    return EventStore(maxlen=config.HISTORY_LIMIT)
+
+@dataclass(slots=True)
 class GameState:
     identity_fragments: List[str] = field(default_factory=list)
     corruption_level: int = 0
     stability: int = 3
     npc_relationships: Dict[str, int] = field(default_factory=dict)
     current_node_id: str = "intro"
-    history: List[Dict] = field(default_factory=list)
+    history: EventStore = field(default_factory=new_history)
     puzzles_solved: int = 0
     puzzles_failed: int = 0
     nodes_visited: int = 0
     playtime_seconds: float = 0.0
+    checkpoints: List[Tuple[int, Dict]] = field(default_factory=list, repr=False, compare=False, metadata=TRANSIENT)
+    watchers: StateWatchers = field(default_factory=StateWatchers, repr=False, compare=False, metadata=TRANSIENT)
+
+    def __post_init__(self):
+        # Snapshots and old saves hand in a plain list or a LazyHistory
+        if not isinstance(self.history, EventStore) or self.history.maxlen != config.HISTORY_LIMIT:
+            self.history = EventStore.from_history(self.history, maxlen=config.HISTORY_LIMIT)
+        elif self.history.is_frozen:
+            # A snapshot's view may be handed to several states; each gets its own
+            self.history = self.history.snapshot()
+        if not self.checkpoints:
+            self._checkpoint()
 
     # STAT MANIPULATION - Type Safe
     def apply_stability(self, delta: int) -> None:
-        old = self.stability
-        self.stability = clamp(self.stability + delta, 0, 10)
-        self.history.append({
+        self.apply_event({
             "type": "stability",
             "delta": delta,
-            "old": old,
-            "new": self.stability,
-            "timestamp": time.time()
+            "old": self.stability,
+            "new": clamp(self.stability + delta, 0, 10),
+            "timestamp": clock.now()
         })
+        _notify("stability", delta)
 
     def apply_corruption(self, delta: int) -> None:
-        old = self.corruption_level
-        self.corruption_level = clamp(self.corruption_level + delta, 0, 10)
-        self.history.append({
+        self.apply_event({
             "type": "corruption",
             "delta": delta,
-            "old": old,
-            "new": self.corruption_level,
-            "timestamp": time.time()
+            "old": self.corruption_level,
+            "new": clamp(self.corruption_level + delta, 0, 10),
+            "timestamp": clock.now()
         })
+        _notify("corruption", delta)
 
     def add_fragment(self, fragment_id: str) -> bool:
         if fragment_id not in self.identity_fragments:
-            self.identity_fragments.append(fragment_id)
-            self.history.append({
+            self.apply_event({
                 "type": "fragment",
                 "fragment_id": fragment_id,
-                "timestamp": time.time()
+                "timestamp": clock.now()
             })
+            _notify("fragment", fragment_id)
             return True
         return False
 
     def relationship_delta(self, npc: str, delta: int) -> None:
-        self.npc_relationships[npc] = self.npc_relationships.get(npc, 0) + delta
+        self.apply_event({
+            "type": "relationship",
+            "npc": npc,
+            "delta": delta,
+            "value": self.npc_relationships.get(npc, 0) + delta,
+            "timestamp": clock.now()
+        })
+        _notify("relationship", npc, delta)
+
+    def record_puzzle(self, success: bool) -> None:
+        self.apply_event({"type": "puzzle", "success": bool(success), "timestamp": clock.now()})
+        _notify("puzzle", success)
+
+    def enter_node(self, node_id: str) -> None:
+        self.apply_event({"type": "node", "node_id": node_id, "timestamp": clock.now()})
+        _notify("node", node_id)
+
+    # EVENT SOURCING
+    def apply_event(self, event: Dict) -> None:
+        """Fold one event into the state and record it in history."""
+        self._fold(event)
+        self.history.append(event)
+        if self.history.total - self.checkpoints[-1][0] >= CHECKPOINT_EVERY:
+            self._checkpoint()
+
+    def _fold(self, event: Dict) -> None:
+        kind = event.get("type")
+        mark = self.watchers.mark
+        if kind == "stability":
+            if self.stability != event["new"]:
+                self.stability = event["new"]
+                mark("stability")
+        elif kind == "corruption":
+            if self.corruption_level != event["new"]:
+                self.corruption_level = event["new"]
+                mark("corruption_level")
+        elif kind == "fragment":
+            if event["fragment_id"] not in self.identity_fragments:
+                self.identity_fragments.append(event["fragment_id"])
+                mark("identity_fragments")
+        elif kind == "relationship":
+            self.npc_relationships[event["npc"]] = event["value"]
+            mark("npc_relationships")
+        elif kind == "puzzle":
+            if event["success"]:
+                self.puzzles_solved += 1
+                mark("puzzles_solved")
+            else:
+                self.puzzles_failed += 1
+                mark("puzzles_failed")
+        elif kind == "node":
+            self.current_node_id = event["node_id"]
+            self.nodes_visited += 1
+            mark("current_node_id")
+            mark("nodes_visited")
+        # Anything else is informational and changes no field
+
+    # CHANGE SUBSCRIPTIONS (see engine.core.reactive)
+    def subscribe(self, fields, callback) -> Callable[[], None]:
+        return self.watchers.subscribe(fields, callback)
+
+    def flush_changes(self, force: bool = False) -> bool:
+        """Deliver batched field changes; call once per frame."""
+        return self.watchers.flush(self, force=force)
+
+    def _fields(self) -> Dict:
+        # Plain fields, detached from the live containers
+        data = {}
+        for f in fields(self):
+            if f.name == "history" or f.metadata.get("transient"):
+                continue
+            value = getattr(self, f.name)
+            data[f.name] = value.copy() if isinstance(value, (list, dict)) else value
+        return data
+
+    def _checkpoint(self) -> None:
+        position = self.history.total
+        evicted = self.history.evicted
+        # Checkpoints before the ring buffer's window can no longer be folded forward
+        while len(self.checkpoints) > 1 and self.checkpoints[1][0] <= evicted:
+            self.checkpoints.pop(0)
+        self.checkpoints.append((position, self._fields()))
+
+    def state_at(self, position: int) -> "GameState":
+        """
+        The state as it was when history.total was position, rebuilt from the
+        nearest checkpoint. Raises ValueError for positions no longer held.
+        """
+        if not self.history.evicted <= position <= self.history.total:
+            raise ValueError(f"history position {position} is not held")
+        i = bisect_right(self.checkpoints, position, key=lambda c: c[0]) - 1
+        if i < 0 or self.checkpoints[i][0] < self.history.evicted:
+            raise ValueError(f"no checkpoint at or before history position {position}")
+
+        base, data = self.checkpoints[i]
+        past = GameState(**GameState._detach(data), history=self.history.snapshot(stop=base),
+                         checkpoints=self.checkpoints[:i + 1])
+        for event in self.history.since(base)[:position - base]:
+            past._fold(event)
+        past.history = self.history.snapshot(stop=position)
+        return past
+
+    def rewind(self, position: int) -> None:
+        """Roll this state back to history position; later events are dropped."""
+        past = self.state_at(position)
+        for f in fields(self):
+            if f.name == "watchers":
+                continue
+            value = getattr(past, f.name)
+            if f.name != "history" and value != getattr(self, f.name):
+                self.watchers.mark(f.name)
+            setattr(self, f.name, value)
+        _notify("rewind", position)
+
+    @classmethod
+    def from_events(cls, events, **initial) -> "GameState":
+        """Fold events onto a fresh state (or one built from initial fields)."""
+        state = cls(**initial)
+        for event in events:
+            state.apply_event(event)
+        return state
+
+    @staticmethod
+    def _detach(data: Dict) -> Dict:
+        return {k: v.copy() if isinstance(v, (list, dict)) else v for k, v in data.items()}
 
     # UTILITY
     def snapshot(self) -> Dict:
-        return asdict(self)
+        """
+        Field dict that shares structure with the live state.
+
+        history is a frozen EventStore view (copy-on-write, no per-event
+        work); the fragment list and relationship dict hold only immutable
+        values, so a shallow copy detaches them. list() the history for a
+        plain list.
+        """
+        data = self._fields()
+        data["history"] = self.history.snapshot()
+        return data
 
     def to_json(self) -> str:
-        return json.dumps(self.snapshot())
+        data = self.snapshot()
+        data["history"] = list(data["history"])
+        return json.dumps(data)
 
     @classmethod
     def from_snapshot(cls, data: Dict):
-        return cls(**data)
+        # Own copies of the fragment list and relationship dict, so one
+        # snapshot can seed several states (history views copy themselves)
+        history = data.get("history", [])
+        plain = {k: v for k, v in data.items() if k != "history"}
+        return cls(**cls._detach(plain), history=history)
 
     def get_ending(self) -> str:
         if self.corruption_level >= 8:
@@ -77,30 +251,6 @@ class GameState:
             return "integration"
         return "undetermined"
 
-    # TEMPORARY - for existing intro_sequence.py calls
-    def apply_effect(self, effect_str: str) -> None:
-        if effect_str.startswith("stability+"):
-            try:
-                self.apply_stability(int(effect_str.split("+")[1]))
-            except (IndexError, ValueError):
-                pass
-        elif effect_str.startswith("stability-"):
-            try:
-                self.apply_stability(-int(effect_str.split("-")[1]))
-            except (IndexError, ValueError):
-                pass
-        elif effect_str.startswith("corruption+"):
-            try:
-                self.apply_corruption(int(effect_str.split("+")[1]))
-            except (IndexError, ValueError):
-                pass
-        elif effect_str.startswith("corruption-"):
-            try:
-                self.apply_corruption(-int(effect_str.split("-")[1]))
-            except (IndexError, ValueError):
-                pass
-        elif effect_str.startswith("fragment:"):
-            try:
-                self.add_fragment(effect_str.split(":", 1)[1])
-            except IndexError:
-                pass
+    # Scene effect strings ("corruption+2", "fragment:shard_001"), see engine.core.effects
+    def apply_effect(self, *effects: str) -> None:
+        apply_effects(self, *effects)
@@ -0,0 +1,154 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from engine.core.config import config
+from engine.core.logger import game_logger
+
+# Timeline tracing in Chrome Trace Event format (open the file in Perfetto
+# or chrome://tracing). Spans are recorded as complete ("X") events with
+# microsecond timestamps and the thread they ran on:
+#
+#   scene   one scene.run()            frame   one screen refresh
+#   save    SaveManager reads/writes   audio   sound decode, music load
+#   asset   ASCII art loads
+#
+# Switched on by FOTD_TRACE=1 in the environment for the whole run, or by
+# performance.trace in config.json, which is read as each span starts, so
+# config.set() or an edit picked up by the config watcher starts and stops
+# recording on the fly. The file goes to logs/trace-<stamp>.json at exit.
+# Disabled, a traced call costs a couple of attribute reads, and span()
+# hands back a shared do-nothing context manager.
+
+MAX_EVENTS = 1_000_000
+
+
+class _NoSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def _env_enabled() -> bool:
+    return os.environ.get("FOTD_TRACE", "").lower() in ("1", "true", "yes", "on")
+
+
+class Tracer:
+    def __init__(self, forced: bool = False):
+        self.forced = forced  # on regardless of config (FOTD_TRACE, enable())
+        self.path = os.path.join("logs", time.strftime("trace-%Y%m%d-%H%M%S.json"))
+        self._events: List[Dict] = []
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+        self.dropped = 0
+        self._written = 0
+        atexit.register(self.write)  # no-op if nothing was traced
+
+    @property
+    def enabled(self) -> bool:
+        return self.forced or config.settings.trace
+
+    def enable(self, path: Optional[str] = None) -> None:
+        """Trace from now on whatever config says, optionally to path."""
+        self.forced = True
+        if path:
+            self.path = path
+
+    def complete(self, name: str, cat: str, start_ns: int, end_ns: int, args: Optional[Dict] = None) -> None:
+        """Record a finished span; start/end from time.perf_counter_ns()."""
+        tid = threading.get_ident()
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (start_ns - self._origin) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            if len(self._events) >= MAX_EVENTS:
+                self.dropped += 1
+                return
+            if tid not in self._threads:
+                self._threads[tid] = threading.current_thread().name
+            self._events.append(event)
+
+    @contextmanager
+    def _span(self, name: str, cat: str, args: Optional[Dict]):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.complete(name, cat, start, time.perf_counter_ns(), args)
+
+    def span(self, name: str, cat: str, **args):
+        """with tracer.span("scene1", "scene"): ..."""
+        if not (self.forced or config.settings.trace):
+            return _NO_SPAN
+        return self._span(name, cat, args)
+
+    def write(self, path: Optional[str] = None) -> Optional[str]:
+        """Write the trace collected so far; returns the path."""
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+        if path is None:
+            if len(events) == self._written:
+                return None  # main wrote it already; nothing new for atexit
+            path = self.path
+        if not path or not events:
+            return None
+        pid = os.getpid()
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, f)
+        except OSError as e:
+            game_logger.error(f"Could not write trace {path}: {e}")
+            return None
+        self._written = len(events)
+        if self.dropped:
+            game_logger.warning(f"Trace hit {MAX_EVENTS} events; {self.dropped} dropped")
+        return path
+
+
+tracer = Tracer(_env_enabled())
+
+
+def traced(cat: str, name: Optional[str] = None):
+    """Decorator: trace every call of the function as a span."""
+
+    def wrap(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if not (tracer.forced or config.settings.trace):
+                return fn(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                tracer.complete(label, cat, start, time.perf_counter_ns())
+
+        return inner
+
+    return wrap
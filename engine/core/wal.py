@@ -0,0 +1,299 @@
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from engine.core.clock import clock
+from engine.core.logger import game_logger
+from engine.core.state_manager import mutation_hooks
+
+# Write-ahead log for progress inside a scene (saves/slot_<n>.wal, JSON lines).
+#
+#   {"scene": id, "at": {summary of the state the scene started from}}
+#   {"m": op, "a": [args]}     a GameState mutation
+#   {"b": n}                   dialogue beat n finished
+#   {"b": n, "v": value}       beat n was a choice / puzzle, with its result
+#
+# Records are buffered in memory and written + fsynced in batches by a
+# background thread, so logging a beat costs a dict and a list append on
+# the game thread. Only beats that made it into an fsync count as durable.
+# The log is deleted once the scene ends and the transition save is on disk.
+
+NOT_REPLAYING = object()
+
+
+def state_summary(game_state) -> Dict:
+    """Cheap fingerprint used to match a log to the save it started from."""
+    return {
+        "stability": game_state.stability,
+        "corruption": game_state.corruption_level,
+        "fragments": len(game_state.identity_fragments),
+        "history": len(game_state.history),
+    }
+
+
+@dataclass
+class Recovery:
+    slot: int
+    scene_id: str
+    start: Dict
+    beats: int
+    mutations: List[List] = field(default_factory=list)
+    values: Dict[int, object] = field(default_factory=dict)
+    records: List[Dict] = field(default_factory=list)
+
+    def apply_mutations(self, game_state) -> None:
+        """Fold the logged mutations onto game_state (the scene-start state)."""
+        for op, args in self.mutations:
+            method = getattr(game_state, MUTATION_METHODS[op], None)
+            if method is not None:
+                method(*args)
+
+
+MUTATION_METHODS = {
+    "stability": "apply_stability",
+    "corruption": "apply_corruption",
+    "fragment": "add_fragment",
+    "relationship": "relationship_delta",
+    "puzzle": "record_puzzle",
+    "node": "enter_node",
+    "rewind": "rewind",
+}
+
+
+class WriteAheadLog:
+    def __init__(self, saves_dir: str = "saves", sync_interval: float = 0.25, max_batch: int = 64):
+        self.saves_dir = saves_dir
+        self.sync_interval = sync_interval
+        self.max_batch = max_batch
+
+        self._lock = threading.Lock()  # buffer and file handle; held only briefly
+        self._file_lock = threading.Lock()  # writes, fsync and close
+        self._wake = threading.Event()
+        self._buffer: List[str] = []
+        self._file = None
+        self._slot: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.beat_index = 0
+        self.durable_beat = 0
+        self._buffered_beat = 0
+        self._replay: Optional[Recovery] = None
+        self._expected: Optional[Dict] = None
+        self._game_state = None
+
+    def path(self, slot: int) -> str:
+        return os.path.join(self.saves_dir, f"slot_{slot}.wal")
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    @property
+    def replaying(self) -> bool:
+        return self._file is not None and self._replay is not None and self.beat_index < self._replay.beats
+
+    # -----------------
+    # LIFECYCLE
+    # -----------------
+    def open(self, slot: int, scene_id: str, game_state) -> None:
+        """Start logging a scene. Continues the existing log when resuming it."""
+        self.close(discard=False)
+        path = self.path(slot)
+        self._slot = slot
+        self._game_state = game_state
+        self.beat_index = 0
+        self.durable_beat = 0
+        self._buffered_beat = 0
+
+        resuming = self._replay is not None and self._replay.slot == slot and self._replay.scene_id == scene_id
+        try:
+            if resuming:
+                self._file = open(path, "r+b")
+                self._file.truncate(self._replay_offset(path))
+                self._file.seek(0, os.SEEK_END)
+                self.durable_beat = self._replay.beats
+            else:
+                self._replay = None
+                self._file = open(path, "wb")
+                self._enqueue({"scene": scene_id, "at": state_summary(game_state)})
+        except OSError as e:
+            game_logger.warning(f"WAL disabled for this scene: {e}")
+            self._file = None
+            self._replay = None
+            return
+
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._sync_loop, daemon=True)
+            self._thread.start()
+
+    def close(self, discard: bool = True) -> None:
+        """Stop logging; discard deletes the log (its scene is safely saved)."""
+        if self._file is None:
+            return
+        with self._file_lock:
+            self._write_buffered()
+            with self._lock:
+                f, self._file = self._file, None
+            if f is not None:
+                f.close()
+        if discard and self._slot is not None:
+            try:
+                os.remove(self.path(self._slot))
+            except OSError:
+                pass
+        self._replay = None
+
+    def discard(self, slot: int) -> None:
+        if self._slot == slot:
+            self.close()
+        try:
+            os.remove(self.path(slot))
+        except OSError:
+            pass
+
+    # -----------------
+    # RECORDING
+    # -----------------
+    def record_mutation(self, op: str, *args) -> None:
+        if self._file is None or self.replaying:
+            return
+        self._enqueue({"m": op, "a": list(args)})
+
+    def beat(self, value=None) -> None:
+        """Mark the end of a dialogue beat; value is the result of a choice."""
+        if self._file is None:
+            return
+        self.beat_index += 1
+        record = {"b": self.beat_index}
+        if value is not None:
+            record["v"] = value
+        self._enqueue(record, beat=self.beat_index)
+
+    def replay_beat(self):
+        """
+        During a resume, consume the next beat and return its recorded value
+        (None for plain dialogue). Returns NOT_REPLAYING once caught up.
+        """
+        if not self.replaying:
+            return NOT_REPLAYING
+        self.beat_index += 1
+        value = self._replay.values.get(self.beat_index)
+        if self.beat_index >= self._replay.beats:
+            self._finish_replay()
+        return value
+
+    def _finish_replay(self) -> None:
+        game_logger.info(f"WAL resume reached beat {self.beat_index}")
+        if self._expected is not None and self._game_state is not None:
+            actual = state_summary(self._game_state)
+            if actual != self._expected:
+                game_logger.warning(f"WAL resume diverged: logged {self._expected}, replayed {actual}")
+
+    def _enqueue(self, record: Dict, beat: int = 0) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if beat:
+                self._buffered_beat = beat
+            full = len(self._buffer) >= self.max_batch
+        if full:
+            self._wake.set()
+
+    def sync(self) -> None:
+        """Write and fsync everything buffered so far."""
+        with self._file_lock:
+            self._write_buffered()
+
+    def _write_buffered(self) -> None:
+        # Caller holds _file_lock. _lock only covers taking the batch, so the
+        # game thread never waits on the fsync to log a beat.
+        with self._lock:
+            if self._file is None or not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            beat = self._buffered_beat
+            f = self._file
+        try:
+            f.write("".join(lines).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            self.durable_beat = max(self.durable_beat, beat)
+        except OSError as e:
+            game_logger.warning(f"WAL write failed: {e}")
+
+    def _sync_loop(self) -> None:
+        while True:
+            self._wake.wait(self.sync_interval)
+            self._wake.clear()
+            self.sync()
+
+    # -----------------
+    # RECOVERY
+    # -----------------
+    def recover(self, slot: int) -> Optional[Recovery]:
+        """Read a leftover log for slot, up to its last complete beat."""
+        try:
+            with open(self.path(slot), "rb") as f:
+                lines = f.read().split(b"\n")
+        except OSError:
+            return None
+
+        try:
+            head = json.loads(lines[0])
+            recovery = Recovery(slot=slot, scene_id=head["scene"], start=head["at"], beats=0)
+        except (ValueError, KeyError, IndexError):
+            return None
+
+        pending: List[List] = []
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # torn or empty tail
+            if "m" in record:
+                pending.append([record["m"], record.get("a", [])])
+            elif "b" in record:
+                recovery.mutations.extend(pending)
+                pending = []
+                recovery.beats = record["b"]
+                if "v" in record:
+                    recovery.values[record["b"]] = record["v"]
+            recovery.records.append(record)
+
+        if recovery.beats == 0:
+            return None
+        return recovery
+
+    def start_replay(self, recovery: Recovery, expected: Optional[Dict] = None) -> None:
+        """
+        Fast-forward the next open() of recovery's scene to its last beat.
+
+        expected is the state_summary() the replay should arrive at, i.e. the
+        scene-start state with recovery's mutations folded in.
+        """
+        self._replay = recovery
+        self._expected = expected
+
+    def _replay_offset(self, path: str) -> int:
+        # Byte offset just past the last durable beat record
+        offset = 0
+        last_beat_end = 0
+        with open(path, "rb") as f:
+            for line in f:
+                offset += len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if record.get("b") == self._replay.beats:
+                    last_beat_end = offset
+                    break
+        return last_beat_end
+
+
+wal = WriteAheadLog()
+mutation_hooks.append(wal.record_mutation)
+# Pauses and animations between replayed beats take no time
+clock.fast_forward = lambda: wal.replaying
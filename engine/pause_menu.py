@@ -1,20 +1,23 @@
 import curses
-import time
+
+from engine.core.clock import clock
 
 
 def show_pause_menu(stdscr, game_state, audio, current_slot, current_scene_id):
-    from engine.core.save_manager import SaveManager
-    from engine.ui.console_effects import CursesColors
+    from engine.core.save_coordinator import save_coordinator
+    from engine.ui.console_effects import shared_curses_colors
+    from engine.ui.keyboard import keyboard
+    from engine.ui.latency import latency
 
     h, w = stdscr.getmaxyx()
     audio.pause_all()
 
-    win = curses.newwin(h, w, 0, 0)
+    win = keyboard.attach(curses.newwin(h, w, 0, 0))
     win.keypad(True)
     win.nodelay(False)
     curses.curs_set(0)
 
-    curses_colors = CursesColors()
+    curses_colors = shared_curses_colors()
     COLOR_ACCENT = getattr(curses_colors, "ansi_1m36", curses.A_BOLD)
     COLOR_DIM    = getattr(curses_colors, "ansi_0m37", curses.A_NORMAL)
     COLOR_SELECT = curses.A_REVERSE | curses.A_BOLD
@@ -85,6 +88,7 @@ def show_pause_menu(stdscr, game_state, audio, current_slot, current_scene_id):
             win.attroff(COLOR_DIM | curses.A_DIM)
 
         win.refresh()
+        latency.shown()
 
     while True:
         draw()
@@ -97,6 +101,7 @@ def show_pause_menu(stdscr, game_state, audio, current_slot, current_scene_id):
 
         elif key in [curses.KEY_UP, curses.KEY_DOWN]:
             selected = (selected + (-1 if key == curses.KEY_UP else 1)) % len(options)
+            latency.changed("pause_menu")
             status_msg = ""
             confirm_quit = False
 
@@ -111,10 +116,12 @@ def show_pause_menu(stdscr, game_state, audio, current_slot, current_scene_id):
 
             elif selected == 1:  # Save & Continue
                 if game_state and current_scene_id:
-                    SaveManager.save_game(game_state, current_scene_id, slot=current_slot)
+                    save_coordinator.request_save(
+                        game_state, current_scene_id, slot=current_slot, force=True
+                    )
                     status_msg = "✓  PROGRESS SAVED"
                     draw()
-                    time.sleep(0.8)
+                    clock.sleep(0.8)
                     break
                 else:
                     status_msg = "✗  NO ACTIVE GAME"
@@ -2,4 +2,5 @@ from .console_effects import Colors, CursesColors, print_colored, print_typing,
 from .elements import ChoiceMenu, TimedPuzzle, MessageBox
 from .menu import GrubMenu, PauseMenu
 from .ui_utils import ensure_min_terminal
+from .keyboard import keyboard, KeyEvent
 from .end_screen import EndScreen
@@ -1,11 +1,15 @@
 import os
 import shutil
-import time
-import random
 import curses
 import sys
 from typing import List, Union
 from engine.core.audio import AudioManager
+from engine.core.clock import clock
+from engine.core.rng import RENDER, rng
+from engine.core.wal import wal, NOT_REPLAYING
+from engine.ui.keyboard import keyboard
+
+_render = rng.stream(RENDER)
 
 audio = AudioManager()
 
@@ -85,12 +89,16 @@ def get_colors():
 
 _curses_colors_instance = None
 
-def get_curses_color(ansi_color: str):
-    """Convert ANSI string to curses attribute."""
+def shared_curses_colors() -> CursesColors:
+    """The colour pairs don't change during a session; set them up once."""
     global _curses_colors_instance
     if _curses_colors_instance is None:
         _curses_colors_instance = CursesColors()
-    return map_ansi_to_curses(ansi_color, _curses_colors_instance)
+    return _curses_colors_instance
+
+def get_curses_color(ansi_color: str):
+    """Convert ANSI string to curses attribute."""
+    return map_ansi_to_curses(ansi_color, shared_curses_colors())
 
 def map_ansi_to_curses(ansi_color: str, curses_colors: CursesColors):
     if ansi_color is None or ansi_color == Colors.RESET:
@@ -103,8 +111,8 @@ def _glitchify(text: str, intensity: float = 0.1) -> str:
     chars = list(text)
     glitch_chars = ["#", "@", "%", "&", "$", "*", "+", "?", "▒", "░", "▓", "!", "/", "|"]
     for i, ch in enumerate(chars):
-        if not ch.isspace() and random.random() < intensity:
-            chars[i] = random.choice(glitch_chars)
+        if not ch.isspace() and _render.random() < intensity:
+            chars[i] = _render.choice(glitch_chars)
     return "".join(chars)
 
 # ---------- Printing Functions ---------- #
@@ -139,7 +147,7 @@ def print_colored(
     if stdscr is None:
         raise ValueError("Curses stdscr must be passed for printing.")
 
-    curses_colors = CursesColors()
+    curses_colors = shared_curses_colors()
     attr = map_ansi_to_curses(color, curses_colors)
 
     try:
@@ -161,6 +169,20 @@ def print_colored(
     stdscr.refresh()
 
 
+def _draw_instant(stdscr, text: str, attr, y: int = None, x: int = None, end: str = ""):
+    # Used while fast-forwarding a resumed scene: whole line, no pacing or sound
+    try:
+        if y is not None and x is not None:
+            stdscr.addstr(y, x, text, attr)
+        else:
+            stdscr.addstr(text, attr)
+        if end:
+            stdscr.addstr(end, attr)
+    except curses.error:
+        pass
+    stdscr.refresh()
+
+
 def print_typing(
     text: str,
     seconds_per_char: float = 0.05,
@@ -175,9 +197,13 @@ def print_typing(
     if stdscr is None:
         raise ValueError("Curses stdscr must be passed for printing.")
 
-    curses_colors = CursesColors()
+    curses_colors = shared_curses_colors()
     attr = map_ansi_to_curses(color, curses_colors)
 
+    if wal.replay_beat() is not NOT_REPLAYING:
+        _draw_instant(stdscr, text, attr, y, x, end)
+        return
+
     if sound:
         audio.play_sound("typing.mp3", loop=True, volume=1)
 
@@ -212,7 +238,7 @@ def print_typing(
         
         stdscr.refresh()
         if not skip:
-            time.sleep(max(0.0, seconds_per_char))
+            clock.sleep(max(0.0, seconds_per_char))
 
 
     # Reset nodelay, stop sound, and flush input buffer
@@ -220,8 +246,9 @@ def print_typing(
     if not skip and sound:
         audio.stop_sound("typing.mp3")
     
-    # NEW: Wipe the input buffer so spamming 'Enter' doesn't skip the next menu
-    curses.flushinp()
+    # Drop Enter / space presses queued while typing so spamming them doesn't
+    # skip the next menu; other keys (typed answers, arrows) are kept
+    keyboard.discard((10, 13, 32))
 
     # Add the "end" string
     if end:
@@ -231,6 +258,8 @@ def print_typing(
             pass
         stdscr.refresh()
 
+    wal.beat()
+
 
 def print_glitch(
     text: str,
@@ -257,18 +286,18 @@ def print_glitch(
         except curses.error:
             pass
 
-    curses_colors = CursesColors()
+    curses_colors = shared_curses_colors()
     attr = map_ansi_to_curses(base_color, curses_colors)
 
     scrambled = _glitchify(text, intensity=intensity)
 
     def resolve_char_attr():
-        if glitch_color and random.random() < intensity:
-            return map_ansi_to_curses(random.choice(colors), curses_colors)
+        if glitch_color and _render.random() < intensity:
+            return map_ansi_to_curses(_render.choice(colors), curses_colors)
         return attr
 
     if typing:
-        color = random.choice(colors) if (glitch_color and random.random() < intensity) else base_color
+        color = _render.choice(colors) if (glitch_color and _render.random() < intensity) else base_color
         print_typing(scrambled, 0.03, color, stdscr=stdscr, y=y, x=x, end=end, getch_func=getch_func)
     else:
         for idx, ch in enumerate(scrambled):
@@ -294,9 +323,13 @@ def echo_line(text: str, seconds_per_char: float = 0.03, color: str = Colors.BOL
     if stdscr is None:
         raise ValueError("Curses stdscr must be passed for printing.")
 
-    curses_colors = CursesColors()
+    curses_colors = shared_curses_colors()
     attr = map_ansi_to_curses(color, curses_colors)
 
+    if wal.replay_beat() is not NOT_REPLAYING:
+        _draw_instant(stdscr, text, attr, y, x, end)
+        return
+
     # Track current x position if coordinates given, else None
     current_x = x if x is not None else None
 
@@ -311,7 +344,7 @@ def echo_line(text: str, seconds_per_char: float = 0.03, color: str = Colors.BOL
 
         lower = ch.lower()
         # Get replacement char from corruption map or original char
-        char = CORRUPTION_MAP.get(lower, ch) if random.random() < intensity else ch
+        char = CORRUPTION_MAP.get(lower, ch) if _render.random() < intensity else ch
 
         # Ensure char is exactly one character
         if len(char) != 1:
@@ -329,7 +362,7 @@ def echo_line(text: str, seconds_per_char: float = 0.03, color: str = Colors.BOL
 
         stdscr.refresh()
         audio.play_sound("beep.mp3", volume=1)
-        time.sleep(max(0.0, random.uniform(0.01, seconds_per_char + 0.05)))
+        clock.sleep(max(0.0, _render.uniform(0.01, seconds_per_char + 0.05)))
 
     # Reset nodelay
     stdscr.nodelay(False)
@@ -339,6 +372,8 @@ def echo_line(text: str, seconds_per_char: float = 0.03, color: str = Colors.BOL
         stdscr.addstr(end)
         stdscr.refresh()
 
+    wal.beat()
+
 
 def print_centered(content: Union[str, List[str]], color: str = Colors.RESET, stdscr=None, offset: int = 0):
     if stdscr is None:
@@ -377,7 +412,7 @@ def full_screen_glitch(stdscr, ascii_art_blocks: list[str] | None = None, frames
     stdscr.clear()
     h, w = stdscr.getmaxyx()
 
-    curses_colors = CursesColors()
+    curses_colors = shared_curses_colors()
 
     color_attrs = [
         curses_colors.ansi_0m31, curses_colors.ansi_0m32, curses_colors.ansi_0m33,
@@ -393,7 +428,7 @@ def full_screen_glitch(stdscr, ascii_art_blocks: list[str] | None = None, frames
         stdscr.erase()
 
         # pick a random color attribute
-        color_attr = random.choice(color_attrs)
+        color_attr = _render.choice(color_attrs)
 
         # load ASCII art if it's time
         if ascii_art_blocks:
@@ -403,7 +438,7 @@ def full_screen_glitch(stdscr, ascii_art_blocks: list[str] | None = None, frames
 
         # generate glitch screen
         glitch_screen = [
-            "".join(random.choice(charset) for _ in range(w))
+            "".join(_render.choice(charset) for _ in range(w))
             for _ in range(h)
         ]
 
@@ -437,6 +472,6 @@ def full_screen_glitch(stdscr, ascii_art_blocks: list[str] | None = None, frames
                     pass
 
         stdscr.refresh()
-        time.sleep(frame_delay)
+        clock.sleep(frame_delay)
     audio.stop_music()
     clear_terminal(stdscr)
\ No newline at end of file
@@ -1,10 +1,16 @@
 import curses
-import random
-import time
 from typing import List, Union
 
 from engine.core.audio import *
-from engine.ui.console_effects import Colors, CursesColors, print_colored
+from engine.core.clock import clock
+from engine.core.rng import AUDIO, PUZZLE, RENDER, rng
+from engine.core.wal import wal, NOT_REPLAYING
+from engine.ui.console_effects import Colors, print_colored, shared_curses_colors
+from engine.ui.latency import latency
+
+_render = rng.stream(RENDER)
+_puzzle = rng.stream(PUZZLE)
+_audio = rng.stream(AUDIO)
 
 audio = AudioManager()
 
@@ -26,7 +32,7 @@ class ChoiceMenu:
         curses.curs_set(0)
         stdscr.keypad(True)
         stdscr.nodelay(False)
-        curses_colors = CursesColors()
+        curses_colors = shared_curses_colors()
 
         # Get current cursor position to avoid overlapping previous text
         curr_y, curr_x = stdscr.getyx()
@@ -41,6 +47,17 @@ class ChoiceMenu:
 
         arrow_choices = ["→ ", "» ", "▓ ", "█ ", "▒ "]
 
+        replayed = wal.replay_beat()
+        if replayed is not NOT_REPLAYING:
+            self.selected_index = replayed
+            for idx, line in enumerate(prompt_lines):
+                if curr_y + idx < max_h:
+                    stdscr.addstr(curr_y + idx, 0, line, curses_colors.ansi_1m36)
+            stdscr.addstr(menu_start_y, 0, self.choices[replayed], curses_colors.ansi_1m32)
+            stdscr.move(min(max_h - 1, menu_start_y + 1), 0)
+            stdscr.refresh()
+            return replayed
+
         while True:
             # Clear menu lines only (not the whole screen)
             for idx in range(len(self.choices)):
@@ -62,11 +79,11 @@ class ChoiceMenu:
                     if (
                         self.corruption >= 5
                         and idx == self.selected_index
-                        and random.random() < 0.2
+                        and _render.random() < 0.2
                     ):
                         # Glitchy arrow
                         glitch_arrows = ["→ ", "» ", "▓ ", "█ ", "▒ "]
-                        prefix = random.choice(glitch_arrows)
+                        prefix = _render.choice(glitch_arrows)
 
                     # Note: shuffling choices is complex to implement here without changing selection logic
                     # keeping it simple for now as per base requirement.
@@ -80,6 +97,7 @@ class ChoiceMenu:
                     stdscr.addstr(menu_start_y + idx, len(prefix), choice)
 
             stdscr.refresh()
+            latency.shown()
 
             key = getch()
             if key == -999:
@@ -87,10 +105,12 @@ class ChoiceMenu:
 
             if key == curses.KEY_UP:
                 self.selected_index = (self.selected_index - 1) % len(self.choices)
+                latency.changed("choice_menu")
             elif key == curses.KEY_DOWN:
                 self.selected_index = (self.selected_index + 1) % len(self.choices)
+                latency.changed("choice_menu")
             elif key in [10, 13]:
-                audio.play_sound(random.choice(["beep.mp3", "static.mp3"]))
+                audio.play_sound(_audio.choice(["beep.mp3", "static.mp3"]))
 
                 # Clear all choice lines
                 for idx in range(len(self.choices)):
@@ -107,11 +127,12 @@ class ChoiceMenu:
                     curses_colors.ansi_1m32,  # bold green, same as hover color
                 )
                 stdscr.refresh()
-                time.sleep(0.4)  # brief hold so the player sees their selection
+                clock.sleep(0.4)  # brief hold so the player sees their selection
 
                 # Move cursor below the confirmed choice line
                 final_y = min(max_h - 1, menu_start_y + 1)
                 stdscr.move(final_y, 0)
+                wal.beat(self.selected_index)
                 return self.selected_index
 
 
@@ -199,7 +220,7 @@ class TimedPuzzle:
         # Difficulty 1 = 20%, Difficulty 5 = 100%
         leet_prob = min(0.2 * difficulty, 1.0)
         for i in range(len(chars)):
-            if chars[i] in leetspeak and random.random() < leet_prob:
+            if chars[i] in leetspeak and _puzzle.random() < leet_prob:
                 chars[i] = leetspeak[chars[i]]
 
         # 2. Character Swaps: Number of swaps scales with difficulty
@@ -207,7 +228,7 @@ class TimedPuzzle:
         num_swaps = max(0, difficulty - 1)
         for _ in range(num_swaps):
             if len(chars) >= 2:
-                idx1, idx2 = random.sample(range(len(chars)), 2)
+                idx1, idx2 = _puzzle.sample(range(len(chars)), 2)
                 chars[idx1], chars[idx2] = chars[idx2], chars[idx1]
 
         # 3. Heavy Symbol Corruption: Probability scales with difficulty
@@ -217,14 +238,18 @@ class TimedPuzzle:
             symbol_prob = min(0.1 * (difficulty - 2), 0.5)
             symbols = ["@", "#", "$", "%", "&", "!", "?", "▓", "▒", "░", "×"]
             for i in range(len(chars)):
-                if random.random() < symbol_prob:
-                    chars[i] = random.choice(symbols)
+                if _puzzle.random() < symbol_prob:
+                    chars[i] = _puzzle.choice(symbols)
 
         return "".join(chars)
 
     def display(self, stdscr, getch_func=None) -> bool:
         from engine.ui.console_effects import clear_terminal, print_centered
 
+        replayed = wal.replay_beat()
+        if replayed is not NOT_REPLAYING:
+            return bool(replayed)
+
         # 1. Initialization and Layout Setup
         clear_terminal(stdscr)
         curses.curs_set(0)  # Hide cursor initially
@@ -276,26 +301,26 @@ class TimedPuzzle:
 
         # 3. Active Puzzle Execution
         stdscr.nodelay(True)
-        start_time = time.time()
+        start_time = clock.now()
         success = False
         current_border_color = Colors.BOLD_MAGENTA
 
         while True:
-            elapsed = time.time() - start_time
+            elapsed = clock.now() - start_time
             remaining = max(0, self.time_limit - elapsed)
 
+            # Check for Success (before the timer: keys that came in time count)
+            if self.input_text.upper() == self.target_word.upper():
+                success = True
+                current_border_color = Colors.BOLD_GREEN
+                break
+
             # Check for Timeout
             if remaining <= 0:
                 success = False
                 current_border_color = Colors.BOLD_RED
                 break
 
-            # Check for Success
-            if self.input_text.upper() == self.target_word.upper():
-                success = True
-                current_border_color = Colors.BOLD_GREEN
-                break
-
             # Draw Box using centralized logic with subtle corruption glitch
             MessageBox.draw_box(
                 stdscr,
@@ -352,21 +377,27 @@ class TimedPuzzle:
             )
 
             stdscr.refresh()
+            latency.shown()
 
-            # Input Handling
+            # Input Handling: take every key queued since the last frame
             try:
-                key = getch()
-                if key == -999:  # Quit to Menu
-                    return False
-                if key != -1 and key != 27:  # ignore ESC
-                    if key in [8, 127, curses.KEY_BACKSPACE]:
-                        self.input_text = self.input_text[:-1]
-                    elif 32 <= key <= 126:
-                        self.input_text += chr(key)
+                while True:
+                    key = getch()
+                    if key == -999:  # Quit to Menu
+                        return False
+                    if key == -1:
+                        break
+                    if key != 27:  # ignore ESC
+                        if key in [8, 127, curses.KEY_BACKSPACE]:
+                            self.input_text = self.input_text[:-1]
+                            latency.changed("puzzle")
+                        elif 32 <= key <= 126:
+                            self.input_text += chr(key)
+                            latency.changed("puzzle")
             except:
                 pass
 
-            time.sleep(0.01)
+            clock.sleep(0.01)
 
         # 4. Final Feedback Rendering
         if not success:
@@ -378,9 +409,9 @@ class TimedPuzzle:
             audio.stop_sound("glitch.mp3")
 
             # High-intensity failure glitch loop
-            fail_start = time.time()
+            fail_start = clock.now()
             audio.play_sound("fail.mp3")
-            while time.time() - fail_start < 1.0:
+            while clock.now() - fail_start < 1.0:
                 stdscr.clear()
                 MessageBox.draw_box(
                     stdscr,
@@ -396,14 +427,14 @@ class TimedPuzzle:
                 msg_lines = ["STABILIZATION", "FAILED"]
                 for i, line in enumerate(msg_lines):
                     glitch_line = "".join(
-                        random.choice("@#░▒▓$!%?&") if random.random() < 0.2 else c
+                        _render.choice("@#░▒▓$!%?&") if _render.random() < 0.2 else c
                         for c in line
                     )
                     f_x = start_x + (box_width - len(glitch_line)) // 2
                     f_y = start_y + (box_height // 2) - 1 + i
                     print_colored(
                         glitch_line,
-                        random.choice([Colors.BOLD_RED, Colors.BOLD_WHITE]),
+                        _render.choice([Colors.BOLD_RED, Colors.BOLD_WHITE]),
                         stdscr=stdscr,
                         y=f_y,
                         x=f_x,
@@ -411,7 +442,7 @@ class TimedPuzzle:
                     )
 
                 stdscr.refresh()
-                time.sleep(0.05)
+                clock.sleep(0.05)
         else:
             audio.play_sound("success.mp3")
 
@@ -430,12 +461,14 @@ class TimedPuzzle:
             f_y = mid_y - 1 + i
             print_colored(line, final_color, stdscr=stdscr, y=f_y, x=f_x, end="")
         stdscr.refresh()
+        latency.shown()  # the key that completed the word shows up as this
 
-        time.sleep(1.5)
+        clock.sleep(1.5)
 
         # Cleanup
         stdscr.nodelay(False)
         clear_terminal(stdscr)
+        wal.beat(success)
         return success
 
 
@@ -458,9 +491,9 @@ class MessageBox:
                 char_to_draw = ch
                 draw_color = color
 
-                if glitch_prob > 0 and random.random() < glitch_prob:
-                    char_to_draw = random.choice(glitch_chars)
-                    draw_color = random.choice(
+                if glitch_prob > 0 and _render.random() < glitch_prob:
+                    char_to_draw = _render.choice(glitch_chars)
+                    draw_color = _render.choice(
                         [
                             Colors.BOLD_RED,
                             Colors.BOLD_YELLOW,
@@ -490,6 +523,10 @@ class MessageBox:
         self.selected_index = 0
 
     def display(self, stdscr, duration: float = 0, getch_func=None) -> Union[None, int]:
+        replayed = wal.replay_beat()
+        if replayed is not NOT_REPLAYING:
+            return replayed
+
         getch = getch_func or stdscr.getch
         curses.curs_set(0)
         stdscr.keypad(True)
@@ -605,28 +642,33 @@ class MessageBox:
                     current_line_y += 1
 
                 stdscr.refresh()
+                latency.shown()
                 key = getch()
                 if key == -999:
                     return -999
 
                 if key == curses.KEY_UP:
                     self.selected_index = (self.selected_index - 1) % len(self.choices)
+                    latency.changed("message_box")
                 elif key == curses.KEY_DOWN:
                     self.selected_index = (self.selected_index + 1) % len(self.choices)
+                    latency.changed("message_box")
                 elif key in [10, 13]:
-                    audio.play_sound(random.choice(["beep.mp3", "static.mp3"]))
+                    audio.play_sound(_audio.choice(["beep.mp3", "static.mp3"]))
                     from engine.ui.console_effects import clear_terminal
 
                     clear_terminal(stdscr)
+                    wal.beat(self.selected_index)
                     return self.selected_index
             else:
                 # Info Mode
                 stdscr.refresh()
                 if duration:
-                    time.sleep(duration)
+                    clock.sleep(duration)
                     from engine.ui.console_effects import clear_terminal
 
                     clear_terminal(stdscr)
+                    wal.beat()
                     return None
                 else:
                     stdscr.nodelay(False)
@@ -634,4 +676,5 @@ class MessageBox:
                     from engine.ui.console_effects import clear_terminal
 
                     clear_terminal(stdscr)
+                    wal.beat()
                     return None
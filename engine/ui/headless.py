@@ -0,0 +1,137 @@
+import curses
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+# A stand-in for the curses screen, for running scenes without a terminal
+# (playthrough bot, branch simulation). It keeps a rough cursor so layout
+# code that reads getyx() behaves, records everything written, and takes
+# keys from an input source: keys(screen) -> key code. Without one it
+# answers ENTER to blocking reads and "no key" (-1) to nodelay polls, which
+# lets typing play out and confirms every prompt.
+
+ENTER = 10
+NO_KEY = -1
+
+
+def default_keys(screen: "HeadlessScreen") -> int:
+    return NO_KEY if screen.nodelay_mode else ENTER
+
+
+class HeadlessScreen:
+    def __init__(self, keys: Optional[Callable[["HeadlessScreen"], int]] = None, height: int = 40, width: int = 120):
+        self.keys = keys or default_keys
+        self.height = height
+        self.width = width
+        self.nodelay_mode = False
+        self.y = 0
+        self.x = 0
+        self.written = 0
+        self.transcript: List[str] = []
+        self.record = False
+
+    # -----------------
+    # OUTPUT
+    # -----------------
+    def _advance(self, text: str) -> None:
+        self.written += len(text)
+        if self.record:
+            self.transcript.append(text)
+        lines = text.split("\n")
+        if len(lines) > 1:
+            self.y = min(self.height - 1, self.y + len(lines) - 1)
+            self.x = len(lines[-1])
+        else:
+            self.x += len(text)
+        if self.x >= self.width:
+            self.y = min(self.height - 1, self.y + self.x // self.width)
+            self.x %= self.width
+
+    def addstr(self, *args) -> None:
+        if len(args) >= 3 and isinstance(args[0], int):
+            self.y, self.x = args[0], args[1]
+            text = args[2]
+        else:
+            text = args[0]
+        self._advance(str(text))
+
+    def addch(self, *args) -> None:
+        if len(args) >= 3 and isinstance(args[0], int):
+            self.y, self.x = args[0], args[1]
+            ch = args[2]
+        else:
+            ch = args[0]
+        self._advance(ch if isinstance(ch, str) else chr(ch))
+
+    def clear(self) -> None:
+        self.y = self.x = 0
+
+    erase = clear
+
+    def move(self, y: int, x: int) -> None:
+        self.y, self.x = y, x
+
+    def getyx(self):
+        return self.y, self.x
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    # -----------------
+    # INPUT
+    # -----------------
+    def nodelay(self, flag: bool) -> None:
+        self.nodelay_mode = bool(flag)
+
+    def getch(self) -> int:
+        return self.keys(self)
+
+    get_wch = getch
+
+    # Everything else a window does is a no-op here
+    def refresh(self) -> None:
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def _newwin(*args) -> HeadlessScreen:
+    if len(args) >= 2:
+        return HeadlessScreen(height=args[0], width=args[1])
+    return HeadlessScreen()
+
+
+_STUBS = {
+    "curs_set": lambda *args: 0,
+    "has_colors": lambda: True,
+    "start_color": lambda: None,
+    "use_default_colors": lambda: None,
+    "init_pair": lambda *args: None,
+    "color_pair": lambda n: n << 8,
+    "flushinp": lambda: None,
+    "set_escdelay": lambda *args: None,
+    "update_lines_cols": lambda: None,
+    "newwin": _newwin,
+}
+
+
+@contextmanager
+def headless_curses():
+    """Make the module-level curses calls the UI relies on work without initscr()."""
+    saved = {name: getattr(curses, name, None) for name in _STUBS}
+    saved_pairs = getattr(curses, "COLOR_PAIRS", None)
+    for name, stub in _STUBS.items():
+        setattr(curses, name, stub)
+    curses.COLOR_PAIRS = 256
+    try:
+        yield
+    finally:
+        for name, original in saved.items():
+            if original is None:
+                delattr(curses, name)
+            else:
+                setattr(curses, name, original)
+        if saved_pairs is None:
+            del curses.COLOR_PAIRS
+        else:
+            curses.COLOR_PAIRS = saved_pairs
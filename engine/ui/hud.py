@@ -0,0 +1,64 @@
+import curses
+
+from engine.core.state_manager import GameState
+from engine.ui.console_effects import Colors, map_ansi_to_curses, shared_curses_colors
+
+
+class StatusHUD:
+    """
+    One-line stability / corruption / fragment readout in the top-right corner.
+
+    Drawn once up front, then subscribes to the three fields and redraws
+    only when one of them changed since the last frame, or when the screen
+    was cleared under it (frame()); the cursor is put back where the scene
+    left it so typing carries on undisturbed.
+    """
+
+    FIELDS = ("stability", "corruption_level", "identity_fragments")
+
+    def __init__(self, stdscr, game_state: GameState):
+        self.stdscr = stdscr
+        self.values = {name: getattr(game_state, name) for name in self.FIELDS}
+        self.draw_count = 0
+        self._clears = self.clears()
+        self._unsubscribe = game_state.subscribe(self.FIELDS, self.on_change)
+        self.draw()
+
+    def clears(self) -> int:
+        # Keyboard windows count clear()/erase(); plain windows never tell
+        return getattr(self.stdscr, "clears", 0)
+
+    def frame(self) -> None:
+        """Once per frame: put the HUD back if the screen was cleared since it was drawn."""
+        if self.clears() != self._clears:
+            self.draw()
+
+    def on_change(self, changed: dict) -> None:
+        self.values.update(changed)
+        self.draw()
+
+    def text(self) -> str:
+        stability = self.values["stability"]
+        return (
+            f" STB [{'█' * stability}{'░' * (10 - stability)}]"
+            f" COR {self.values['corruption_level']:>2}"
+            f" FRG {len(self.values['identity_fragments']):>2} "
+        )
+
+    def draw(self) -> None:
+        stdscr = self.stdscr
+        text = self.text()
+        try:
+            y, x = stdscr.getyx()
+            _, w = stdscr.getmaxyx()
+            color = Colors.BOLD_RED if self.values["corruption_level"] >= 5 else Colors.BOLD_CYAN
+            stdscr.addstr(0, max(0, w - len(text) - 1), text, map_ansi_to_curses(color, shared_curses_colors()))
+            stdscr.move(y, x)
+            stdscr.refresh()
+            self.draw_count += 1
+            self._clears = self.clears()
+        except curses.error:
+            pass
+
+    def close(self) -> None:
+        self._unsubscribe()
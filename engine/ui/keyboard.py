@@ -0,0 +1,205 @@
+import curses
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, Optional
+
+from engine.core.clock import clock
+from engine.core.config import config
+from engine.core.input_log import input_log
+from engine.core.trace import tracer
+from engine.ui.latency import latency
+
+# Keyboard input. The game reads events, not the terminal: every key is
+# queued as a KeyEvent stamped with clock.now() when it was taken off the
+# terminal. curses is not thread-safe, so there is no reader thread; all
+# curses calls, keyboard included, stay on the game thread. pump() moves
+# whatever the terminal has buffered into the queue without waiting, and it
+# runs on every read and after every frame (KeyboardWindow.refresh), so keys
+# typed while the game draws or sleeps are stamped at the next frame and
+# none are lost.
+#
+# keyboard.attach(window) returns a window whose getch() pops the queue
+# (blocking, or -1 in nodelay mode like curses), so every existing getch /
+# getch_func path reads from it unchanged. Reads go through input_log,
+# which records them or answers them from a replay.
+#
+# ESC is handled here: inside `with keyboard.pausing(handler)` an ESC runs
+# handler() (the pause menu) instead of reaching the caller. If the handler
+# returns True (quit to menu), this read and every later one until the block
+# exits return QUIT, so whichever loop is waiting sees it. discard() drops
+# pending keys, optionally only some (typing skips), instead of flushinp().
+
+ESC = 27
+QUIT = -999
+NO_KEY = -1
+
+
+@dataclass(frozen=True, slots=True)
+class KeyEvent:
+    key: int
+    at: float  # clock.now() when the key was polled off the terminal
+    received: float  # time.perf_counter() then, for latency
+
+
+class Keyboard:
+    def __init__(self):
+        self._events: Deque[KeyEvent] = deque()
+        self._win = None
+        self._on_pause: Optional[Callable[[], bool]] = None
+        self._in_pause = False
+        self._quitting = False
+        self._received: Optional[float] = None
+        input_log.on_live = self.discard
+
+    # -----------------
+    # TERMINAL
+    # -----------------
+    def start(self, stdscr) -> None:
+        if self._win is not None:
+            return
+        h, w = stdscr.getmaxyx()
+        win = curses.newwin(1, 1, h - 1, w - 1)
+        win.keypad(True)
+        win.nodelay(True)
+        self._win = win
+
+    def stop(self) -> None:
+        self._win = None
+
+    def _take(self, key: int) -> None:
+        self._events.append(KeyEvent(key, clock.now(), time.perf_counter()))
+
+    def pump(self) -> None:
+        """Queue every key the terminal has buffered, without waiting."""
+        if self._win is None:
+            return
+        while True:
+            try:
+                key = self._win.getch()
+            except curses.error:
+                return
+            if key == NO_KEY:
+                return
+            self._take(key)
+
+    def _wait(self, timeout: Optional[float]) -> None:
+        # Nothing queued: block in curses until a key arrives (or timeout)
+        self._win.timeout(-1 if timeout is None else max(0, int(timeout * 1000)))
+        try:
+            key = self._win.getch()
+        except curses.error:
+            key = NO_KEY
+        finally:
+            self._win.nodelay(True)
+        if key != NO_KEY:
+            self._take(key)
+
+    # -----------------
+    # EVENTS
+    # -----------------
+    def read(self, block: bool = True, timeout: Optional[float] = None) -> Optional[KeyEvent]:
+        """Next queued event, or None if there is none (in time)."""
+        self.pump()
+        if block and self._win is not None:
+            while not self._events:
+                self._wait(timeout)
+                if timeout is not None:
+                    break
+        return self._events.popleft() if self._events else None
+
+    def discard(self, keys: Optional[Iterable[int]] = None) -> int:
+        """Drop pending events (only those for keys, if given); returns how many."""
+        keep, dropped = [], 0
+        wanted = None if keys is None else set(keys)
+        while True:
+            event = self.read(block=False)
+            if event is None:
+                break
+            if wanted is None or event.key in wanted:
+                dropped += 1
+            else:
+                keep.append(event)
+        self._events.extend(keep)
+        return dropped
+
+    def _next_key(self, block: bool) -> int:
+        event = self.read(block)
+        if event is None:
+            return NO_KEY
+        self._received = event.received
+        return event.key
+
+    def getch(self, block: bool = True) -> int:
+        """The key every read ends up with: ESC opens the pause menu, QUIT after quitting."""
+        while True:
+            if self._quitting:
+                return QUIT
+            self._received = None
+            key = input_log.read(lambda: self._next_key(block))
+            if key != NO_KEY:
+                latency.key_read(self._received)  # None for replayed keys: now
+            if key != ESC or self._on_pause is None or self._in_pause:
+                return key
+            self._in_pause = True
+            try:
+                self._quitting = bool(self._on_pause())
+            finally:
+                self._in_pause = False
+            # Resumed: carry on waiting for a game key
+
+    @contextmanager
+    def pausing(self, handler: Callable[[], bool]):
+        """Run handler() on ESC while inside the block; True from it means quit."""
+        outer = self._on_pause, self._quitting
+        self._on_pause, self._quitting = handler, False
+        try:
+            yield
+        finally:
+            self._on_pause, self._quitting = outer
+
+    def attach(self, window) -> "KeyboardWindow":
+        return KeyboardWindow(window, self)
+
+
+class KeyboardWindow:
+    """A curses window whose getch() reads from the keyboard's event queue; each refresh polls input and is traced."""
+
+    def __init__(self, window, keyboard: Keyboard):
+        self._window = window
+        self._keyboard = keyboard
+        self._nodelay = False
+        self.clears = 0  # bumped by clear()/erase(), so overlays know to redraw
+
+    def nodelay(self, flag: bool) -> None:
+        self._nodelay = bool(flag)
+        self._window.nodelay(flag)
+
+    def getch(self) -> int:
+        return self._keyboard.getch(block=not self._nodelay)
+
+    def clear(self) -> None:
+        self.clears += 1
+        self._window.clear()
+
+    def erase(self) -> None:
+        self.clears += 1
+        self._window.erase()
+
+    def refresh(self, *args):
+        # Every frame the game draws ends here; the trace's "frame" spans
+        if not (tracer.forced or config.settings.trace):
+            result = self._window.refresh(*args)
+            self._keyboard.pump()  # one frame, one input poll
+            return result
+        with tracer.span("frame", "frame"):
+            result = self._window.refresh(*args)
+        self._keyboard.pump()
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self._window, name)
+
+
+keyboard = Keyboard()
@@ -0,0 +1,100 @@
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from engine.core.logger import game_logger, perf
+
+# Keypress-to-photon latency. The keyboard stamps each key when it polls it
+# off the terminal, on a read or after a frame (perf_counter, real time
+# whatever the game clock does), so a key typed mid-frame counts from that
+# frame's end; it hands the stamp to
+# key_read(). A widget whose state that key changed (selection moved, input
+# text edited) calls changed(widget); the first refresh after it calls
+# shown(), and the time from each such key's arrival to that refresh is
+# one sample for the widget. Keys that change nothing are not sampled.
+#
+# summary() gives p50/p95/p99 per widget over the last `window` samples;
+# main logs it and writes it to logs/metrics.json at exit.
+
+METRICS_PATH = os.path.join("logs", "metrics.json")
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class InputLatency:
+    def __init__(self, window: int = 4096):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+        self._key_at: Optional[float] = None
+        self._pending: List[Tuple[str, float]] = []
+
+    def key_read(self, received: Optional[float] = None) -> None:
+        """A key was handed to the game; received is when it arrived."""
+        self._key_at = received if received is not None else time.perf_counter()
+
+    def changed(self, widget: str) -> None:
+        """The last key read changed what widget shows."""
+        if self._key_at is not None:
+            self._pending.append((widget, self._key_at))
+            self._key_at = None
+
+    def shown(self) -> None:
+        """Call right after a refresh; closes the pending samples, if any."""
+        if not self._pending:
+            return
+        now = time.perf_counter()
+        pending, self._pending = self._pending, []
+        with self._lock:
+            for widget, key_at in pending:
+                samples = self._samples.get(widget)
+                if samples is None:
+                    samples = self._samples[widget] = deque(maxlen=self.window)
+                samples.append(now - key_at)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per widget: sample count and p50/p95/p99/max in milliseconds."""
+        with self._lock:
+            snapshot = {widget: sorted(samples) for widget, samples in self._samples.items()}
+        return {
+            widget: {
+                "n": len(values),
+                "p50_ms": round(percentile(values, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(values, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+                "max_ms": round(values[-1] * 1000, 2),
+            }
+            for widget, values in sorted(snapshot.items())
+            if values
+        }
+
+    def report(self, path: str = METRICS_PATH) -> None:
+        """Log the summary and write it to the metrics file."""
+        summary = self.summary()
+        if not summary:
+            return
+        for widget, stats in summary.items():
+            game_logger.info(
+                f"Input latency {widget}: n={stats['n']} p50={stats['p50_ms']}ms"
+                f" p95={stats['p95_ms']}ms p99={stats['p99_ms']}ms"
+            )
+            perf("input_latency", widget=widget, **stats)
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"input_latency": summary}, f, indent=2)
+        except OSError as e:
+            game_logger.error(f"Could not write {path}: {e}")
+
+
+latency = InputLatency()
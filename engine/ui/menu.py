@@ -1,9 +1,12 @@
 import curses
-import time
-import random
 
 from engine.core.audio import *
-from engine.ui.console_effects import _glitchify, Colors, CursesColors
+from engine.core.clock import clock
+from engine.core.rng import RENDER, rng
+from engine.ui.console_effects import _glitchify, Colors, shared_curses_colors
+from engine.ui.latency import latency
+
+_render = rng.stream(RENDER)
 
 audio = AudioManager()
 
@@ -38,14 +41,14 @@ class GrubMenu:
 
     def _curses_loop(self, stdscr, getch_func=None):
         curses.curs_set(0)
-        curses_colors = CursesColors()
+        curses_colors = shared_curses_colors()
         stdscr.nodelay(True)
         stdscr.keypad(True)
 
         h, w = stdscr.getmaxyx()
         title_lines = self.title_lines if self.title_lines else []
 
-        last_flash_time = time.time()
+        last_flash_time = clock.now()
         flash_interval = 4  # idle time between bursts
         flash_duration = 0.01  # duration of each flash
         flash_pause = 0.05
@@ -59,14 +62,16 @@ class GrubMenu:
             
             if key == curses.KEY_UP and self.selected_index > 0:
                 self.selected_index -= 1
+                latency.changed("grub_menu")
             elif key == curses.KEY_DOWN and self.selected_index < len(self.options) - 1:
                 self.selected_index += 1
+                latency.changed("grub_menu")
             elif key in [10, 13]:  # Enter
                 audio.play_sound("beep.mp3")
                 return self.selected_index
 
             stdscr.clear()
-            current_time = time.time()
+            current_time = clock.now()
 
             # Check if we should start a new burst
             if current_time - last_flash_time >= flash_interval:
@@ -78,12 +83,12 @@ class GrubMenu:
                     for i, line in enumerate(title_lines):
                         x_start = max((w - len(line)) // 2, 0)
                         for idx, ch in enumerate(line):
-                            r = random.random()
+                            r = _render.random()
                             if r < 0.3:  # 30% chance full glitch char
-                                display_ch = random.choice("@#░▒▓ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+                                display_ch = _render.choice("@#░▒▓ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
                             else:  # 70% chance just flicker color
                                 display_ch = ch
-                            color_attr = random.choice([
+                            color_attr = _render.choice([
                                 curses_colors.ansi_0m32, curses_colors.ansi_1m32,
                                 curses_colors.ansi_0m36, curses_colors.ansi_1m36,
                                 curses_colors.ansi_0m31, curses_colors.ansi_1m31,
@@ -102,7 +107,8 @@ class GrubMenu:
                         else:
                             stdscr.addstr(menu_start_y + idx, x, arrow + option)
                     stdscr.refresh()
-                    time.sleep(flash_duration)
+                    latency.shown()
+                    clock.sleep(flash_duration)
 
                     # Reset to normal green title between flashes
                     stdscr.clear()
@@ -122,10 +128,10 @@ class GrubMenu:
                             stdscr.addstr(menu_start_y + idx, x, arrow + option)
                     stdscr.refresh()
                     if flash_idx < flashes_per_burst - 1:
-                        time.sleep(flash_pause)  # pause between flashes
+                        clock.sleep(flash_pause)  # pause between flashes
 
                 last_flash_time = current_time
-                flash_interval = random.uniform(1.0, 2.0)  # next burst
+                flash_interval = _render.uniform(1.0, 2.0)  # next burst
 
             else:
                 # Idle: draw normal green title
@@ -145,9 +151,10 @@ class GrubMenu:
                     else:
                         stdscr.addstr(menu_start_y + idx, x, arrow + option)
                 stdscr.refresh()
+                latency.shown()
             
             # small delay to prevent CPU hogging
-            time.sleep(0.01)
+            clock.sleep(0.01)
 
 
 
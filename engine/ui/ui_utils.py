@@ -1,22 +1,17 @@
 import curses
 import sys
-import time
 import os
 from typing import Tuple
 
+from engine.core.clock import clock
 from engine.ui.console_effects import Colors, clear_terminal
 from engine.ui.elements import MessageBox
+from engine.ui.keyboard import keyboard
 from engine.core.audio import AudioManager
 
 def flush_input_buffer(stdscr):
     """Flush all pending input from the buffer."""
-    stdscr.nodelay(True)
-    try:
-        while stdscr.getch() != -1:
-            pass
-    finally:
-        stdscr.nodelay(False)
-        curses.flushinp()
+    keyboard.discard()
 
 def _is_true_fullscreen_f11() -> bool:
     """
@@ -145,7 +140,7 @@ def ensure_min_terminal(stdscr, min_height=40, min_width=120, getch_func=None):
         elif ch in [ord('r'), ord('R')]:
             continue
 
-        time.sleep(0.1)
+        clock.sleep(0.1)
 
     # Calibration Successful Screen - SAFE COLOR VERSION
     stdscr.clear()
@@ -180,7 +175,7 @@ def ensure_min_terminal(stdscr, min_height=40, min_width=120, getch_func=None):
             stdscr.addstr(start_y + i, x_pos, line)
     
     stdscr.refresh()
-    time.sleep(2.0)
+    clock.sleep(2.0)
 
     stdscr.clear()
     stdscr.refresh()
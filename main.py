@@ -1,12 +1,18 @@
+import argparse
 import curses
 import os
-import time
 
 from engine.core.assets import load_ascii_art
 from engine.core.audio import AudioManager
+from engine.core.clock import clock
 from engine.core.config import config
+from engine.core.input_log import default_record_path, input_log
+from engine.core.rng import rng
+from engine.core.save_coordinator import save_coordinator
 from engine.core.save_manager import SaveManager
 from engine.core.state_manager import GameState
+from engine.core.trace import tracer
+from engine.core.wal import state_summary, wal
 from engine.ui.console_effects import (
     Colors,
     clear_terminal,
@@ -15,6 +21,9 @@ from engine.ui.console_effects import (
     print_typing,
 )
 from engine.ui.elements import ChoiceMenu, MessageBox
+from engine.ui.hud import StatusHUD
+from engine.ui.keyboard import keyboard
+from engine.ui.latency import latency
 from engine.ui.menu import GrubMenu
 from scenes.intro_sequence import (
     apex_lattice_boot,
@@ -25,6 +34,7 @@ from scenes.intro_sequence import (
     memory_load_prompt,
     onboarding,
 )
+from scenes.prefetch import prefetcher
 from scenes.registry import get_scene
 
 audio = AudioManager()
@@ -52,25 +62,53 @@ def handle_interrupt(stdscr):
     return False  # Should resume
 
 
-def getch_with_pause(stdscr, game_state, audio, current_slot, current_scene_id):
+def getch_with_pause(stdscr, game_state, audio, current_slot, current_scene_id, hud=None):
     """
-    Wrapper for stdscr.getch() that intercepts ESC to show the pause menu.
+    getch_func for scenes and the intro. ESC is caught by the keyboard while
+    inside pause_on_esc(); this only delivers a frame's state changes first.
     """
+    # One input poll is one frame: deliver batched state changes (HUD), and
+    # put the HUD back if the scene cleared the screen
+    game_state.flush_changes()
+    if hud:
+        hud.frame()
+    return stdscr.getch()
+
+
+def pause_on_esc(stdscr, game_state, audio, current_slot, current_scene_id):
+    """Show the pause menu on ESC for the duration of a with block."""
     from engine.pause_menu import show_pause_menu
 
-    while True:
-        ch = stdscr.getch()
-        if ch == 27:  # ESC key
-            stdscr.nodelay(False)
-            result = show_pause_menu(
-                stdscr, game_state, audio, current_slot, current_scene_id
-            )
-            stdscr.nodelay(True)
-            if result == -999:
-                return -999  # Signal to quit to menu
-            # If resumed, loop back to wait for a valid game key
-            continue
-        return ch
+    def pause():
+        result = show_pause_menu(stdscr, game_state, audio, current_slot, current_scene_id)
+        return result == -999  # Quit to menu
+
+    return keyboard.pausing(pause)
+
+
+def offer_resume(stdscr, slot, scene_id, game_state):
+    """Offer to fast-forward to where a crashed or quit session left the scene."""
+    recovery = wal.recover(slot)
+    if not recovery:
+        return
+    if recovery.scene_id != scene_id or recovery.start != state_summary(game_state):
+        # Log belongs to some other save of this slot
+        wal.discard(slot)
+        return
+
+    choice = MessageBox(
+        ["An interrupted session was found for this node.", "Resume where it stopped?"],
+        title="RECOVERY",
+        choices=["RESUME", "RESTART NODE"],
+        border_color=Colors.BOLD_YELLOW,
+    ).display(stdscr)
+    if choice != 0:
+        wal.discard(slot)
+        return
+
+    expected = GameState.from_snapshot(game_state.snapshot())
+    recovery.apply_mutations(expected)
+    wal.start_replay(recovery, expected=state_summary(expected))
 
 
 def run_game(stdscr):
@@ -84,7 +122,7 @@ def run_game(stdscr):
         audio.wait_for_assets()
 
     game_state = GameState()
-    time.sleep(0.5)
+    clock.sleep(0.5)
 
     # TEST Bypass
     if config.TEST:
@@ -104,7 +142,7 @@ def run_game(stdscr):
             MessageBox(
                 msg, title="ADMIN OVERRIDE", border_color=Colors.BOLD_MAGENTA
             ).display(stdscr, duration=1.0)
-            time.sleep(0.5)
+            clock.sleep(0.5)
             system_reboot(stdscr, game_state)
             return
 
@@ -121,19 +159,23 @@ def run_game(stdscr):
                 msg, title="ADMIN OVERRIDE", border_color=Colors.BOLD_MAGENTA
             ).display(stdscr, duration=1.0)
             audio.stop_music()
-            time.sleep(1)
+            clock.sleep(1)
 
             current_scene_id = str(config.TEST)
             current_slot = 1
+            save_coordinator.bind_slot(current_slot)
             while current_scene_id:
                 scene = get_scene(current_scene_id)
+                game_state.enter_node(current_scene_id)
 
                 def getch_wrapper():
                     return getch_with_pause(
                         stdscr, game_state, audio, current_slot, current_scene_id
                     )
 
-                next_scene_id = scene.run(stdscr, game_state, getch_func=getch_wrapper)
+                with pause_on_esc(stdscr, game_state, audio, current_slot, current_scene_id), \
+                        tracer.span(current_scene_id, "scene"):
+                    next_scene_id = scene.run(stdscr, game_state, getch_func=getch_wrapper)
                 if next_scene_id == -999:
                     break
                 current_scene_id = next_scene_id
@@ -145,7 +187,7 @@ def run_game(stdscr):
                 Colors.BOLD_RED,
                 stdscr=stdscr,
             )
-            time.sleep(2)
+            clock.sleep(2)
 
     current_scene_id = None
     game_state = None
@@ -156,7 +198,7 @@ def run_game(stdscr):
             # load title
             title = load_ascii_art("title.txt")
             audio.play_music("theme.mp3", loop=True, volume=0.5)
-            time.sleep(0.5)
+            clock.sleep(0.5)
 
             if title:
                 menu = GrubMenu(
@@ -180,16 +222,15 @@ def run_game(stdscr):
                 from scenes.intro_sequence import loading_bar
                 from scenes.registry import get_scene_name
 
-                saves = SaveManager.get_all_saves(6)
+                saves = SaveManager.get_slot_summaries()
                 choices = []
                 has_saves = False
                 for i, save in enumerate(saves, 1):
                     if save:
                         has_saves = True
-                        state = save["state"]
                         scene_name = get_scene_name(save["scene_id"])
                         choices.append(
-                            f"Slot {i}: {len(state.get('identity_fragments', []))} fragments [{scene_name}]"
+                            f"Slot {i}: {save['fragments']} fragments [{scene_name}]"
                         )
                     else:
                         choices.append(f"Slot {i}: [ EMPTY ]")
@@ -223,11 +264,11 @@ def run_game(stdscr):
                     glitchify=True,
                 )
                 slot_idx = slot_menu.display(stdscr)
-                if slot_idx == 6:  # Cancel
+                if slot_idx == len(saves):  # Cancel
                     clear_terminal(stdscr)
                     continue
 
-                save_data = saves[slot_idx]
+                save_data = saves[slot_idx] and SaveManager.load_game(slot=slot_idx + 1)
                 if not save_data:
                     error_msg = [
                         ("ERROR: SLOT EMPTY", Colors.BOLD_RED),
@@ -240,6 +281,7 @@ def run_game(stdscr):
                     continue
 
                 current_slot = slot_idx + 1
+                save_coordinator.bind_slot(current_slot)
 
                 audio.stop_music(fadeout_ms=1000)
 
@@ -257,18 +299,18 @@ def run_game(stdscr):
                 game_state = GameState.from_snapshot(save_data["state"])
                 current_scene_id = save_data["scene_id"]
                 scene_name = get_scene_name(current_scene_id)
+                offer_resume(stdscr, current_slot, current_scene_id, game_state)
                 break  # Start scene loop
 
             elif choice_index == 1:  # New Game
                 from scenes.intro_sequence import loading_bar
 
-                saves = SaveManager.get_all_saves(6)
+                saves = SaveManager.get_slot_summaries()
                 choices = []
                 for i, save in enumerate(saves, 1):
                     if save:
-                        state = save["state"]
                         choices.append(
-                            f"Slot {i}: {len(state.get('identity_fragments', []))} fragments [IN USE]"
+                            f"Slot {i}: {save['fragments']} fragments [IN USE]"
                         )
                     else:
                         choices.append(f"Slot {i}: [ EMPTY ]")
@@ -285,11 +327,12 @@ def run_game(stdscr):
                     glitchify=True,
                 )
                 slot_idx = slot_menu.display(stdscr)
-                if slot_idx == 6:  # Cancel
+                if slot_idx == len(saves):  # Cancel
                     clear_terminal(stdscr)
                     continue
 
                 current_slot = slot_idx + 1
+                save_coordinator.bind_slot(current_slot)
 
                 if saves[slot_idx]:
                     confirm_msg = [
@@ -310,7 +353,8 @@ def run_game(stdscr):
                     if confirm_choice == 0:  # GO BACK
                         clear_terminal(stdscr)
                         continue
-                    SaveManager.delete_save(slot=current_slot)  # Clear old data
+                    save_coordinator.delete(current_slot)  # Clear old data
+                    wal.discard(current_slot)
 
                 game_state = GameState()  # Reset local state
                 audio.stop_music(fadeout_ms=1000)
@@ -325,7 +369,7 @@ def run_game(stdscr):
                 clear_terminal(stdscr)
 
                 # Full onboarding for New Game
-                time.sleep(1)
+                clock.sleep(1)
 
                 # Global pause-aware getch for the intro sequence
                 def intro_getch():
@@ -333,11 +377,13 @@ def run_game(stdscr):
                         stdscr, game_state, audio, current_slot, "intro"
                     )
 
-                onboarding(stdscr, getch_func=intro_getch)
-                time.sleep(1)
-                initiating_sequence(stdscr, getch_func=intro_getch)
-                display_success_message(stdscr, getch_func=intro_getch)
-                memory_load_prompt(stdscr, getch_func=intro_getch)
+                with pause_on_esc(stdscr, game_state, audio, current_slot, "intro"), \
+                        tracer.span("intro", "scene"):
+                    onboarding(stdscr, getch_func=intro_getch)
+                    clock.sleep(1)
+                    initiating_sequence(stdscr, getch_func=intro_getch)
+                    display_success_message(stdscr, getch_func=intro_getch)
+                    memory_load_prompt(stdscr, getch_func=intro_getch)
 
                 corrupt_ascii = []
                 for i in range(1, 4):
@@ -345,12 +391,12 @@ def run_game(stdscr):
 
                 full_screen_glitch(stdscr, ascii_art_blocks=corrupt_ascii)
 
-                time.sleep(1.5)
+                clock.sleep(1.5)
 
                 # Add loading screen after corruption flash
                 apex_lattice_boot(stdscr)
 
-                time.sleep(2)
+                clock.sleep(2)
                 if config.TEST and config.TEST != "system_reboot":
                     # TEST mode doesn't use player name anymore
                     pass
@@ -359,6 +405,7 @@ def run_game(stdscr):
                     pass
 
                 current_scene_id = "scene1_identity_sequence"
+                game_state.enter_node(current_scene_id)
                 break  # Start scene loop
 
             elif choice_index == 2:  # Settings
@@ -406,32 +453,53 @@ def run_game(stdscr):
                 return
 
     # --- Scene Progression Loop ---
+    hud = StatusHUD(stdscr, game_state) if config.SHOW_HUD else None
     while current_scene_id:
         try:
             scene = get_scene(current_scene_id)
+            if config.WARM_NEXT_SCENE:
+                prefetcher.prefetch_after(current_scene_id)
 
             # Create a localized wrapper that has access to all required state
             # This allows scenes/elements to trigger the pause menu without knowing about SaveManager or GameState
             def getch_wrapper():
                 return getch_with_pause(
-                    stdscr, game_state, audio, current_slot, current_scene_id
+                    stdscr, game_state, audio, current_slot, current_scene_id, hud
                 )
 
             # Execute the scene and get the ID of the next one
-            next_scene_id = scene.run(stdscr, game_state, getch_func=getch_wrapper)
+            wal.open(current_slot, current_scene_id, game_state)
+            prefetcher.scene_started(current_scene_id)
+            with pause_on_esc(stdscr, game_state, audio, current_slot, current_scene_id), \
+                    tracer.span(current_scene_id, "scene"):
+                next_scene_id = scene.run(stdscr, game_state, getch_func=getch_wrapper)
 
             if next_scene_id == -999:
-                # Quit to main menu
+                # Quit to main menu; keep the WAL so Continue can resume mid-scene
+                wal.close(discard=False)
+                save_coordinator.flush()
                 current_scene_id = None
                 clear_terminal(stdscr)
                 continue  # Back to title loop
 
+            prefetcher.scene_finished(current_scene_id)
             # Update current scene ID for next iteration
             current_scene_id = next_scene_id
 
-            # Auto-save progress if we are transitioning to a new scene
+            # Auto-save progress if we are transitioning to a new scene.
+            # The next scene's own save point is coalesced with this one.
+            saved = True
             if current_scene_id:
-                SaveManager.save_game(game_state, current_scene_id, slot=current_slot)
+                game_state.enter_node(current_scene_id)
+                saved = save_coordinator.request_save(
+                    game_state, current_scene_id, slot=current_slot, force=True
+                )
+            if saved:
+                # The scene's progress is now in the slot itself
+                wal.close()
+            else:
+                # Keep the log: it is the only durable record of the scene
+                wal.close(discard=False)
 
         except KeyboardInterrupt:
             if handle_interrupt(stdscr):
@@ -443,6 +511,16 @@ def run_game(stdscr):
             break
 
     # --- Game Summary / End Phase ---
+    if hud:
+        hud.close()
+    save_coordinator.flush()
+    from engine.core.logger import game_logger, perf
+
+    game_logger.info(
+        f"Session saves: {save_coordinator.write_count} written, "
+        f"{save_coordinator.coalesced_count} coalesced"
+    )
+    perf("session_saves", written=save_coordinator.write_count, coalesced=save_coordinator.coalesced_count)
     clear_terminal(stdscr)
     from engine.ui.end_screen import EndScreen
 
@@ -450,7 +528,7 @@ def run_game(stdscr):
     summary.display(stdscr)
 
     print_centered("[ TO BE CONTINUED... ]", Colors.BOLD_MAGENTA, stdscr=stdscr)
-    time.sleep(3)
+    clock.sleep(3)
 
 
 def main_curses(stdscr):
@@ -465,7 +543,11 @@ def main_curses(stdscr):
     except:
         pass
 
-    time.sleep(1)
+    # All input comes through the keyboard's event queue from here on
+    keyboard.start(stdscr)
+    stdscr = keyboard.attach(stdscr)
+    input_log.begin(stdscr)
+    clock.sleep(1)
 
     try:
         # Start atmospheric static immediately
@@ -478,7 +560,7 @@ def main_curses(stdscr):
 
         # 1. Calibrate terminal
         ensure_min_terminal(stdscr)
-        time.sleep(1)
+        clock.sleep(1)
 
         # 1.5. Disclaimer
         if not config.SKIP_STARTUP:
@@ -508,12 +590,12 @@ def main_curses(stdscr):
                 stdscr, glitch_blocks, wait_for_key=True, justify_center=True
             )
             audio.stop_music(fadeout_ms=500)
-            time.sleep(1)
+            clock.sleep(1)
 
         # 2. Show startup screen inside curses
         if not config.SKIP_STARTUP:
             startup_screen(stdscr, 15)
-            time.sleep(2)
+            clock.sleep(2)
 
         # 3. Run the game
         run_game(stdscr)
@@ -526,12 +608,50 @@ def main_curses(stdscr):
         except:
             pass
         print(f"Lattice crashed. Check logs/fotd.log\nError: {e}")
+    finally:
+        # Every way out (EXIT after Ctrl+C, a crash, the end screen) writes
+        # saves still held back by the debounce and syncs a mid-scene WAL,
+        # which stays on disk for Continue
+        try:
+            save_coordinator.flush()
+        finally:
+            wal.close(discard=False)
+        keyboard.stop()
+        input_log.close()
+        latency.report()
+        config.flush()
+        trace_path = tracer.write()
+        if trace_path:
+            game_logger.info(f"Trace written to {trace_path}")
 
 
 if __name__ == "__main__":
-    from engine.core.logger import setup_logging
+    from engine.core.logger import console_muted, game_logger, setup_logging
+
+    parser = argparse.ArgumentParser(description="Fragments of the Lattice")
+    parser.add_argument("--seed", type=int, help="seed every RNG stream (overrides performance.seed)")
+    parser.add_argument("--record", metavar="PATH", help="record input to PATH (debug.record_input picks a path)")
+    parser.add_argument("--replay", metavar="PATH", help="play back a recorded input log")
+    parser.add_argument("--fast", action="store_true", help="replay on the instant clock")
+    args = parser.parse_args()
 
     setup_logging()
 
-    # Start the game
-    curses.wrapper(main_curses)
+    if args.seed is not None:
+        rng.reseed(args.seed)
+    if args.replay:
+        input_log.replay_from(args.replay, fast=args.fast)
+    elif args.record or config.RECORD_INPUT:
+        input_log.record_to(args.record or default_record_path())
+    if not args.replay:
+        config.watch()  # pick up edits to config.json while the game runs
+    game_logger.info(f"RNG seed {rng.seed}")
+
+    # Compile every effect string the scenes use; typos fail fast in test mode
+    from engine.core.effects import validate_scene_effects
+
+    validate_scene_effects()
+
+    # Start the game; log records stay off stderr while curses owns it
+    with console_muted():
+        curses.wrapper(main_curses)
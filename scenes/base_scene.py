@@ -1,10 +1,30 @@
 from abc import ABC, abstractmethod
-from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Tuple
+
 from engine.core.state_manager import GameState
 
+
+@dataclass(frozen=True, slots=True)
+class SceneManifest:
+    """What a scene expects to need next; read by the prefetcher."""
+    successors: Tuple[str, ...] = ()
+    sounds: Tuple[str, ...] = ()
+    ascii_art: Tuple[str, ...] = ()
+    puzzle_words: Tuple[str, ...] = ()
+
+
 class BaseScene(ABC):
-    def __init__(self):
-        self.scene_id = self.__class__.__name__.lower()
+    def __init__(self, scene_id: str = None):
+        self.scene_id = scene_id or self.__class__.__name__.lower()
+
+    @classmethod
+    def warm(cls, scene_id: str) -> None:
+        """Load whatever the scene needs ahead of run(); called off the main thread."""
+
+    @classmethod
+    def manifest(cls, scene_id: str) -> SceneManifest:
+        return SceneManifest()
 
     @abstractmethod
     def run(self, stdscr, game_state: GameState, getch_func=None) -> str:
@@ -1,12 +1,12 @@
 import curses
 import os
-import random
 import shutil
-import time
 
 from engine.core.assets import load_ascii_art
 from engine.core.audio import AudioManager
+from engine.core.clock import clock
 from engine.core.config import config
+from engine.core.rng import NARRATIVE, RENDER, rng
 from engine.core.state_manager import GameState
 from engine.ui.console_effects import (
     Colors,
@@ -18,8 +18,11 @@ from engine.ui.console_effects import (
     print_glitch,
     print_typing,
 )
+from engine.ui.keyboard import keyboard
 
 audio = AudioManager()
+_render = rng.stream(RENDER)
+_narrative = rng.stream(NARRATIVE)
 
 INITIATION_SUCCESS_MESSAGES = [
     "[INFO] Node stablised",
@@ -87,10 +90,10 @@ def loading_bar(
             f"  {''.join(bar)}", color, stdscr=stdscr, y=start_y + 1, x=start_x, end=""
         )
         stdscr.refresh()
-        time.sleep(delay)
+        clock.sleep(delay)
 
     # Optional: keep full bar visible for a moment
-    time.sleep(0.3)
+    clock.sleep(0.3)
 
 
 def glitch_ascii_animation(
@@ -222,8 +225,8 @@ def glitch_ascii_animation(
 
     reveal_order = immediate_chars[:]
     decay_order = chars[:]
-    random.shuffle(reveal_order)
-    random.shuffle(decay_order)
+    _render.shuffle(reveal_order)
+    _render.shuffle(decay_order)
 
     glitch_chars = "@#$%&*+▒░▓!/|X0"
     glitch_colors = [
@@ -255,13 +258,13 @@ def glitch_ascii_animation(
                 if char["state"] == 1:
                     x = max((w - char["line_len"]) // 2, 0) + char["c_base"]
                     try:
-                        glitch_ch = random.choice(glitch_chars)
-                        glitch_attr = get_curses_color(random.choice(glitch_colors))
+                        glitch_ch = _render.choice(glitch_chars)
+                        glitch_attr = get_curses_color(_render.choice(glitch_colors))
                         stdscr.addstr(char["r"], x, glitch_ch, glitch_attr)
                     except:
                         pass
             stdscr.refresh()
-            time.sleep(0.05)
+            clock.sleep(0.05)
 
         reveal_idx = 0
         while reveal_idx < len(immediate_chars):
@@ -276,18 +279,18 @@ def glitch_ascii_animation(
                     stdscr.addstr(char["r"], x, char["char"], char["color_attr"])
                 elif char["state"] == 1:
                     try:
-                        glitch_ch = random.choice(glitch_chars)
-                        glitch_attr = get_curses_color(random.choice(glitch_colors))
+                        glitch_ch = _render.choice(glitch_chars)
+                        glitch_attr = get_curses_color(_render.choice(glitch_colors))
                         stdscr.addstr(char["r"], x, glitch_ch, glitch_attr)
                     except:
                         pass
             stdscr.refresh()
-            time.sleep(0.04)
+            clock.sleep(0.04)
 
-    start_hold = time.time()
+    start_hold = clock.now()
     while True:
         stdscr.clear()
-        elapsed = time.time() - start_hold
+        elapsed = clock.now() - start_hold
 
         for ch in delayed_chars:
             if elapsed >= ch["delay"] and ch["state"] == 0:
@@ -303,8 +306,8 @@ def glitch_ascii_animation(
                 stdscr.addstr(char["r"], x, char["char"], char["color_attr"])
             elif char["state"] == 1:
                 try:
-                    glitch_ch = random.choice(glitch_chars)
-                    glitch_attr = get_curses_color(random.choice(glitch_colors))
+                    glitch_ch = _render.choice(glitch_chars)
+                    glitch_attr = get_curses_color(_render.choice(glitch_colors))
                     stdscr.addstr(char["r"], x, glitch_ch, glitch_attr)
                 except:
                     pass
@@ -315,7 +318,7 @@ def glitch_ascii_animation(
             all_locked = all(ch["state"] == 2 for ch in chars)
             if all_locked:
                 stdscr.nodelay(False)
-                curses.flushinp()
+                keyboard.discard()
                 while True:
                     key = getch()
                     if key == -999:
@@ -328,7 +331,7 @@ def glitch_ascii_animation(
             if elapsed >= hold_time:
                 break
 
-        time.sleep(0.05)
+        clock.sleep(0.05)
 
     decay_idx = 0
     while decay_idx < total_chars:
@@ -345,14 +348,14 @@ def glitch_ascii_animation(
                 stdscr.addstr(char["r"], x, char["char"], char["color_attr"])
             elif char["state"] == 3:
                 try:
-                    glitch_ch = random.choice(glitch_chars)
-                    glitch_attr = get_curses_color(random.choice(glitch_colors))
+                    glitch_ch = _render.choice(glitch_chars)
+                    glitch_attr = get_curses_color(_render.choice(glitch_colors))
                     stdscr.addstr(char["r"], x, glitch_ch, glitch_attr)
                 except:
                     pass
 
         stdscr.refresh()
-        time.sleep(0.04)
+        clock.sleep(0.04)
 
     decay_idx = 0
     while decay_idx < total_chars:
@@ -366,18 +369,18 @@ def glitch_ascii_animation(
             if char["state"] == 3:
                 x = max((w - char["line_len"]) // 2, 0) + char["c_base"]
                 try:
-                    glitch_ch = random.choice(glitch_chars)
-                    glitch_attr = get_curses_color(random.choice(glitch_colors))
+                    glitch_ch = _render.choice(glitch_chars)
+                    glitch_attr = get_curses_color(_render.choice(glitch_colors))
                     stdscr.addstr(char["r"], x, glitch_ch, glitch_attr)
                 except:
                     pass
 
         stdscr.refresh()
-        time.sleep(0.05)
+        clock.sleep(0.05)
 
     stdscr.clear()
     stdscr.refresh()
-    time.sleep(1)
+    clock.sleep(1)
 
 
 def logo_animation(stdscr):
@@ -401,7 +404,7 @@ def startup_screen(stdscr, duration: float = 10.0):
             h // 2, (w - len(text)) // 2, text, get_curses_color(Colors.BOLD_GREEN)
         )
         stdscr.refresh()
-        time.sleep(duration)
+        clock.sleep(duration)
         return
 
     tips = [
@@ -418,16 +421,16 @@ def startup_screen(stdscr, duration: float = 10.0):
     ]
 
     lines = ascii_text.splitlines()
-    start_time = time.time()
+    start_time = clock.now()
     last_tip_time = 0
-    tip = random.choice(tips)
+    tip = _narrative.choice(tips)
 
     while True:
-        elapsed = time.time() - start_time
+        elapsed = clock.now() - start_time
         progress = min(elapsed / duration, 1.0)
 
         if elapsed - last_tip_time > 3.0:
-            tip = random.choice(tips)
+            tip = _narrative.choice(tips)
             last_tip_time = elapsed
 
         stdscr.clear()
@@ -478,9 +481,9 @@ def startup_screen(stdscr, duration: float = 10.0):
         stdscr.refresh()
         if progress >= 1.0:
             break
-        time.sleep(0.05)
+        clock.sleep(0.05)
 
-    time.sleep(1)
+    clock.sleep(1)
     stdscr.clear()
     stdscr.refresh()
     audio.stop_music(fadeout_ms=1500)
@@ -489,30 +492,30 @@ def startup_screen(stdscr, duration: float = 10.0):
 def onboarding(stdscr, getch_func=None):
     getch = getch_func or stdscr.getch
     audio.play_music("melancholia.mp3", loop=True, volume=0.35)
-    time.sleep(1)
+    clock.sleep(1)
     print_typing("A black screen.", 0.05, Colors.BOLD_BLACK, stdscr=stdscr)
-    time.sleep(0.75)
+    clock.sleep(0.75)
     print_typing("A cursor blinks,", 0.05, Colors.BOLD_BLACK, stdscr=stdscr, end="")
-    time.sleep(0.4)
+    clock.sleep(0.4)
     print_typing(" waiting.", 0.05, Colors.BOLD_BLACK, stdscr=stdscr)
-    time.sleep(0.75)
+    clock.sleep(0.75)
     print_typing(
         "You don’t remember sitting down here.", 0.03, Colors.BOLD_BLACK, stdscr=stdscr
     )
-    time.sleep(1.5)
+    clock.sleep(1.5)
     print_typing("You don’t remember ", 0.05, Colors.BOLD_BLACK, stdscr=stdscr, end="")
     print_typing("ANYTHING", 0.05, Colors.RED, stdscr=stdscr, end="")
     print_typing(".", 0.05, Colors.BOLD_BLACK, stdscr=stdscr)
-    time.sleep(1)
+    clock.sleep(1)
     print_typing("\nThe Lattice,", 0.05, Colors.BOLD_BLACK, stdscr=stdscr, end="")
-    time.sleep(0.4)
+    clock.sleep(0.4)
     print_typing(
         " a broken archive that recalls what humanity has forgotten.",
         0.05,
         Colors.BOLD_BLACK,
         stdscr=stdscr,
     )
-    time.sleep(1)
+    clock.sleep(1)
     print_typing(
         "Its corridors bend with memory, ",
         0.05,
@@ -520,22 +523,22 @@ def onboarding(stdscr, getch_func=None):
         stdscr=stdscr,
         end="",
     )
-    time.sleep(0.4)
+    clock.sleep(0.4)
     print_typing(
         "but corruption crawls through the code. ",
         0.05,
         Colors.BOLD_BLACK,
         stdscr=stdscr,
     )
-    time.sleep(1)
+    clock.sleep(1)
     print_typing("Identities blur. ", 0.05, Colors.BOLD_BLACK, stdscr=stdscr, end="")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     print_typing("Timelines knot.", 0.05, Colors.BOLD_BLACK, stdscr=stdscr)
-    time.sleep(0.75)
+    clock.sleep(0.75)
     print_typing(
         "You are the Caretaker.", 0.05, Colors.BOLD_BLACK, stdscr=stdscr, end=""
     )
-    time.sleep(0.5)
+    clock.sleep(0.5)
     print_typing(
         " The one who should hold it together…",
         0.05,
@@ -543,9 +546,9 @@ def onboarding(stdscr, getch_func=None):
         stdscr=stdscr,
         end="",
     )
-    time.sleep(0.5)
+    clock.sleep(0.5)
     print_typing(" or what remains of them.", 0.05, Colors.RED, stdscr=stdscr)
-    time.sleep(1.5)
+    clock.sleep(1.5)
 
     print_colored(
         "\nInitiate Apex Lattice [ENTER]: ",
@@ -564,7 +567,7 @@ def onboarding(stdscr, getch_func=None):
 
     clear_terminal(stdscr)
     audio.stop_music()
-    time.sleep(1)
+    clock.sleep(1)
 
 
 def initiating_sequence(stdscr, getch_func=None):
@@ -585,14 +588,14 @@ def initiating_sequence(stdscr, getch_func=None):
         print_typing(
             "...", 0.25, Colors.CYAN, stdscr=stdscr, sound=False, getch_func=getch_func
         )
-        time.sleep(0.25)
-    time.sleep(1)
+        clock.sleep(0.25)
+    clock.sleep(1)
     for text, color in onboarding_text:
         audio.play_sound("beep.mp3")
         print_colored(text, color, stdscr=stdscr)
-        time.sleep(0.25)
+        clock.sleep(0.25)
 
-    time.sleep(1)
+    clock.sleep(1)
     print_colored("", stdscr=stdscr)
 
 
@@ -600,7 +603,7 @@ def display_success_message(stdscr, getch_func=None):
     for message in INITIATION_SUCCESS_MESSAGES:
         audio.play_sound("beep.mp3")
         print_colored(message, Colors.GREEN, stdscr=stdscr)
-        time.sleep(1)
+        clock.sleep(1)
 
 
 def memory_load_prompt(stdscr, getch_func=None):
@@ -661,7 +664,7 @@ def apex_lattice_boot(stdscr, getch_func=None) -> None:
         )
 
     stdscr.refresh()
-    time.sleep(0.3)
+    clock.sleep(0.3)
 
     # ── All log messages ──────────────────────────────────────────────
     ALL_LOGS = [
@@ -783,27 +786,27 @@ def apex_lattice_boot(stdscr, getch_func=None) -> None:
             end="",
         )
         stdscr.refresh()
-        time.sleep(step_delay)
+        clock.sleep(step_delay)
 
     # Flush remaining logs after bar completes
     while log_index < len(ALL_LOGS):
         log_buffer.append(ALL_LOGS[log_index])
         log_index += 1
         redraw_log()
-        time.sleep(0.08)
+        clock.sleep(0.08)
 
-    time.sleep(0.6)
+    clock.sleep(0.6)
     clear_terminal(stdscr)
-    time.sleep(0.2)
+    clock.sleep(0.2)
 
 
 def system_reboot(stdscr, game_state: GameState, getch_func=None) -> str:
     loading_bar(stdscr, title="SYSTEMS REBOOTING")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     clear_terminal(stdscr)
     audio.play_sound("beep.mp3")
     print_colored("[BOOT] Realigning fragments...\n", Colors.GREEN, stdscr=stdscr)
-    time.sleep(0.75)
+    clock.sleep(0.75)
 
     extra_logs = [
         [("Identity: ", Colors.BOLD_YELLOW), ("[UNRESOLVED]", Colors.BOLD_RED)],
@@ -822,10 +825,10 @@ def system_reboot(stdscr, game_state: GameState, getch_func=None) -> str:
         for text, color in segments:
             print_colored(text, color, stdscr=stdscr, end="")
             audio.play_sound("beep.mp3")
-            time.sleep(0.4)
+            clock.sleep(0.4)
         stdscr.addstr("\n")
         stdscr.refresh()
-        time.sleep(1)
+        clock.sleep(1)
 
     desc = [
         "\nYou awaken in a dim corridor of fractured light.",
@@ -839,9 +842,9 @@ def system_reboot(stdscr, game_state: GameState, getch_func=None) -> str:
             print_glitch(line, Colors.MAGENTA, 0.1, True, stdscr=stdscr)
         else:
             print_typing(line, 0.04, color=Colors.BOLD_BLACK, stdscr=stdscr)
-        time.sleep(1)
+        clock.sleep(1)
 
-    time.sleep(0.5)
+    clock.sleep(0.5)
     print_typing(
         "\nA distorted console prompt waits,",
         0.03,
@@ -850,7 +853,7 @@ def system_reboot(stdscr, game_state: GameState, getch_func=None) -> str:
         end="",
         getch_func=getch_func,
     )
-    time.sleep(0.4)
+    clock.sleep(0.4)
     print_typing(
         " cursor blinking like an eye:\n",
         0.03,
@@ -858,7 +861,7 @@ def system_reboot(stdscr, game_state: GameState, getch_func=None) -> str:
         stdscr=stdscr,
         getch_func=getch_func,
     )
-    time.sleep(0.75)
+    clock.sleep(0.75)
     audio.play_sound("beep.mp3")
     echo_line(
         "... Who... are you? ...",
@@ -866,7 +869,7 @@ def system_reboot(stdscr, game_state: GameState, getch_func=None) -> str:
         stdscr=stdscr,
         getch_func=getch_func,
     )
-    time.sleep(0.75)
+    clock.sleep(0.75)
     print_colored("\n\n> ", Colors.GREEN, stdscr=stdscr, end="")
 
     # Skip name input and use default Caretaker name
@@ -0,0 +1,103 @@
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from engine.core.assets import load_ascii_art
+from engine.core.logger import game_logger, perf
+
+from .registry import get_scene_class, next_likely_scene
+
+# While a scene runs, a single daemon worker imports its likely successors
+# (SceneManifest.successors, or the next scene in story order) and loads
+# their assets: compiled script, decoded sounds, ASCII art, puzzle UI.
+# The progression loop reports scene_finished()/scene_started() around each
+# transition; the gap between the two goes to the perf log as the transition
+# latency.
+
+
+class ScenePrefetcher:
+    def __init__(self):
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._queued = set()
+        self._ready = set()
+        self._finished_at: Optional[Tuple[str, float]] = None
+        self.transitions: List[Tuple[str, str, float, bool]] = []
+
+    def prefetch_after(self, scene_id: str) -> None:
+        """Queue the scenes likely to follow scene_id."""
+        try:
+            successors = get_scene_class(scene_id).manifest(scene_id).successors
+        except Exception as e:
+            game_logger.error(f"No manifest for {scene_id}: {e}")
+            successors = ()
+        for next_id in successors or (next_likely_scene(scene_id),):
+            if next_id:
+                self.submit(next_id)
+
+    def submit(self, scene_id: str) -> None:
+        with self._lock:
+            if scene_id in self._queued:
+                return
+            self._queued.add(scene_id)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="scene-prefetch", daemon=True)
+                self._worker.start()
+        self._queue.put(scene_id)
+
+    def is_ready(self, scene_id: str) -> bool:
+        with self._lock:
+            return scene_id in self._ready
+
+    def wait_idle(self) -> None:
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            scene_id = self._queue.get()
+            try:
+                self._load(scene_id)
+                with self._lock:
+                    self._ready.add(scene_id)
+            except Exception as e:
+                game_logger.error(f"Prefetch of {scene_id} failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _load(self, scene_id: str) -> None:
+        scene_class = get_scene_class(scene_id)
+        scene_class.warm(scene_id)
+        manifest = scene_class.manifest(scene_id)
+        if manifest.sounds:
+            from engine.core.audio import AudioManager
+
+            audio = AudioManager()
+            for name in manifest.sounds:
+                audio.load_sound(name)
+        for name in manifest.ascii_art:
+            load_ascii_art(name)
+        if manifest.puzzle_words:
+            import engine.ui.elements  # noqa: F401  TimedPuzzle
+
+    # -----------------
+    # TRANSITION LATENCY
+    # -----------------
+    def scene_finished(self, scene_id: str) -> None:
+        self._finished_at = (scene_id, time.perf_counter())
+
+    def scene_started(self, scene_id: str) -> Optional[float]:
+        """Log and return the ms since the previous scene finished, if any."""
+        if self._finished_at is None:
+            return None
+        previous, finished = self._finished_at
+        self._finished_at = None
+        latency = (time.perf_counter() - finished) * 1000
+        prefetched = self.is_ready(scene_id)
+        self.transitions.append((previous, scene_id, latency, prefetched))
+        perf("scene_transition", src=previous, dst=scene_id, ms=round(latency, 2), prefetched=prefetched)
+        return latency
+
+
+prefetcher = ScenePrefetcher()
@@ -1,23 +1,18 @@
-from .node0x1 import Scene1Corridor
-from .node0x2 import Scene2Ava
-from .node0x3 import Scene3Archive
-from .node0x4 import Scene4Elias
-from .node0x5 import Scene5Experimental
-from .node0x6 import Scene6Synch
-from .node0x7 import Scene7Lyra
-from .node0x8 import Scene8Observation
-from .node0x9 import Scene9Ending
+import importlib
 
+# Scene id -> "module:Class". Modules are imported on the first get_scene()
+# for one of their ids, so startup doesn't pay for the whole story; every
+# scene class is constructed as cls(scene_id). Dict order is story order.
 SCENE_REGISTRY = {
-    "scene1_identity_sequence": Scene1Corridor,
-    "node0x2_ava_intro": Scene2Ava,
-    "node0x3_archive": Scene3Archive,
-    "node0x4_elias": Scene4Elias,
-    "node0x5_experimental": Scene5Experimental,
-    "node0x6_synch": Scene6Synch,
-    "node0x7_lyra": Scene7Lyra,
-    "node0x8_observation": Scene8Observation,
-    "node0x9_ending": Scene9Ending
+    "scene1_identity_sequence": "scenes.scripted:ScriptedScene",
+    "node0x2_ava_intro": "scenes.scripted:ScriptedScene",
+    "node0x3_archive": "scenes.scripted:ScriptedScene",
+    "node0x4_elias": "scenes.scripted:ScriptedScene",
+    "node0x5_experimental": "scenes.scripted:ScriptedScene",
+    "node0x6_synch": "scenes.scripted:ScriptedScene",
+    "node0x7_lyra": "scenes.scripted:ScriptedScene",
+    "node0x8_observation": "scenes.scripted:ScriptedScene",
+    "node0x9_ending": "scenes.scripted:ScriptedScene",
 }
 
 SCENE_NAMES = {
@@ -32,11 +27,26 @@ SCENE_NAMES = {
     "node0x9_ending": "The Threshold",
 }
 
+_loaded = {}
+
+def get_scene_class(scene_id: str):
+    scene_class = _loaded.get(scene_id)
+    if scene_class is None:
+        path = SCENE_REGISTRY.get(scene_id)
+        if path is None:
+            raise ValueError(f"Unknown scene: {scene_id}")
+        module, _, name = path.partition(":")
+        scene_class = _loaded[scene_id] = getattr(importlib.import_module(module), name)
+    return scene_class
+
 def get_scene(scene_id: str):
-    scene_class = SCENE_REGISTRY.get(scene_id)
-    if scene_class:
-        return scene_class()
-    raise ValueError(f"Unknown scene: {scene_id}")
+    return get_scene_class(scene_id)(scene_id)
+
+def next_likely_scene(scene_id: str):
+    ids = list(SCENE_REGISTRY)
+    if scene_id not in ids:
+        return None
+    return ids[(ids.index(scene_id) + 1) % len(ids)]
 
 def get_scene_name(scene_id: str) -> str:
     return SCENE_NAMES.get(scene_id, f"Unknown Node: {scene_id}")
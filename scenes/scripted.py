@@ -0,0 +1,346 @@
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from engine.core.audio import AudioManager
+from engine.core.clock import clock
+from engine.core.effects import compile_effect
+from engine.core.save_coordinator import save_coordinator
+from engine.core.state_manager import GameState
+from engine.ui.console_effects import (
+    Colors,
+    clear_terminal,
+    echo_line,
+    print_centered,
+    print_colored,
+    print_glitch,
+    print_typing,
+)
+from engine.ui.elements import ChoiceMenu, MessageBox, TimedPuzzle
+
+from .base_scene import BaseScene, SceneManifest
+
+audio = AudioManager()
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), "scripts")
+
+# Scene scripts (scenes/scripts/<scene_id>.json):
+#
+#   {"scene": id, "defaults": {"speed": 0.04, "color": "BOLD_BLACK"},
+#    "sections": {"main": [step, ...], "<name>": [step, ...]}}
+#
+# A step is an object with one op key plus options:
+#   {"line": text, "color", "speed", "end"}       typed dialogue
+#   {"echo": text, "color", "speed", "end"}       corrupted whisper
+#   {"say": text, "color", "end"}                 instant line
+#   {"pause": seconds}   {"clear": true}
+#   {"sound": name, "loop", "volume"}   {"stop_sound": name}
+#   {"effect": "corruption+1"}                    see engine.core.effects
+#   {"banner_in": text, "color"}  {"banner_out": text, "color"}
+#   {"flood": text, "count", "delay", "color"}    scrolling repeat
+#   {"message": [lines], "title", "border"}       info box, waits for a key
+#   {"wait_enter": text, "color"}                 prompt, waits for ENTER
+#   {"choice": [options], "prompt", "then": [section or null, ...]}
+#   {"puzzle": word, "difficulty", "time_limit", "then": [on_success, on_fail]}
+#   {"call": section}   {"next": scene_id}
+#
+# Any step may also carry "wait": seconds, a pause after it. A script may
+# list extra assets to prefetch, e.g. "assets": {"ascii_art": ["logo.txt"]};
+# sounds, puzzle words and successors are read off the steps themselves.
+# choice/puzzle/call run the named section and then carry on after the
+# step; a section that reaches {"next"} ends the scene there. Sections are
+# compiled once into a flat timeline of (opcode, args) with colours,
+# effects and section names already resolved.
+
+(
+    OP_LINE, OP_ECHO, OP_SAY, OP_PAUSE, OP_CLEAR, OP_SOUND, OP_STOP_SOUND,
+    OP_EFFECT, OP_BANNER_IN, OP_BANNER_OUT, OP_FLOOD, OP_MESSAGE, OP_WAIT_ENTER,
+    OP_CHOICE, OP_PUZZLE, OP_CALL, OP_NEXT, OP_RETURN,
+) = range(18)
+
+QUIT = -999
+
+Op = Tuple[int, tuple]
+
+
+class ScriptError(ValueError):
+    pass
+
+
+class Timeline:
+    __slots__ = ("scene_id", "ops", "entry", "manifest")
+
+    def __init__(self, scene_id: str, ops: Tuple[Op, ...], entry: int, manifest: SceneManifest):
+        self.scene_id = scene_id
+        self.ops = ops
+        self.entry = entry
+        self.manifest = manifest
+
+
+# -----------------
+# COMPILER
+# -----------------
+def _color(name: Optional[str], default: str) -> str:
+    if name is None:
+        return default
+    try:
+        return getattr(Colors, name)
+    except AttributeError:
+        raise ScriptError(f"Unknown color: {name!r}") from None
+
+
+def _compile_step(step: Dict, defaults: Dict) -> Op:
+    speed = step.get("speed", defaults.get("speed", 0.04))
+    color = step.get("color", defaults.get("color"))
+    if "line" in step:
+        return OP_LINE, (step["line"], speed, _color(color, Colors.BOLD_BLACK), step.get("end", "\n"))
+    if "echo" in step:
+        return OP_ECHO, (step["echo"], speed, _color(step.get("color"), Colors.BOLD_MAGENTA), step.get("end", ""))
+    if "say" in step:
+        return OP_SAY, (step["say"], _color(step.get("color"), Colors.RESET), step.get("end", "\n"))
+    if "pause" in step:
+        return OP_PAUSE, (float(step["pause"]),)
+    if "clear" in step:
+        return OP_CLEAR, ()
+    if "sound" in step:
+        return OP_SOUND, (step["sound"], step.get("loop", False), step.get("volume", 0.7))
+    if "stop_sound" in step:
+        return OP_STOP_SOUND, (step["stop_sound"],)
+    if "effect" in step:
+        return OP_EFFECT, (compile_effect(step["effect"]),)
+    if "banner_in" in step:
+        return OP_BANNER_IN, (step["banner_in"], _color(step.get("color"), Colors.BOLD_GREEN))
+    if "banner_out" in step:
+        return OP_BANNER_OUT, (step["banner_out"], _color(step.get("color"), Colors.BOLD_BLACK))
+    if "flood" in step:
+        return OP_FLOOD, (step["flood"], step.get("count", 100), step.get("delay", 0.0), _color(step.get("color"), Colors.RED))
+    if "message" in step:
+        return OP_MESSAGE, (tuple(step["message"]), step.get("title"), _color(step.get("border"), Colors.BOLD_WHITE))
+    if "wait_enter" in step:
+        return OP_WAIT_ENTER, (step["wait_enter"], _color(step.get("color"), Colors.BOLD_RED))
+    if "choice" in step:
+        options = list(step["choice"])
+        targets = step.get("then", [None] * len(options))
+        if len(targets) != len(options):
+            raise ScriptError(f"choice has {len(options)} options but {len(targets)} targets")
+        return OP_CHOICE, (step.get("prompt"), options, targets)
+    if "puzzle" in step:
+        targets = step.get("then", [None, None])
+        return OP_PUZZLE, (step["puzzle"], step.get("difficulty", 1), step.get("time_limit", 10.0), targets)
+    if "call" in step:
+        return OP_CALL, (step["call"],)
+    if "next" in step:
+        return OP_NEXT, (step["next"],)
+    raise ScriptError(f"Unknown script step: {step!r}")
+
+
+def compile_script(script: Dict) -> Timeline:
+    """Flatten a script's sections into one timeline with resolved jumps."""
+    defaults = script.get("defaults", {})
+    sections = script["sections"]
+    if "main" not in sections:
+        raise ScriptError("script has no main section")
+
+    ops: List[Op] = []
+    starts: Dict[str, int] = {}
+    for name, steps in sections.items():
+        starts[name] = len(ops)
+        for step in steps:
+            ops.append(_compile_step(step, defaults))
+            if "wait" in step:
+                ops.append((OP_PAUSE, (float(step["wait"]),)))
+        ops.append((OP_RETURN, ()))
+
+    def resolve(target):
+        if target is None:
+            return None
+        if target not in starts:
+            raise ScriptError(f"Unknown section: {target!r}")
+        return starts[target]
+
+    for i, (code, args) in enumerate(ops):
+        if code == OP_CALL:
+            ops[i] = (code, (resolve(args[0]),))
+        elif code == OP_CHOICE:
+            ops[i] = (code, args[:2] + (tuple(resolve(t) for t in args[2]),))
+        elif code == OP_PUZZLE:
+            ops[i] = (code, args[:3] + (tuple(resolve(t) for t in args[3]),))
+
+    def unique(code):
+        return tuple(dict.fromkeys(args[0] for op, args in ops if op == code))
+
+    manifest = SceneManifest(
+        successors=unique(OP_NEXT),
+        sounds=unique(OP_SOUND),
+        ascii_art=tuple(script.get("assets", {}).get("ascii_art", ())),
+        puzzle_words=unique(OP_PUZZLE),
+    )
+    return Timeline(script["scene"], tuple(ops), starts["main"], manifest)
+
+
+@lru_cache(maxsize=None)
+def load_timeline(scene_id: str) -> Timeline:
+    path = os.path.join(SCRIPTS_DIR, f"{scene_id}.json")
+    with open(path, encoding="utf-8") as f:
+        return compile_script(json.load(f))
+
+
+def has_script(scene_id: str) -> bool:
+    return os.path.exists(os.path.join(SCRIPTS_DIR, f"{scene_id}.json"))
+
+
+# -----------------
+# INTERPRETER
+# -----------------
+def _banner_in(stdscr, getch_func, text, color):
+    for i in range(20):
+        print_glitch(
+            text,
+            base_color=color,
+            glitch_color=True,
+            stdscr=stdscr,
+            getch_func=getch_func,
+            center=True,
+            intensity=1 - (i * 0.05),
+        )
+        clock.sleep(0.05)
+    clear_terminal(stdscr)
+    print_centered(text, color=color, stdscr=stdscr, offset=-1)
+    clock.sleep(1.0)
+    clear_terminal(stdscr)
+    clock.sleep(1.0)
+
+
+def _banner_out(stdscr, text, color):
+    clear_terminal(stdscr)
+    for i in range(20):
+        clear_terminal(stdscr)
+        print_centered(text, color=color, stdscr=stdscr, offset=-1)
+        filled = int((i / 19) * 20)
+        bar = "[" + "█" * filled + "░" * (20 - filled) + "]"
+        print_centered(bar, color=color, stdscr=stdscr, offset=1)
+        clock.sleep(0.08)
+
+    # Hold resolved state
+    clear_terminal(stdscr)
+    print_centered(text, color=color, stdscr=stdscr, offset=-1)
+    print_centered("[████████████████████]", color=color, stdscr=stdscr, offset=1)
+    clock.sleep(0.8)
+    clear_terminal(stdscr)
+
+
+def _flood(stdscr, text, count, delay, color):
+    stdscr.scrollok(True)
+    for _ in range(count):
+        print_colored(text, color, stdscr=stdscr, end="")
+        clock.sleep(delay)
+    stdscr.scrollok(False)
+
+
+def _wait_enter(stdscr, getch_func, text, color):
+    print_colored("", stdscr=stdscr)
+    print_colored(text, color, stdscr=stdscr)
+    getch = getch_func or stdscr.getch
+    while True:
+        key = getch()
+        if key == QUIT:
+            return QUIT
+        if key in (10, 13):
+            return None
+
+
+class ScriptedScene(BaseScene):
+    """Runs a compiled scene script; the one code path for all scripted dialogue."""
+
+    def __init__(self, scene_id: str):
+        super().__init__(scene_id)
+        self.timeline = load_timeline(scene_id)
+
+    @classmethod
+    def warm(cls, scene_id: str) -> None:
+        load_timeline(scene_id)
+
+    @classmethod
+    def manifest(cls, scene_id: str) -> SceneManifest:
+        return load_timeline(scene_id).manifest
+
+    def run(self, stdscr, game_state: GameState, getch_func=None) -> str:
+        save_coordinator.request_save(game_state, self.timeline.scene_id)
+
+        ops = self.timeline.ops
+        pc = self.timeline.entry
+        stack: List[int] = []
+        while True:
+            code, args = ops[pc]
+            pc += 1
+
+            if code == OP_LINE:
+                text, speed, color, end = args
+                result = print_typing(text, speed, color, stdscr=stdscr, end=end, getch_func=getch_func)
+            elif code == OP_PAUSE:
+                clock.sleep(args[0])
+                continue
+            elif code == OP_ECHO:
+                text, speed, color, end = args
+                result = echo_line(text, speed, color, stdscr=stdscr, end=end, getch_func=getch_func)
+            elif code == OP_SAY:
+                text, color, end = args
+                result = print_colored(text, color, stdscr=stdscr, end=end)
+            elif code == OP_CLEAR:
+                clear_terminal(stdscr)
+                continue
+            elif code == OP_EFFECT:
+                for method, effect_args in args[0]:
+                    getattr(game_state, method)(*effect_args)
+                continue
+            elif code == OP_SOUND:
+                name, loop, volume = args
+                audio.play_sound(name, loop=loop, volume=volume)
+                continue
+            elif code == OP_STOP_SOUND:
+                audio.stop_sound(args[0])
+                continue
+            elif code == OP_BANNER_IN:
+                _banner_in(stdscr, getch_func, *args)
+                continue
+            elif code == OP_BANNER_OUT:
+                _banner_out(stdscr, *args)
+                continue
+            elif code == OP_FLOOD:
+                _flood(stdscr, *args)
+                continue
+            elif code == OP_MESSAGE:
+                lines, title, border = args
+                result = MessageBox(list(lines), title=title, border_color=border).display(stdscr, getch_func=getch_func)
+            elif code == OP_WAIT_ENTER:
+                result = _wait_enter(stdscr, getch_func, *args)
+            elif code == OP_CHOICE:
+                prompt, options, targets = args
+                result = ChoiceMenu(prompt, options, game_state.corruption_level).display(stdscr, getch_func=getch_func)
+                if result != QUIT and targets[result] is not None:
+                    stack.append(pc)
+                    pc = targets[result]
+            elif code == OP_PUZZLE:
+                word, difficulty, time_limit, targets = args
+                success = TimedPuzzle(word, difficulty=difficulty, time_limit=time_limit).display(stdscr, getch_func=getch_func)
+                game_state.record_puzzle(success)
+                target = targets[0 if success else 1]
+                if target is not None:
+                    stack.append(pc)
+                    pc = target
+                continue
+            elif code == OP_CALL:
+                stack.append(pc)
+                pc = args[0]
+                continue
+            elif code == OP_NEXT:
+                return args[0]
+            else:  # OP_RETURN
+                if not stack:
+                    return None
+                pc = stack.pop()
+                continue
+
+            if result == QUIT:
+                return QUIT
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+# The engine opens the mixer on import; tests run without a sound card
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def saves_dir(tmp_path, monkeypatch):
+    """Point the save manager at an empty directory for one test."""
+    from engine.core import save_manager
+    from engine.core.save_index import SlotIndex
+
+    monkeypatch.setattr(save_manager, "SAVES_DIR", str(tmp_path))
+    monkeypatch.setattr(save_manager, "slot_index", SlotIndex(str(tmp_path)))
+    monkeypatch.setattr(save_manager.save_journal, "_shadows", {})
+    return tmp_path
@@ -0,0 +1,77 @@
+import json
+import logging
+import os
+import threading
+
+from engine.core.config import Config, build_settings
+
+
+def test_defaults_fill_missing_sections():
+    settings = build_settings({})
+    assert settings.max_slots >= 1
+    assert settings.history_limit is None
+
+
+def test_wrong_type_falls_back_to_default(caplog):
+    with caplog.at_level(logging.WARNING, logger="fotd"):
+        settings = build_settings({"saves": {"format": "xml"}, "display": {"typing_speed": "fast"}})
+    assert settings.save_format == "json"
+    assert settings.typing_speed == 0.03
+    assert "invalid value 'xml'" in caplog.text
+
+
+def test_negative_history_limit_rejected(caplog):
+    with caplog.at_level(logging.WARNING, logger="fotd"):
+        settings = build_settings({"saves": {"history_limit": -5}})
+    assert settings.history_limit is None
+    assert "saves.history_limit: invalid value -5" in caplog.text
+
+
+def test_history_limit_kept_when_positive():
+    assert build_settings({"saves": {"history_limit": 100}}).history_limit == 100
+
+
+def write_config(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f)
+    # Make sure the edit gets a new mtime even on coarse filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_picks_up_edit(tmp_path):
+    path = str(tmp_path / "config.json")
+    write_config(path, {"display": {"typing_speed": 0.05}})
+    cfg = Config(path)
+    write_config(path, {"display": {"typing_speed": 0.01}})
+    assert cfg.poll()
+    assert cfg.TYPING_SPEED == 0.01
+
+
+def test_reload_waits_for_unsaved_changes(tmp_path):
+    path = str(tmp_path / "config.json")
+    write_config(path, {})
+    cfg = Config(path, debounce=60)
+    cfg.set("audio", "enable_music", False)
+    write_config(path, {"display": {"typing_speed": 0.01}})
+    assert not cfg.poll()
+    assert cfg.settings.enable_music is False
+    cfg.flush()
+    with open(path) as f:
+        assert json.load(f)["audio"]["enable_music"] is False
+
+
+def test_concurrent_sets_keep_every_update(tmp_path):
+    cfg = Config(str(tmp_path / "config.json"))
+    keys = [("audio", "enable_music"), ("audio", "enable_sounds"), ("display", "show_hud"), ("debug", "skip_startup")]
+
+    def flip(section, key):
+        for _ in range(200):
+            cfg.set(section, key, False, save=False)
+
+    threads = [threading.Thread(target=flip, args=pair) for pair in keys]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(cfg.data[section][key] is False for section, key in keys)
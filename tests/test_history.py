@@ -0,0 +1,86 @@
+from engine.core.history import (
+    TYPE_OTHER,
+    EventStore,
+    HistoryChunk,
+    LazyHistory,
+    decode_events,
+    encode_events,
+)
+
+
+def stat(i: int, delta: int = 1) -> dict:
+    kind = "stability" if i % 2 else "corruption"
+    return {"type": kind, "delta": delta, "old": i % 10, "new": (i + 1) % 10, "timestamp": float(i)}
+
+
+def mixed_events(n: int) -> list:
+    events = []
+    for i in range(n):
+        if i % 7 == 3:
+            events.append({"type": "fragment", "fragment_id": f"shard_{i:03d}", "timestamp": float(i)})
+        elif i % 7 == 5:
+            events.append({"type": "node", "node_id": f"node_{i}", "timestamp": float(i)})
+        elif i % 11 == 0:
+            events.append({"type": "note", "text": f"free-form {i}"})
+        else:
+            events.append(stat(i))
+    return events
+
+
+def test_store_reads_back_what_was_appended():
+    events = mixed_events(300)
+    store = EventStore(events)
+    assert list(store) == events
+    assert store[-1] == events[-1]
+    assert store[10:20] == events[10:20]
+
+
+def test_ring_buffer_keeps_the_newest_events():
+    events = mixed_events(1000)
+    store = EventStore(maxlen=50)
+    for event in events:
+        store.append(event)
+    assert len(store) == 50
+    assert store.evicted == 950
+    assert store.total == 1000
+    assert list(store) == events[-50:]
+    assert store.since(990) == events[990:]
+    assert store.since(0) == events[-50:]
+
+
+def test_ring_buffer_applies_to_loaded_history():
+    events = mixed_events(200)
+    lazy = LazyHistory(chunks=[HistoryChunk.from_events(events, compress=True)])
+    store = EventStore.from_history(lazy, maxlen=30)
+    assert list(store) == events[-30:]
+    assert store.evicted == 170
+
+
+def test_values_wider_than_int8_fall_back():
+    wide = [
+        {"type": "stability", "delta": 500, "old": -200, "new": 300, "timestamp": 1.0},
+        {"type": "relationship", "npc": "ava", "delta": 1000, "value": 1000, "timestamp": 2.0},
+        stat(3),
+    ]
+    store = EventStore(wide)
+    assert list(store) == wide
+    assert store._types[0] == TYPE_OTHER
+
+
+def test_wide_chunk_loads_through_the_per_event_path():
+    events = [stat(i, delta=200) for i in range(20)]  # fits int16 chunks, not int8 columns
+    chunk = HistoryChunk.from_events(events)
+    assert decode_events(chunk.payload()) == events
+    store = EventStore.from_history(LazyHistory(chunks=[chunk]))
+    assert list(store) == events
+
+
+def test_chunk_round_trip():
+    events = mixed_events(120)
+    for compress in (False, True):
+        chunk = HistoryChunk.from_events(events, compress)
+        packed = chunk.pack()
+        unpacked, end = HistoryChunk.unpack_from(packed, 0)
+        assert end == len(packed)
+        assert unpacked.decode() == events
+    assert decode_events(encode_events(events)) == events
@@ -0,0 +1,48 @@
+import pytest
+
+import engine.ui.hud as hud_module
+from engine.core.state_manager import GameState
+from engine.ui.hud import StatusHUD
+
+
+class FakeWindow:
+    def __init__(self):
+        self.clears = 0
+        self.drawn = []
+
+    def getyx(self):
+        return 5, 3
+
+    def getmaxyx(self):
+        return 24, 80
+
+    def addstr(self, y, x, text, attr=0):
+        self.drawn.append(text)
+
+    def move(self, y, x):
+        pass
+
+    def refresh(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_colors(monkeypatch):
+    # Colour pairs need a live terminal
+    monkeypatch.setattr(hud_module, "shared_curses_colors", lambda: None)
+
+
+def test_drawn_on_construction():
+    hud = StatusHUD(FakeWindow(), GameState())
+    assert hud.draw_count >= 1
+
+
+def test_redrawn_after_clear_only():
+    win = FakeWindow()
+    hud = StatusHUD(win, GameState())
+    drawn = hud.draw_count
+    hud.frame()
+    assert hud.draw_count == drawn
+    win.clears += 1
+    hud.frame()
+    assert hud.draw_count == drawn + 1
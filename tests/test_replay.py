@@ -0,0 +1,58 @@
+from benchmarks import playthrough
+from engine.core.input_log import input_log
+from engine.core.rng import rng
+from engine.core.state_manager import GameState
+from engine.ui.headless import HeadlessScreen
+from scenes.registry import get_scene
+
+DECISIONS = (0, 1, 1, 0, 1)
+
+
+class LoggedScreen:
+    """The screen scenes read from, with reads going through the input log."""
+
+    def __init__(self, screen):
+        self.screen = screen
+
+    def getch(self):
+        return input_log.read(self.screen.getch)
+
+    def __getattr__(self, name):
+        return getattr(self.screen, name)
+
+
+def play(screen) -> dict:
+    game_state = GameState()
+    scene_id, seen = playthrough.START_SCENE, []
+    while scene_id and scene_id != -999 and scene_id not in seen and len(seen) < 12:
+        seen.append(scene_id)
+        game_state.enter_node(scene_id)
+        scene_id = get_scene(scene_id).run(screen, game_state)
+    return game_state.snapshot()
+
+
+def replay_out_of_keys(screen):
+    raise AssertionError("replay ran out of input")
+
+
+def test_replay_reproduces_snapshot(tmp_path):
+    path = str(tmp_path / "session.fotdin")
+    with playthrough.headless_session():
+        rng.reseed(123)
+        pilot = playthrough.Autopilot(DECISIONS)
+        input_log.record_to(path)
+        with pilot.installed():
+            screen = HeadlessScreen(keys=pilot.keys)
+            input_log.begin(screen)
+            recorded = play(LoggedScreen(screen))
+        input_log.close()
+
+        rng.reseed(999)  # the replay restores the recorded seed
+        input_log.replay_from(path, fast=True)
+        screen = HeadlessScreen(keys=replay_out_of_keys)
+        input_log.begin(screen)
+        replayed = play(LoggedScreen(screen))
+        input_log.close()
+
+    assert replayed == recorded
+    assert len(recorded["history"]) > 1
@@ -0,0 +1,97 @@
+import dataclasses
+import json
+
+from engine.core import save_manager
+from engine.core.config import config
+from engine.core.save_coordinator import SaveCoordinator
+from engine.core.save_manager import SaveManager, save_journal
+from engine.core.state_manager import GameState
+
+
+def journal_mode(monkeypatch, compact_every=32):
+    monkeypatch.setattr(config, "settings", dataclasses.replace(config.settings, save_mode="journal"))
+    monkeypatch.setattr(save_journal, "compact_every", compact_every)
+
+
+def fields_of(snapshot) -> dict:
+    return dict(snapshot, history=list(snapshot["history"]))
+
+
+def journal_lines(slot):
+    with open(save_manager.journal_path(slot), "rb") as f:
+        return f.read().splitlines()
+
+
+def play(coordinator, state, steps, slot=1):
+    for i in range(steps):
+        state.apply_stability(1 if i % 2 else -1)
+        if i % 3 == 0:
+            state.add_fragment(f"shard_{i:03d}")
+        state.relationship_delta("ava", 1)
+        assert coordinator.request_save(state, f"scene_{i}", slot=slot, force=True)
+
+
+def test_journal_folds_back_into_the_state(saves_dir, monkeypatch):
+    journal_mode(monkeypatch)
+    coordinator = SaveCoordinator()
+    state = GameState()
+    play(coordinator, state, 6)
+
+    # One base write, then one appended delta per save
+    assert len(journal_lines(1)) == 1 + 5
+    data = SaveManager.load_game(1)
+    assert data["scene_id"] == "scene_5"
+    assert fields_of(data["state"]) == fields_of(state.snapshot())
+    assert SaveManager.read_header(1)["scene_id"] == "scene_5"
+
+
+def test_unchanged_state_appends_nothing(saves_dir, monkeypatch):
+    journal_mode(monkeypatch)
+    coordinator = SaveCoordinator()
+    state = GameState()
+    play(coordinator, state, 3)
+    lines = journal_lines(1)
+    assert coordinator.request_save(state, "scene_2", slot=1, force=True)
+    assert journal_lines(1) == lines
+
+
+def test_compaction_rewrites_the_base(saves_dir, monkeypatch):
+    journal_mode(monkeypatch, compact_every=3)
+    coordinator = SaveCoordinator()
+    state = GameState()
+    play(coordinator, state, 5)
+
+    head = json.loads(journal_lines(1)[0])
+    assert head["base"] == SaveManager.read_header(1)["checksum"]
+    assert len(journal_lines(1)) < 1 + 4
+    data = SaveManager.load_game(1)
+    assert fields_of(data["state"]) == fields_of(state.snapshot())
+
+
+def test_torn_tail_is_cut_off(saves_dir, monkeypatch):
+    journal_mode(monkeypatch)
+    coordinator = SaveCoordinator()
+    state = GameState()
+    play(coordinator, state, 4)
+    expected = fields_of(state.snapshot())
+    good = journal_lines(1)
+
+    with open(save_manager.journal_path(1), "ab") as f:
+        f.write(b'{"t":1,"scene_id":"half wri')  # crash mid-append
+    checksum = SaveManager.read_header(1)["checksum"]
+    assert len(save_journal.read(1, checksum)) == len(good) - 1
+    assert journal_lines(1) == good
+
+    assert fields_of(SaveManager.load_game(1)["state"]) == expected
+
+    # Later appends land right after the good records
+    play(coordinator, state, 1)
+    assert fields_of(SaveManager.load_game(1)["state"]) == fields_of(state.snapshot())
+
+
+def test_journal_for_another_base_is_ignored(saves_dir, monkeypatch):
+    journal_mode(monkeypatch)
+    coordinator = SaveCoordinator()
+    state = GameState()
+    play(coordinator, state, 3)
+    assert save_journal.read(1, "not-the-base") == []
@@ -0,0 +1,95 @@
+import dataclasses
+import json
+import os
+
+import pytest
+
+from engine.core import save_codec, save_manager
+from engine.core.config import config
+from engine.core.save_manager import SaveManager
+from engine.core.state_manager import GameState
+
+
+def played_state() -> GameState:
+    state = GameState()
+    state.enter_node("node0x1")
+    for i in range(40):
+        state.apply_stability(1 if i % 3 else -1)
+        state.apply_corruption(1 if i % 4 == 0 else 0)
+    state.add_fragment("shard_001")
+    state.relationship_delta("ava", 3)
+    state.record_puzzle(True)
+    state.apply_event({"type": "note", "text": "off-schema events survive too"})
+    return state
+
+
+def use_settings(monkeypatch, **changes):
+    monkeypatch.setattr(config, "settings", dataclasses.replace(config.settings, **changes))
+
+
+def comparable(snapshot) -> dict:
+    return dict(snapshot, history=list(snapshot["history"]))
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_codec_body_round_trip(compress):
+    snapshot = played_state().snapshot()
+    body, flags = save_codec.encode_body(snapshot, compress=compress)
+    assert bool(flags & save_codec.FLAG_ZLIB) == compress
+    assert comparable(save_codec.decode_body(body, flags)) == comparable(snapshot)
+
+
+@pytest.mark.parametrize("save_format, compress", [("json", True), ("binary", True), ("binary", False)])
+def test_slot_round_trip(saves_dir, monkeypatch, save_format, compress):
+    use_settings(monkeypatch, save_format=save_format, compress_saves=compress)
+    state = played_state()
+    assert SaveManager.save_game(state, "node0x2", slot=2)
+
+    with open(save_manager.slot_path(2), "rb") as f:
+        assert save_codec.is_binary(f.read(4)) == (save_format == "binary")
+    data = SaveManager.load_game(2)
+    assert data["scene_id"] == "node0x2"
+    assert comparable(data["state"]) == comparable(state.snapshot())
+    assert GameState.from_snapshot(data["state"]).snapshot()["history"] == state.history
+    assert SaveManager.read_header(2)["checksum"] == data["checksum"]
+
+
+@pytest.mark.parametrize("save_format", ["json", "binary"])
+def test_corrupted_body_is_rejected(saves_dir, monkeypatch, save_format):
+    use_settings(monkeypatch, save_format=save_format)
+    assert SaveManager.save_game(played_state(), "node0x2", slot=1)
+    path = save_manager.slot_path(1)
+    with open(path, "r+b") as f:
+        f.seek(-3, os.SEEK_END)
+        byte = f.read(1)
+        f.seek(-3, os.SEEK_END)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    assert SaveManager.load_game(1) is None
+
+
+def test_legacy_slot_loads(saves_dir):
+    state = played_state().snapshot()
+    state["history"] = list(state["history"])
+    legacy = {
+        "version": save_manager.LEGACY_SAVE_VERSION,
+        "timestamp": 1700000000.0,
+        "scene_id": "node0x3",
+        "state": state,
+        "checksum": 12345,
+    }
+    with open(save_manager.legacy_slot_path(3), "w") as f:
+        json.dump(legacy, f, indent=2)
+
+    data = SaveManager.load_game(3)
+    assert data["scene_id"] == "node0x3"
+    assert GameState.from_snapshot(data["state"]).stability == state["stability"]
+    assert list(GameState.from_snapshot(data["state"]).history) == state["history"]
+    assert SaveManager.get_slot_summaries()[2]["scene_id"] == "node0x3"
+
+
+def test_legacy_slot_replaced_by_new_save(saves_dir):
+    with open(save_manager.legacy_slot_path(1), "w") as f:
+        json.dump({"version": save_manager.LEGACY_SAVE_VERSION, "scene_id": "old", "state": {}}, f)
+    assert SaveManager.save_game(played_state(), "new", slot=1)
+    assert not os.path.exists(save_manager.legacy_slot_path(1))
+    assert SaveManager.load_game(1)["scene_id"] == "new"
@@ -0,0 +1,61 @@
+from engine.core.history import EventStore
+from engine.core.state_manager import GameState
+
+
+def played(steps: int) -> GameState:
+    state = GameState()
+    for i in range(steps):
+        state.apply_stability(1 if i % 2 else -1)
+    state.add_fragment("shard_001")
+    state.relationship_delta("ava", 2)
+    return state
+
+
+def test_snapshot_is_not_changed_by_later_play():
+    state = played(10)
+    snapshot = state.snapshot()
+    before = list(snapshot["history"])
+    state.apply_corruption(3)
+    state.add_fragment("shard_002")
+    state.relationship_delta("ava", 1)
+    assert list(snapshot["history"]) == before
+    assert snapshot["identity_fragments"] == ["shard_001"]
+    assert snapshot["npc_relationships"] == {"ava": 2}
+    assert len(state.history) == len(before) + 3
+
+
+def test_states_from_one_snapshot_are_independent():
+    snapshot = played(10).snapshot()
+    length = len(snapshot["history"])
+    a = GameState.from_snapshot(snapshot)
+    b = GameState.from_snapshot(snapshot)
+    a.apply_corruption(2)
+    a.add_fragment("shard_a")
+    b.apply_stability(1)
+    assert len(a.history) == length + 2
+    assert len(b.history) == length + 1
+    assert a.history[-1]["type"] == "fragment"
+    assert b.history[-1]["type"] == "stability"
+    assert "shard_a" not in b.identity_fragments
+    assert len(snapshot["history"]) == length
+
+
+def test_view_survives_ring_buffer_trim():
+    store = EventStore(maxlen=8)
+    events = [{"type": "stability", "delta": 1, "old": i % 10, "new": (i + 1) % 10, "timestamp": float(i)}
+              for i in range(200)]
+    store.extend(events[:8])
+    view = store.snapshot()
+    store.extend(events[8:])  # forces trims while the view is outstanding
+    assert list(view) == events[:8]
+    assert list(store) == events[-8:]
+
+
+def test_writing_to_a_view_copies_it():
+    store = EventStore([{"type": "puzzle", "success": True, "timestamp": 1.0}])
+    view = store.snapshot()
+    view.append({"type": "puzzle", "success": False, "timestamp": 2.0})
+    assert len(store) == 1
+    assert len(view) == 2
+    store.append({"type": "node", "node_id": "n", "timestamp": 3.0})
+    assert view[-1]["type"] == "puzzle"
@@ -0,0 +1,75 @@
+import dataclasses
+
+import pytest
+
+from engine.core.config import config
+from engine.core.state_manager import CHECKPOINT_EVERY, GameState
+
+
+def script(n: int) -> list:
+    events = []
+    for i in range(n):
+        if i % 50 == 7:
+            events.append({"type": "fragment", "fragment_id": f"shard_{i:03d}", "timestamp": float(i)})
+        elif i % 9 == 4:
+            events.append({"type": "relationship", "npc": "ava", "delta": 1, "value": i // 9, "timestamp": float(i)})
+        elif i % 13 == 0:
+            events.append({"type": "puzzle", "success": i % 2 == 0, "timestamp": float(i)})
+        else:
+            old = i % 10
+            events.append({"type": "stability", "delta": 1, "old": old, "new": (old + 1) % 10, "timestamp": float(i)})
+    return events
+
+
+def fields_of(state: GameState) -> dict:
+    snapshot = state.snapshot()
+    snapshot["history"] = list(snapshot["history"])
+    return snapshot
+
+
+N = 3 * CHECKPOINT_EVERY + 40
+BOUNDARIES = [0, 1, CHECKPOINT_EVERY - 1, CHECKPOINT_EVERY, CHECKPOINT_EVERY + 1,
+              2 * CHECKPOINT_EVERY, 3 * CHECKPOINT_EVERY + 5, N]
+
+
+@pytest.mark.parametrize("position", BOUNDARIES)
+def test_state_at_matches_a_fresh_fold(position):
+    events = script(N)
+    state = GameState.from_events(events)
+    assert fields_of(state.state_at(position)) == fields_of(GameState.from_events(events[:position]))
+
+
+def test_state_at_leaves_the_live_state_alone():
+    state = GameState.from_events(script(N))
+    before = fields_of(state)
+    state.state_at(CHECKPOINT_EVERY + 3).apply_corruption(5)
+    assert fields_of(state) == before
+
+
+def test_rewind_across_a_checkpoint_then_play_on():
+    events = script(N)
+    state = GameState.from_events(events)
+    position = CHECKPOINT_EVERY - 10
+    state.rewind(position)
+    assert fields_of(state) == fields_of(GameState.from_events(events[:position]))
+    assert state.history.total == position
+
+    more = script(N)[position:position + 2 * CHECKPOINT_EVERY]
+    for event in more:
+        state.apply_event(event)
+    expected = GameState.from_events(events[:position] + more)
+    assert fields_of(state) == fields_of(expected)
+    assert fields_of(state.state_at(position + CHECKPOINT_EVERY)) == fields_of(
+        GameState.from_events((events[:position] + more)[:position + CHECKPOINT_EVERY])
+    )
+
+
+def test_positions_outside_the_ring_buffer_are_refused(monkeypatch):
+    monkeypatch.setattr(config, "settings", dataclasses.replace(config.settings, history_limit=CHECKPOINT_EVERY))
+    state = GameState.from_events(script(N))
+    assert state.history.evicted > 0
+    with pytest.raises(ValueError):
+        state.state_at(0)
+    with pytest.raises(ValueError):
+        state.state_at(N + 1)
+    assert fields_of(state.state_at(N)) == fields_of(state)
@@ -0,0 +1,39 @@
+import json
+
+from engine.core.config import config
+from engine.core.trace import Tracer, traced, tracer
+
+
+@traced("test")
+def work():
+    return 42
+
+
+def test_config_toggles_tracing_live(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracer, "forced", False)
+    monkeypatch.setattr(tracer, "_events", [])
+    try:
+        work()
+        with tracer.span("off", "test"):
+            pass
+        assert tracer._events == []
+        config.set("performance", "trace", True, save=False)
+        assert work() == 42
+        with tracer.span("on", "test", n=1):
+            pass
+        assert [event["name"] for event in tracer._events] == ["work", "on"]
+        config.set("performance", "trace", False, save=False)
+        work()
+        assert len(tracer._events) == 2
+    finally:
+        config.set("performance", "trace", False, save=False)
+
+
+def test_write_chrome_trace(tmp_path):
+    local = Tracer(forced=True)
+    local.complete("frame", "frame", local._origin, local._origin + 2_000)
+    path = local.write(str(tmp_path / "trace.json"))
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    assert [event["ph"] for event in events] == ["M", "X"]
+    assert events[1]["dur"] == 2.0